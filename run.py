@@ -4,46 +4,157 @@ Entry point for the graph analyzer.
 Facilitates running the program from the project root.
 """
 
+import os
 import sys
-from pathlib import Path
+import time
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent))
+_INICIO = time.perf_counter()
+
+# Add src to path (os.path: pathlib alone adds ~10 ms to every cold start)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Only the loaders and the query pipeline are needed up front; the visualizer, the parallel
+# pool, the tracer and the NumPy engines are imported the first time something uses them
+from src.main import MOTORES, crear_motor, load_graph, load_weighted_graph, process_queries
+
+
+class _PerfilArranque:
+    """Elapsed time per startup phase and modules loaded in each one (--profile-startup)."""
+
+    def __init__(self):
+        self.fases = [("imports (src.main)", time.perf_counter() - _INICIO, len(sys.modules))]
+        self._t = time.perf_counter()
+        self._modulos = len(sys.modules)
+
+    def marcar(self, fase: str):
+        ahora = time.perf_counter()
+        self.fases.append((fase, ahora - self._t, len(sys.modules) - self._modulos))
+        self._t = ahora
+        self._modulos = len(sys.modules)
+
+    def reporte(self) -> str:
+        lineas = ["=" * 60, "STARTUP PROFILE", "=" * 60, f"{'phase':<32}{'ms':>10}{'modules':>10}"]
+        for fase, segundos, modulos in self.fases:
+            lineas.append(f"{fase:<32}{1000 * segundos:>10.2f}{modulos:>10}")
+        lineas.append(f"{'total':<32}{1000 * (time.perf_counter() - _INICIO):>10.2f}{len(sys.modules):>10}")
+        opcionales = [m for m in ("multiprocessing", "numpy", "src.visualizer", "src.instrumentacion") if m in sys.modules]
+        lineas.append(f"optional subsystems loaded: {', '.join(opcionales) or 'none'}")
+        return "\n".join(lineas) + "\n"
+
+
+def _reporte_motor(motor, workers: int) -> str:
+    """Engine statistics for stderr (with --workers the queries run in the workers and are not counted)."""
+    lineas = []
+    if hasattr(motor, "total_fijados"):
+        promedio = motor.total_fijados / motor.consultas if motor.consultas else 0.0
+        lineas.append(f"ALT: {promedio:.1f} vertices settled per query on average "
+                      f"({motor.total_fijados} in {motor.consultas} queries)")
+    if hasattr(motor, "reporte"):
+        r = motor.reporte()
+        lineas.append(f"CH: preprocessing {r['preproceso_seg']:.3f} s, {r['atajos']} shortcuts, "
+                      f"{r['consultas']} queries, {1000 * r['consulta_seg_promedio']:.3f} ms per query on average")
+    if workers > 1 and lineas:
+        lineas.append("  (queries answered in worker processes are not counted)")
+    return "".join(l + "\n" for l in lineas)
 
-from src.main import *
-from src.visualizer import visualize_graphs
 
 if __name__ == "__main__":
+    # Parse options
+    args = sys.argv[1:]
+    perfil = _PerfilArranque() if "--profile-startup" in args else None
+    args = [a for a in args if a != "--profile-startup"]
+    no_draw = "--no-draw" in args
+    workers = 1
+    if "--workers" in args:
+        i = args.index("--workers")
+        try:
+            workers = int(args[i + 1])
+        except (IndexError, ValueError):
+            workers = 0
+        del args[i:i + 2]
+    traza = None
+    if "--trace" in args:
+        i = args.index("--trace")
+        traza = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    draw_dir = None
+    if "--draw-dir" in args:
+        i = args.index("--draw-dir")
+        draw_dir = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    motor = None
+    if "--motor" in args:
+        i = args.index("--motor")
+        motor = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    landmarks = None
+    if "--landmarks" in args:
+        i = args.index("--landmarks")
+        landmarks = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    args = [a for a in args if a != "--no-draw"]
+
     # Validate required arguments
-    if len(sys.argv) not in [6, 7]:
-        print("Usage: python run.py <electric_file> <road_file> <water_file> <queries_file> <output_file> [--no-draw]")
+    motor_invalido = (motor is not None and motor not in MOTORES) or (landmarks is not None and motor != "alt")
+    if len(args) != 5 or workers < 1 or traza == "" or draw_dir == "" or landmarks == "" or motor_invalido:
+        print("Usage: python run.py <electric_file> <road_file> <water_file> <queries_file> <output_file> [--no-draw] [--draw-dir DIR] [--workers N] [--trace FILE] [--motor alt|ch [--landmarks FILE]] [--profile-startup]")
         print("\nExamples:")
         print("  python run.py resources/ejemplo/ejemplo_electrico.txt resources/ejemplo/ejemplo_vial.txt resources/ejemplo/ejemplo_hidrico.txt resources/ejemplo/ejemplo_consultas.txt resources/ejemplo/ejemplo_respuestas.txt")
         print("  python run.py resources/ejemplo-48/grafo_electrico_48.txt resources/ejemplo-48/grafo_vial_48.txt resources/ejemplo-48/grafo_hidrico_48.txt resources/ejemplo-48/consultas.txt resources/ejemplo-48/respuestas.txt")
         print("\nOptions:")
         print("  --no-draw    Do not generate graph visualizations")
+        print("  --draw-dir DIR  Write the .dot files to DIR (default: the output file's directory;")
+        print("               with output - graphs are only drawn if DIR is given)")
+        print("  --workers N  Run queries in N worker processes (output keeps the input order)")
+        print("  --trace FILE Write per-query timings and counters as JSON lines (- = stderr) and")
+        print("               print a summary table; queries run in a single process")
+        print("  --motor alt|ch  Answer shortest-path queries with a preprocessed engine: ALT")
+        print("               (A* with landmarks) or contraction hierarchies. Same distances; with")
+        print("               ch, ties between equally short paths may pick a different path")
+        print("               (engine statistics are printed to stderr)")
+        print("  --landmarks FILE  ALT tables: reused if they match the road graph, otherwise")
+        print("               computed and written to FILE")
+        print("  --profile-startup  Print the time spent in each startup phase to stderr")
+        print("  Use - as <queries_file> / <output_file> to read from stdin / write to stdout")
         sys.exit(1)
 
-    electric_file = sys.argv[1]
-    road_file = sys.argv[2]
-    water_file = sys.argv[3]
-    queries_file = sys.argv[4]
-    output_file = sys.argv[5]
-
-    # Check if drawing should be disabled
-    no_draw = len(sys.argv) == 7 and sys.argv[6] == "--no-draw"
+    electric_file, road_file, water_file, queries_file, output_file = args
+    if perfil:
+        perfil.marcar("argument parsing")
 
     # Load graphs
     electric_graph = load_graph(electric_file)
     road_graph = load_weighted_graph(road_file)
     water_graph = load_graph(water_file)
+    if perfil:
+        perfil.marcar("graph loading")
+
+    # Preprocess the shortest-path engine (if requested)
+    if motor is not None:
+        motor = crear_motor(road_graph, motor, landmarks)
+        if perfil:
+            perfil.marcar("engine preprocessing")
 
-    # Visualize graphs (if not disabled)
-    if not no_draw:
-        output_dir = str(Path(output_file).parent)
-        visualize_graphs(electric_graph, road_graph, water_graph, output_dir)
+    # Visualize graphs (if not disabled). With output "-" stdout carries the answers: the
+    # .dot files need an explicit --draw-dir and the visualizer's messages go to stderr
+    if not no_draw and (output_file != "-" or draw_dir):
+        from contextlib import redirect_stdout
+        from src.visualizer import visualize_graphs
+        output_dir = draw_dir or os.path.dirname(os.path.abspath(output_file))
+        with redirect_stdout(sys.stderr if output_file == "-" else sys.stdout):
+            visualize_graphs(electric_graph, road_graph, water_graph, output_dir)
+        if perfil:
+            perfil.marcar("visualization")
 
     # Process queries
-    process_queries(queries_file, output_file, electric_graph, road_graph, water_graph)
+    process_queries(queries_file, output_file, electric_graph, road_graph, water_graph, motor=motor, workers=workers, traza=traza)
+    if perfil:
+        perfil.marcar("queries")
+    if motor is not None:
+        print(_reporte_motor(motor, workers), end="", file=sys.stderr)
 
-    print(f"✓ Analysis completed. Results saved to: {output_file}")
+    # con "-" la salida va por stdout: el aviso va a stderr para no mezclarse
+    aviso = sys.stderr if output_file == "-" else sys.stdout
+    print(f"✓ Analysis completed. Results saved to: {output_file}", file=aviso)
+    if perfil:
+        print(perfil.reporte(), end="", file=sys.stderr)
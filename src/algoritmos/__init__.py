@@ -1,13 +1,24 @@
-from .traversal import BFS, DFS, ComponentesConexos
-from .short_path import Dijkstra
-from .mst import UnionFind, KruskalMST, PrimMST
-from .critical import TarjanCriticos
-from .euler import Hierholzer
+from .traversal import BFS, BFSIdx, BFSMultiorigen, DFS, ComponentesConexos
+from .short_path import Dijkstra, DijkstraIdx
+from .mst import UnionFind, UnionFindIdx, UnionFindMiembros, KruskalMST, PrimMST
+from .critical import TarjanCriticos, TarjanCriticosIdx
+from .euler import Hierholzer, HierholzerIdx
+from .derivados import DERIVADOS, derivado
+from .alt import ALT
+from .ch import ContractionHierarchies
+from .matriz import MatrizDistancias
+from .cortes import SimuladorCortes
+from .barrido import BarridoCortes
+from .conectividad import IndiceConectividad
+from .voronoi import AsignacionPlantas
 
 __all__ = [
-    "BFS", "DFS", "ComponentesConexos",
-    "Dijkstra",
-    "UnionFind", "KruskalMST", "PrimMST",
-    "TarjanCriticos",
-    "Hierholzer",
+    "BFS", "BFSIdx", "BFSMultiorigen", "DFS", "ComponentesConexos",
+    "Dijkstra", "DijkstraIdx", "ALT", "ContractionHierarchies",
+    "MatrizDistancias", "SimuladorCortes", "BarridoCortes", "IndiceConectividad",
+    "AsignacionPlantas",
+    "UnionFind", "UnionFindIdx", "UnionFindMiembros", "KruskalMST", "PrimMST",
+    "TarjanCriticos", "TarjanCriticosIdx",
+    "Hierholzer", "HierholzerIdx",
+    "DERIVADOS", "derivado",
 ]
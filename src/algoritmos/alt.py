@@ -0,0 +1,248 @@
+"""
+ALT: A* con landmarks y desigualdad triangular.
+
+Se eligen k landmarks y se precalcula la distancia desde cada uno a todos los vértices.
+Para un destino t, h(v) = max_L |d(L, v) - d(L, t)| es una cota inferior de d(v, t)
+(grafo no dirigido), lo que dirige la búsqueda hacia t. Los cortes sólo alargan caminos,
+así que las cotas siguen valiendo con 'banned'.
+
+Las tablas se pueden guardar junto al snapshot del grafo (p. ej. vial.grafo + vial.alt);
+el header lleva una huella del CSR (offsets, targets y pesos) para no reabrirlas sobre otro grafo.
+"""
+
+from __future__ import annotations
+import hashlib
+import heapq
+import mmap
+import struct
+import sys
+import time
+import zlib
+from array import array
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from ..grafo.grafo_csr import GrafoCSR
+from . import contadores
+from .short_path import DijkstraIdx, _holgura
+
+MAGIC = b"TPALT\x00\x00\x00"
+VERSION = 2
+_HEADER = struct.Struct("<8sIIqq8sI")     # magic, versión, k, n, nnz, huella del grafo, crc
+
+
+def _huella(g: GrafoCSR) -> bytes:
+    """Hash de 8 bytes de offsets, targets y pesos (en little-endian)."""
+    h = hashlib.blake2b(digest_size=8)
+    for codigo, datos in (("q", g.offsets), ("q", g.targets), ("d", g.weights)):
+        datos = array(codigo, datos)
+        if sys.byteorder != "little":
+            datos.byteswap()
+        h.update(datos)
+    return h.digest()
+
+
+class ALT:
+    def __init__(self, g, k: int = 8, landmarks: Optional[Sequence[int]] = None):
+        """
+        Preprocesa g (se congela a CSR): elige k landmarks por "el más lejano"
+        (salvo que se pasen explícitos) y calcula sus tablas de distancias.
+        """
+        self.g: GrafoCSR = GrafoCSR.from_grafo(g)
+        self.fijados = 0            # vértices fijados por la última consulta
+        self.total_fijados = 0
+        self.consultas = 0
+        t0 = time.perf_counter()
+        self.landmarks: List[int] = []
+        self.tablas: List[Sequence[float]] = []
+        if landmarks is not None:
+            for L in landmarks:
+                self._agregar_landmark(L)
+        else:
+            self._elegir_landmarks(k)
+        self.preproceso_seg = time.perf_counter() - t0
+
+    # ---------- preproceso ----------
+    def _agregar_landmark(self, L: int):
+        dist, _ = DijkstraIdx.compute(self.g, L)
+        self.landmarks.append(L)
+        self.tablas.append(dist)
+
+    def _elegir_landmarks(self, k: int):
+        n = self.g.vertex_count
+        if n == 0 or k <= 0:
+            return
+        INF = float("inf")
+        # arranque determinista: el más lejano al primer vértice alfabético
+        _, por_rank = self.g.rangos()
+        inicio, _ = DijkstraIdx.compute(self.g, por_rank[0])
+        cercania = array("d", [INF]) * n    # distancia al landmark más cercano
+        candidato = max(range(n), key=lambda v: (inicio[v] if inicio[v] < INF else -1.0, -v))
+        while len(self.landmarks) < min(k, n):
+            self._agregar_landmark(candidato)
+            tabla = self.tablas[-1]
+            for v in range(n):
+                if tabla[v] < cercania[v]:
+                    cercania[v] = tabla[v]
+            # el siguiente: el más alejado de todos los elegidos (INF = componente sin landmark)
+            candidato = max(range(n), key=lambda v: (cercania[v], -v))
+            if cercania[candidato] == 0.0:
+                break
+
+    # ---------- consultas ----------
+    def _cota(self, v: int, hasta_t: List[float]) -> float:
+        h = 0.0
+        for tabla, dt in zip(self.tablas, hasta_t):
+            dv = tabla[v]
+            if dv == float("inf") or dt == float("inf"):
+                if dv != dt:
+                    return float("inf")     # distinta componente: inalcanzable
+                continue
+            c = dv - dt if dv > dt else dt - dv
+            if c > h:
+                h = c
+        return h
+
+    def compute(self, s: int, t: int, banned: Optional[Iterable[int]] = None) -> Tuple[array, array]:
+        """
+        A* de s a t con cotas de landmarks. Mismo contrato que DijkstraIdx.compute para t:
+        dist[t] y DijkstraIdx.path(parent, t) coinciden exactamente (desempate por nombre).
+        Deja en self.fijados cuántos vértices se fijaron.
+        """
+        g = self.g
+        n = g.vertex_count
+        INF = float("inf")
+        dist = array("d", [INF]) * n
+        parent = array("q", [-1]) * n
+        bloqueado = bytearray(n)
+        for b in banned or ():
+            bloqueado[b] = 1
+        self.fijados = 0
+        self.consultas += 1
+        if bloqueado[s] or bloqueado[t]:
+            return dist, parent
+
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        hasta_t = [tabla[t] for tabla in self.tablas]
+        h = array("d", [-1.0]) * n
+        h[s] = self._cota(s, hasta_t)
+        dist[s] = 0.0
+        pq = [(h[s], s)]
+        fijados = 0
+        push = 1
+        relajadas = 0
+        D = INF
+
+        # Se sigue hasta que el tope supera D: así quedan fijados todos los vértices
+        # de todos los caminos mínimos y el desempate se puede reconstruir exacto.
+        while pq:
+            f, u = heapq.heappop(pq)
+            if f > _holgura(D):
+                break
+            if f != dist[u] + h[u]:
+                continue
+            fijados += 1
+            if u == t:
+                D = dist[t]
+                continue
+            d = dist[u]
+            fila = range(offsets[u], offsets[u + 1])
+            relajadas += len(fila)
+            for k in fila:
+                v = targets[k]
+                if bloqueado[v]:
+                    continue
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    if h[v] < 0.0:
+                        h[v] = self._cota(v, hasta_t)
+                    if h[v] == INF:
+                        continue
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd + h[v], v))
+                    push += 1
+
+        self.fijados = fijados
+        self.total_fijados += fijados
+        if contadores.ACTIVO:
+            contadores.sumar(fijados, relajadas, push, push - len(pq))
+        if D == INF:
+            return dist, parent
+        self._reconstruir(s, t, dist, parent, bloqueado)
+        return dist, parent
+
+    def camino(self, s: int, t: int, banned: Optional[Iterable[int]] = None) -> Tuple[float, List[int]]:
+        """(distancia, camino de índices) de s a t; (inf, []) si no hay camino."""
+        dist, parent = self.compute(s, t, banned)
+        return dist[t], DijkstraIdx.path(parent, t)
+
+    def _reconstruir(self, s: int, t: int, dist: array, parent: array, bloqueado: bytearray):
+        """
+        parent del camino s→t como lo dejaría Dijkstra: entre los predecesores u con
+        dist[u] + w == dist[v] gana el de menor (dist[u], nombre).
+        """
+        g = self.g
+        rank, _ = g.rangos()
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        parent[s] = s
+        v = t
+        while v != s:
+            mejor = -1
+            for k in range(offsets[v], offsets[v + 1]):
+                u = targets[k]
+                if bloqueado[u] or dist[u] + weights[k] != dist[v]:
+                    continue
+                if mejor == -1 or (dist[u], rank[u]) < (dist[mejor], rank[mejor]):
+                    mejor = u
+            parent[v] = mejor
+            v = mejor
+
+    # ---------- persistencia ----------
+    def guardar(self, path: str) -> str:
+        """Escribe landmarks y tablas (float64) con header (huella del grafo) y CRC32."""
+        n = self.g.vertex_count
+        cuerpo = array("q", self.landmarks).tobytes() if self.landmarks else b""
+        datos = array("d")
+        for tabla in self.tablas:
+            datos.extend(tabla)
+        if sys.byteorder != "little":
+            lm = array("q", self.landmarks); lm.byteswap(); cuerpo = lm.tobytes()
+            datos.byteswap()
+        cuerpo += datos.tobytes()
+        header = _HEADER.pack(MAGIC, VERSION, len(self.landmarks), n, len(self.g.targets),
+                              _huella(self.g), zlib.crc32(cuerpo))
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(cuerpo)
+        return path
+
+    @classmethod
+    def cargar(cls, g, path: str) -> "ALT":
+        """Reabre tablas guardadas con guardar() (vía mmap) para el mismo grafo g."""
+        alt = cls.__new__(cls)
+        alt.g = GrafoCSR.from_grafo(g)
+        alt.fijados = alt.total_fijados = alt.consultas = 0
+        alt.preproceso_seg = 0.0
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(mm) < _HEADER.size:
+            raise ValueError("tablas ALT truncadas: falta el header")
+        magic, version, k, n, nnz, huella, crc = _HEADER.unpack_from(mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("no es un archivo de tablas ALT soportado")
+        if n != alt.g.vertex_count or nnz != len(alt.g.targets) or huella != _huella(alt.g):
+            raise ValueError("las tablas ALT corresponden a otro grafo")
+        fin = _HEADER.size + 8 * k + 8 * k * n
+        if len(mm) < fin:
+            raise ValueError("tablas ALT truncadas")
+        vista = memoryview(mm)[_HEADER.size:fin]
+        if zlib.crc32(vista) != crc:
+            raise ValueError("tablas ALT corruptas: no coincide el checksum")
+        if sys.byteorder == "little":
+            alt.landmarks = list(vista[:8 * k].cast("q"))
+            datos = vista[8 * k:].cast("d")
+        else:
+            lm = array("q", bytes(vista[:8 * k])); lm.byteswap()
+            alt.landmarks = list(lm)
+            datos = array("d", bytes(vista[8 * k:])); datos.byteswap()
+        alt.tablas = [datos[i * n:(i + 1) * n] for i in range(k)]
+        return alt
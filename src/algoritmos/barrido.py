@@ -0,0 +1,74 @@
+"""
+Barrido de escenarios de corte: muchos conjuntos de barrios cortados contra los mismos pares
+origen-destino, informando la demora de cada par respecto del grafo sin cortes.
+
+El preproceso se comparte: los árboles sin cortes de cada origen se calculan una sola vez
+(SimuladorCortes) y los workers los heredan por fork, sin serializarlos.
+"""
+
+from __future__ import annotations
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from ..grafo.grafo_csr import GrafoCSR
+from .cortes import SimuladorCortes
+
+# barrido compartido con los workers (se hereda por fork)
+_BARRIDO_WORKER = None
+
+
+def _fila_worker(args) -> List[float]:
+    escenario, pares = args
+    return _BARRIDO_WORKER.fila(escenario, pares)
+
+
+class BarridoCortes:
+    # por debajo de esto no vale la pena levantar procesos
+    POOL_MIN_ESCENARIOS = 8
+
+    def __init__(self, g):
+        self.g: GrafoCSR = GrafoCSR.from_grafo(g)
+        self.simulador = SimuladorCortes(self.g, max_origenes=0)    # sin límite: uno por origen
+
+    def base(self, pares: Sequence[Tuple[int, int]]) -> List[float]:
+        """Distancias sin cortes de cada par (arma de paso el árbol de cada origen)."""
+        return [self.simulador._arbol(s)[0][t] for s, t in pares]
+
+    def fila(self, escenario: Sequence[int], pares: Sequence[Tuple[int, int]]) -> List[float]:
+        """Distancias de cada par con 'escenario' cortado."""
+        return [self.simulador.camino(s, t, escenario)[0] for s, t in pares]
+
+    def demoras(
+        self,
+        escenarios: Sequence[Sequence[int]],
+        pares: Sequence[Tuple[int, int]],
+        procesos: Optional[int] = None,
+    ) -> Tuple[List[float], List[List[float]]]:
+        """
+        (base, tabla): base[j] es la distancia sin cortes del par j y tabla[i][j] la demora
+        del par j con el escenario i cortado (inf si queda sin ruta, 0.0 si ya no la tenía).
+        Con procesos > 1 los escenarios se reparten en un pool de procesos (fork).
+        """
+        global _BARRIDO_WORKER
+        base = self.base(pares)
+        procesos = procesos or os.cpu_count() or 1
+        usar_pool = procesos > 1 and len(escenarios) >= BarridoCortes.POOL_MIN_ESCENARIOS
+        if usar_pool:
+            import multiprocessing      # sólo con pool: fuera del arranque
+            usar_pool = "fork" in multiprocessing.get_all_start_methods()
+        trabajos = [(list(e), pares) for e in escenarios]
+        if usar_pool:
+            _BARRIDO_WORKER = self
+            try:
+                with multiprocessing.get_context("fork").Pool(procesos) as pool:
+                    filas = pool.map(_fila_worker, trabajos, chunksize=max(1, len(trabajos) // (procesos * 4)))
+            finally:
+                _BARRIDO_WORKER = None
+        else:
+            filas = [self.fila(e, p) for e, p in trabajos]
+
+        tabla = [
+            [0.0 if d == b else d - b for d, b in zip(fila, base)]
+            for fila in filas
+        ]
+        return base, tabla
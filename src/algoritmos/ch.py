@@ -0,0 +1,262 @@
+"""
+Contraction Hierarchies para muchas consultas de camino mínimo sobre un grafo vial fijo.
+
+Preproceso: se contraen los vértices de a uno en orden de importancia (diferencia de aristas
++ vecinos ya contraídos, con actualización perezosa). Al contraer v, para cada par de vecinos
+u, x sin un camino "testigo" más corto que u-v-x se agrega el atajo u-x con medio v.
+Consulta: Dijkstra bidireccional que sólo sube de nivel; el camino se desarma atajo por atajo
+hasta quedar con los barrios originales.
+"""
+
+from __future__ import annotations
+import heapq
+import time
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..grafo.grafo_csr import GrafoCSR
+from . import contadores
+from .short_path import DijkstraIdx
+
+
+class ContractionHierarchies:
+    def __init__(self, g, limite_testigo: int = 64):
+        """
+        Preprocesa g (se congela a CSR, NO dirigido).
+        limite_testigo: vértices que puede fijar cada búsqueda de testigos; con menos el
+        preproceso es más rápido pero puede agregar atajos de más (nunca de menos).
+        """
+        self.g: GrafoCSR = GrafoCSR.from_grafo(g)
+        self.limite_testigo = limite_testigo
+        self.consultas = 0
+        self.consultas_seg = 0.0
+        self.ultima_consulta_seg = 0.0
+        self.fijados = 0
+        t0 = time.perf_counter()
+        self._contraer()
+        self.preproceso_seg = time.perf_counter() - t0
+
+    # ---------- preproceso ----------
+    def _contraer(self):
+        g = self.g
+        n = g.vertex_count
+        # grafo "restante": adj[u][v] = (peso, medio); medio = -1 para aristas originales
+        adj: List[Dict[int, Tuple[float, int]]] = [{} for _ in range(n)]
+        for u in range(n):
+            for k in range(g.offsets[u], g.offsets[u + 1]):
+                v = g.targets[k]
+                if v != u:
+                    adj[u][v] = (g.weights[k], -1)
+
+        self.nivel = array("q", [-1]) * n
+        self.atajos = 0
+        contraidos_vecinos = [0] * n
+        up: List[List[Tuple[int, float, int]]] = [[] for _ in range(n)]
+
+        pq = [(self._prioridad(adj, v, 0), v) for v in range(n)]
+        heapq.heapify(pq)
+        siguiente = 0
+        while pq:
+            _, v = heapq.heappop(pq)
+            if self.nivel[v] != -1:
+                continue
+            prio = self._prioridad(adj, v, contraidos_vecinos[v])
+            if pq and prio > pq[0][0]:
+                heapq.heappush(pq, (prio, v))
+                continue
+
+            for u, x, via in self._atajos_necesarios(adj, v):
+                actual = adj[u].get(x)
+                if actual is None or via < actual[0]:
+                    adj[u][x] = adj[x][u] = (via, v)
+                    self.atajos += 1
+            self.nivel[v] = siguiente
+            siguiente += 1
+            for u, (w, medio) in adj[v].items():
+                up[v].append((u, w, medio))
+                del adj[u][v]
+                contraidos_vecinos[u] += 1
+            adj[v] = {}
+
+        # grafo hacia arriba en CSR + medios de los atajos para desarmarlos
+        self.up_offsets = array("q", [0])
+        self.up_targets = array("q")
+        self.up_weights = array("d")
+        self._medio: Dict[int, int] = {}
+        for v in range(n):
+            for u, w, medio in up[v]:
+                self.up_targets.append(u)
+                self.up_weights.append(w)
+                if medio != -1:
+                    self._medio[v * n + u] = medio
+            self.up_offsets.append(len(self.up_targets))
+
+    def _prioridad(self, adj, v: int, contraidos: int) -> int:
+        return len(self._atajos_necesarios(adj, v)) - len(adj[v]) + contraidos
+
+    def _atajos_necesarios(self, adj, v: int) -> List[Tuple[int, int, float]]:
+        vecinos = list(adj[v].items())
+        out: List[Tuple[int, int, float]] = []
+        for i, (u, (wu, _)) in enumerate(vecinos):
+            objetivos = {x: wu + wx for x, (wx, _) in vecinos[i + 1:]}
+            if not objetivos:
+                continue
+            testigo = self._testigos(adj, u, v, max(objetivos.values()), objetivos)
+            for x, via in objetivos.items():
+                if testigo.get(x, float("inf")) > via:
+                    out.append((u, x, via))
+        return out
+
+    def _testigos(self, adj, s: int, evitar: int, limite: float, objetivos) -> Dict[int, float]:
+        """Dijkstra acotado desde s sin pasar por 'evitar' (corta por distancia y por fijados)."""
+        dist = {s: 0.0}
+        pq = [(0.0, s)]
+        pendientes = len(objetivos)
+        fijados = 0
+        while pq and fijados < self.limite_testigo:
+            d, u = heapq.heappop(pq)
+            if d > limite:
+                break
+            if d != dist[u]:
+                continue
+            fijados += 1
+            if u in objetivos:
+                pendientes -= 1
+                if not pendientes:
+                    break
+            for v, (w, _) in adj[u].items():
+                if v == evitar:
+                    continue
+                nd = d + w
+                if nd < dist.get(v, float("inf")):
+                    dist[v] = nd
+                    heapq.heappush(pq, (nd, v))
+        return dist
+
+    # ---------- consultas ----------
+    def _buscar_arriba(self, dist, parent, pq, otra, mu, meet):
+        """Un paso de la búsqueda hacia arriba; devuelve (mu, meet) actualizados."""
+        d, u = heapq.heappop(pq)
+        self._pop += 1
+        if d != dist[u]:
+            return mu, meet
+        self.fijados += 1
+        if u in otra and d + otra[u] < mu:
+            mu, meet = d + otra[u], u
+        self._relajadas += self.up_offsets[u + 1] - self.up_offsets[u]
+        for k in range(self.up_offsets[u], self.up_offsets[u + 1]):
+            v = self.up_targets[k]
+            nd = d + self.up_weights[k]
+            if nd < dist.get(v, float("inf")):
+                dist[v] = nd
+                parent[v] = u
+                heapq.heappush(pq, (nd, v))
+                self._push += 1
+        return mu, meet
+
+    def camino(self, s: int, t: int, banned: Optional[Iterable[int]] = None) -> Tuple[float, List[int]]:
+        """
+        (distancia, camino de índices) de s a t; (inf, []) si no hay camino.
+        La distancia coincide con Dijkstra; ante empates de caminos mínimos el camino elegido
+        puede ser otro igual de corto. Los atajos ignoran cortes: con 'banned' se usa Dijkstra
+        bidireccional sobre el grafo original.
+        """
+        t0 = time.perf_counter()
+        self.fijados = 0
+        banned = list(banned or ())
+        if banned:
+            dist, parent = DijkstraIdx.bidireccional(self.g, s, t, banned)
+            res = dist[t], DijkstraIdx.path(parent, t)
+        elif s == t:
+            res = 0.0, [s]
+        else:
+            res = self._camino_ch(s, t)
+        self.ultima_consulta_seg = time.perf_counter() - t0
+        self.consultas += 1
+        self.consultas_seg += self.ultima_consulta_seg
+        return res
+
+    def _camino_ch(self, s: int, t: int) -> Tuple[float, List[int]]:
+        INF = float("inf")
+        df: Dict[int, float] = {s: 0.0}
+        db: Dict[int, float] = {t: 0.0}
+        pf: Dict[int, int] = {s: -1}
+        pb: Dict[int, int] = {t: -1}
+        qf = [(0.0, s)]
+        qb = [(0.0, t)]
+        mu, meet = INF, -1
+        self._push, self._pop, self._relajadas = 2, 0, 0
+        while (qf and qf[0][0] < mu) or (qb and qb[0][0] < mu):
+            if qf and qf[0][0] < mu and (not qb or qb[0][0] >= mu or qf[0][0] <= qb[0][0]):
+                mu, meet = self._buscar_arriba(df, pf, qf, db, mu, meet)
+            else:
+                mu, meet = self._buscar_arriba(db, pb, qb, df, mu, meet)
+        if contadores.ACTIVO:
+            contadores.sumar(self.fijados, self._relajadas, self._push, self._pop)
+        if meet == -1:
+            return INF, []
+
+        # cadena de vértices del grafo jerárquico: s ... meet ... t
+        subida: List[int] = []
+        v = meet
+        while v != -1:
+            subida.append(v)
+            v = pf[v]
+        subida.reverse()
+        v = pb[meet]
+        while v != -1:
+            subida.append(v)
+            v = pb[v]
+
+        camino = [s]
+        for a, b in zip(subida, subida[1:]):
+            self._expandir(a, b, camino)
+        # distancia sumada en el orden del camino, igual que la acumula Dijkstra
+        d = 0.0
+        for a, b in zip(camino, camino[1:]):
+            d += self.g.weights[self.g._pos(a, b)]
+        return d, camino
+
+    def _medio_de(self, a: int, b: int) -> int:
+        n = self.g.vertex_count
+        bajo, alto = (a, b) if self.nivel[a] < self.nivel[b] else (b, a)
+        return self._medio.get(bajo * n + alto, -1)
+
+    def _expandir(self, a: int, b: int, out: List[int]):
+        """Agrega a 'out' los vértices originales de a (excluido) hasta b (incluido)."""
+        pila = [(a, b)]
+        while pila:
+            x, y = pila.pop()
+            m = self._medio_de(x, y)
+            if m == -1:
+                out.append(y)
+            else:
+                pila.append((m, y))
+                pila.append((x, m))
+
+    # ---------- reporte y verificación ----------
+    def reporte(self) -> Dict[str, float]:
+        return {
+            "preproceso_seg": self.preproceso_seg,
+            "atajos": self.atajos,
+            "consultas": self.consultas,
+            "consulta_seg_promedio": self.consultas_seg / self.consultas if self.consultas else 0.0,
+        }
+
+    def verificar(self, pares: Sequence[Tuple[int, int]]) -> List[Tuple[int, int, float, float]]:
+        """
+        Compara contra DijkstraIdx: devuelve los pares (s, t, d_ch, d_dijkstra) cuya distancia
+        difiere o cuyo camino no es válido. Lista vacía = todo coincide.
+        """
+        malos = []
+        for s, t in pares:
+            d, camino = self.camino(s, t)
+            dist, _ = DijkstraIdx.compute(self.g, s, t)
+            valido = not camino or (
+                camino[0] == s and camino[-1] == t
+                and all(self.g._pos(a, b) is not None for a, b in zip(camino, camino[1:]))
+            )
+            distinta = d != dist[t] and not abs(d - dist[t]) <= 1e-9 * max(1.0, abs(dist[t]))
+            if distinta or not valido:
+                malos.append((s, t, d, dist[t]))
+        return malos
@@ -0,0 +1,186 @@
+"""
+Índice de conectividad dinámico para la red eléctrica.
+
+Se engancha al grafo (Grafo.observar) y se mantiene con cada mutación sin recorrer el
+grafo de nuevo:
+- altas (add_edge / add_vertex): Union-Find con tamaños y miembros; las aristas que unen
+  componentes forman un bosque generador;
+- bajas (delete_edge / delete_vertex): quitar una arista fuera del bosque no cambia nada;
+  si es del bosque, se recorren a la par los dos árboles que quedan hasta agotar el más
+  chico y se busca desde él una arista de reemplazo. Si no hay, ese lado pasa a ser una
+  isla nueva. El trabajo queda acotado por el lado chico.
+
+El índice guarda los vecinos de cada vértice (conjuntos por id, al día con los eventos):
+la búsqueda de reemplazo cuesta O(grado) por vértice, sin pedirle al grafo su lista de
+adyacencia (en GrafoAdyacencia eso recorre una fila entera de la matriz).
+
+Los vértices se identifican por nombre (ids propios estables), porque delete_vertex
+renumera los índices del grafo.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, Optional, Set
+
+from . import contadores
+from .mst import UnionFindMiembros
+
+
+class IndiceConectividad:
+    def __init__(self, g):
+        """Arma el índice con las aristas actuales de g (no se engancha; ver de())."""
+        self.g = g
+        self.reemplazos = 0         # bajas del bosque resueltas con una arista de reemplazo
+        self.separaciones = 0       # bajas que partieron un componente
+        self.revisados = 0          # vértices recorridos por las bajas del bosque (lados chicos)
+        self.aristas_revisadas = 0  # aristas del grafo miradas buscando reemplazo
+        self._reconstruir()
+
+    @classmethod
+    def de(cls, g) -> "IndiceConectividad":
+        """El índice enganchado a g; lo crea y lo registra como observador la primera vez."""
+        indice = g.__dict__.get("_conectividad")
+        if indice is None:
+            indice = cls(g)
+            g._conectividad = indice
+            if hasattr(g, "observar"):
+                g.observar(indice)
+        return indice
+
+    def _reconstruir(self):
+        g = self.g
+        self.nombres: List[Optional[str]] = list(g.vertices())     # None = vértice borrado
+        self.id: Dict[str, int] = {v: i for i, v in enumerate(self.nombres)}
+        self.uf = UnionFindMiembros(len(self.nombres))
+        self.bosque: List[Set[int]] = [set() for _ in self.nombres]
+        self.vecinos: List[Set[int]] = [set() for _ in self.nombres]
+        self._borrados = 0
+        self._componentes: Optional[List[List[str]]] = None
+        relajadas = 0
+        for u in self.nombres:
+            a = self.id[u]
+            vecinos = g.get_adjacency_list(u)
+            relajadas += len(vecinos)
+            for v in vecinos:
+                b = self.id[v]
+                self.vecinos[a].add(b)
+                self.vecinos[b].add(a)
+                self._enlazar(a, b)
+        if contadores.ACTIVO:
+            contadores.sumar(len(self.nombres), relajadas)
+
+    # ---------- bosque generador ----------
+    def _enlazar(self, a: int, b: int):
+        if self.uf.union(a, b):
+            self.bosque[a].add(b)
+            self.bosque[b].add(a)
+            self._componentes = None
+
+    def _lado_chico(self, a: int, b: int) -> Set[int]:
+        """Recorre a la par los árboles de a y de b; devuelve el primero que se agota."""
+        vistos = ({a}, {b})
+        pilas = ([a], [b])
+        while True:
+            for lado in (0, 1):
+                pila = pilas[lado]
+                if not pila:
+                    return vistos[lado]
+                x = pila.pop()
+                for y in self.bosque[x]:
+                    if y not in vistos[lado]:
+                        vistos[lado].add(y)
+                        pila.append(y)
+
+    def _cortar(self, a: int, b: int):
+        if b not in self.bosque[a]:
+            return                  # arista fuera del bosque: la conectividad no cambia
+        self.bosque[a].discard(b)
+        self.bosque[b].discard(a)
+        chico = self._lado_chico(a, b)
+        self.revisados += len(chico)
+        revisadas = 0
+        for x in chico:
+            vecinos = self.vecinos[x]
+            revisadas += len(vecinos)
+            for y in vecinos:
+                if y not in chico:
+                    # arista de reemplazo: reconecta los dos árboles
+                    self.bosque[x].add(y)
+                    self.bosque[y].add(x)
+                    self.reemplazos += 1
+                    self._revisadas(len(chico), revisadas)
+                    return
+        self._revisadas(len(chico), revisadas)
+        self.uf.separar(chico)
+        self.separaciones += 1
+        self._componentes = None
+
+    def _revisadas(self, vertices: int, aristas: int):
+        self.aristas_revisadas += aristas
+        if contadores.ACTIVO:
+            contadores.sumar(vertices, aristas)
+
+    # ---------- eventos del grafo ----------
+    def vertice_agregado(self, i: int):
+        nombre = self.g.vs[i]
+        self.id[nombre] = self.uf.agregar()
+        self.nombres.append(nombre)
+        self.bosque.append(set())
+        self.vecinos.append(set())
+        self._componentes = None
+
+    def arista_agregada(self, i: int, j: int):
+        a, b = self.id[self.g.vs[i]], self.id[self.g.vs[j]]
+        self.vecinos[a].add(b)
+        self.vecinos[b].add(a)
+        self._enlazar(a, b)
+
+    def arista_eliminada(self, i: int, j: int):
+        a, b = self.id[self.g.vs[i]], self.id[self.g.vs[j]]
+        self.vecinos[a].discard(b)
+        self.vecinos[b].discard(a)
+        self._cortar(a, b)
+
+    def vertice_eliminado(self, i: int):
+        # se llama antes de quitarlo: primero deja de ser vecino de todos (sus aristas no
+        # sirven de reemplazo), después se cortan sus aristas del bosque y queda aislado
+        nombre = self.g.vs[i]
+        a = self.id[nombre]
+        vecinos, self.vecinos[a] = self.vecinos[a], set()
+        for b in vecinos:
+            self.vecinos[b].discard(a)
+        for b in list(self.bosque[a]):
+            self._cortar(a, b)
+        del self.id[nombre]
+        self.nombres[a] = None
+        self._borrados += 1
+        self._componentes = None
+
+    # ---------- consultas ----------
+    def mismo_componente(self, a: str, b: str) -> bool:
+        """True si a y b existen y están conectados."""
+        if a not in self.id or b not in self.id:
+            return False
+        return self.uf.find(self.id[a]) == self.uf.find(self.id[b])
+
+    def componente(self, a: str) -> List[str]:
+        """Barrios del componente de a, ordenados ([] si a no existe)."""
+        i = self.id.get(a)
+        if i is None:
+            return []
+        return sorted(self.nombres[j] for j in self.uf.componente(i))
+
+    def cantidad(self) -> int:
+        return self.uf.cantidad - self._borrados
+
+    def componentes(self) -> List[List[str]]:
+        """Igual que ComponentesConexos.compute(g); se reutiliza hasta que el índice cambie."""
+        if self._componentes is None:
+            nombres = self.nombres
+            comps = []
+            for m in self.uf.miembros:
+                comp = sorted(nombres[j] for j in m if nombres[j] is not None)
+                if comp:
+                    comps.append(comp)
+            comps.sort(key=lambda c: c[0])
+            self._componentes = comps
+        return self._componentes
@@ -0,0 +1,49 @@
+"""
+Contadores de los recorridos, para la traza de src.instrumentacion.
+
+Los kernels cuentan en enteros locales y, al terminar, los suman acá sólo si ACTIVO es
+True: apagados cuestan una comparación por llamada. Se cuentan:
+- heap_push / heap_pop: operaciones sobre los heaps (Dijkstra, A*, CH, reparación de cortes);
+- vertices_visitados: vértices expandidos (sacados de la cola, pila o heap para mirar sus
+  vecinos; el destino que corta la búsqueda no se expande);
+- aristas_relajadas: aristas miradas al expandirlos (en los Dijkstra, cada una es un intento
+  de relajación; en Floyd–Warshall, V³).
+Lo que corre en otros procesos (los pools de MATRIZ_DISTANCIAS y BARRIDO_CORTES) no suma.
+"""
+
+from __future__ import annotations
+from typing import Dict
+
+NOMBRES = ("heap_push", "heap_pop", "vertices_visitados", "aristas_relajadas")
+
+ACTIVO = False
+heap_push = 0
+heap_pop = 0
+vertices_visitados = 0
+aristas_relajadas = 0
+
+
+def sumar(vertices: int, aristas: int, push: int = 0, pop: int = 0):
+    global heap_push, heap_pop, vertices_visitados, aristas_relajadas
+    heap_push += push
+    heap_pop += pop
+    vertices_visitados += vertices
+    aristas_relajadas += aristas
+
+
+def leer() -> Dict[str, int]:
+    """Valores acumulados hasta ahora."""
+    return {
+        "heap_push": heap_push,
+        "heap_pop": heap_pop,
+        "vertices_visitados": vertices_visitados,
+        "aristas_relajadas": aristas_relajadas,
+    }
+
+
+def activar(activo: bool = True):
+    """Prende o apaga el conteo; al prender arranca de cero."""
+    global ACTIVO, heap_push, heap_pop, vertices_visitados, aristas_relajadas
+    ACTIVO = activo
+    if activo:
+        heap_push = heap_pop = vertices_visitados = aristas_relajadas = 0
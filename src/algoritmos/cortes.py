@@ -0,0 +1,188 @@
+"""
+Simulación incremental de cortes sobre el árbol de caminos mínimos sin cortes.
+
+Por cada origen se guarda el árbol de Dijkstra completo (dist, parent) del grafo intacto.
+Ante un corte:
+- si ningún barrio cortado está en el camino base origen→destino, la respuesta es la misma
+  (los cortes sólo alargan distancias, y el camino y su desempate siguen valiendo);
+- si no, sólo cambian los vértices que colgaban de un barrio cortado en el árbol: se los
+  vuelve a resolver con un Dijkstra acotado a ese subárbol, sembrado desde su borde.
+"""
+
+from __future__ import annotations
+import heapq
+from array import array
+from collections import OrderedDict
+from typing import Iterable, List, Optional, Tuple
+
+from ..grafo.grafo_csr import GrafoCSR
+from . import contadores
+from .short_path import DijkstraIdx
+
+
+class SimuladorCortes:
+    def __init__(self, g, max_origenes: int = 64):
+        """
+        g se congela a CSR (NO dirigido). Se guardan a lo sumo 'max_origenes' árboles base
+        (LRU; cada uno ocupa ~24 bytes por vértice).
+        """
+        self.g: GrafoCSR = GrafoCSR.from_grafo(g)
+        self.max_origenes = max_origenes
+        self._arboles: "OrderedDict[int, Tuple[array, array, array, array]]" = OrderedDict()
+        self.inmediatas = 0         # consultas respondidas con el árbol base tal cual
+        self.reparadas = 0          # consultas que necesitaron reparar un subárbol
+        self.reparados = 0          # vértices re-resueltos en total
+
+    # ---------- árboles base ----------
+    def _arbol(self, s: int) -> Tuple[array, array, array, array]:
+        """(dist, parent, hijos_offsets, hijos) del árbol sin cortes desde s."""
+        arbol = self._arboles.get(s)
+        if arbol is not None:
+            self._arboles.move_to_end(s)
+            return arbol
+        n = self.g.vertex_count
+        dist, parent = DijkstraIdx.compute(self.g, s)
+        # hijos de cada vértice en CSR (por conteo)
+        offs = array("q", [0]) * (n + 1)
+        for v in range(n):
+            p = parent[v]
+            if p != -1 and p != v:
+                offs[p + 1] += 1
+        for v in range(n):
+            offs[v + 1] += offs[v]
+        hijos = array("q", [0]) * offs[n]
+        pos = offs[:-1]
+        for v in range(n):
+            p = parent[v]
+            if p != -1 and p != v:
+                hijos[pos[p]] = v
+                pos[p] += 1
+        arbol = (dist, parent, offs, hijos)
+        self._arboles[s] = arbol
+        if self.max_origenes > 0 and len(self._arboles) > self.max_origenes:
+            self._arboles.popitem(last=False)
+        return arbol
+
+    # ---------- consultas ----------
+    def camino(self, s: int, t: int, banned: Optional[Iterable[int]] = None) -> Tuple[float, List[int]]:
+        """
+        (distancia, camino de índices) de s a t sin pasar por 'banned'; (inf, []) si no hay.
+        Mismo resultado que DijkstraIdx.compute(g, s, t, banned), desempate incluido.
+        Sin cortes y sin árbol guardado para s se usa Dijkstra bidireccional.
+        """
+        g = self.g
+        banned = list(banned or ())
+        if not getattr(g, "no_dirigido", True):
+            dist, parent = DijkstraIdx.compute(g, s, t, banned)
+            return dist[t], DijkstraIdx.path(parent, t)
+        if not banned and s not in self._arboles:
+            dist, parent = DijkstraIdx.bidireccional(g, s, t)
+            return dist[t], DijkstraIdx.path(parent, t)
+
+        n = g.vertex_count
+        bloqueado = bytearray(n)
+        for b in banned:
+            bloqueado[b] = 1
+        if bloqueado[s] or bloqueado[t]:
+            return float("inf"), []
+        dist, parent, offs, hijos = self._arbol(s)
+        if parent[t] == -1:
+            return float("inf"), []
+
+        base = DijkstraIdx.path(parent, t)
+        if not any(bloqueado[v] for v in base):
+            self.inmediatas += 1
+            return dist[t], base
+        self.reparadas += 1
+        return self._reparar(s, t, dist, parent, offs, hijos, banned, bloqueado)
+
+    def _reparar(self, s, t, dist, parent, offs, hijos, banned, bloqueado) -> Tuple[float, List[int]]:
+        g = self.g
+        n = g.vertex_count
+        INF = float("inf")
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        rank, por_rank = g.rangos()
+
+        # afectados: descendientes (en el árbol base) de algún barrio cortado
+        afectado = bytearray(n)
+        pila = [b for b in set(banned) if parent[b] != -1]
+        for b in pila:
+            afectado[b] = 1
+        region: List[int] = []
+        while pila:
+            u = pila.pop()
+            for k in range(offs[u], offs[u + 1]):
+                v = hijos[k]
+                if not afectado[v]:
+                    afectado[v] = 1
+                    region.append(v)
+                    pila.append(v)
+        self.reparados += len(region)
+
+        # nuevas distancias sólo para la región; el resto del árbol no cambia
+        nueva = {}
+        pq = []
+        relajadas = 0
+        for v in region:
+            if bloqueado[v]:
+                continue
+            mejor = INF
+            relajadas += offsets[v + 1] - offsets[v]
+            for k in range(offsets[v], offsets[v + 1]):
+                u = targets[k]
+                if not afectado[u] and dist[u] + weights[k] < mejor:
+                    mejor = dist[u] + weights[k]
+            if mejor < INF:
+                nueva[v] = mejor
+                pq.append((mejor, rank[v]))
+        heapq.heapify(pq)
+        push = len(pq)
+        expandidos = 0
+        while pq:
+            d, r = heapq.heappop(pq)
+            u = por_rank[r]
+            if d != nueva[u]:
+                continue
+            if u == t:
+                break
+            expandidos += 1
+            fila = range(offsets[u], offsets[u + 1])
+            relajadas += len(fila)
+            for k in fila:
+                v = targets[k]
+                if not afectado[v] or bloqueado[v]:
+                    continue
+                nd = d + weights[k]
+                if nd < nueva.get(v, INF):
+                    nueva[v] = nd
+                    heapq.heappush(pq, (nd, rank[v]))
+                    push += 1
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas, push, push - len(pq))
+
+        def distancia(v: int) -> float:
+            if bloqueado[v]:
+                return INF
+            return nueva.get(v, INF) if afectado[v] else dist[v]
+
+        if distancia(t) == INF:
+            return INF, []
+        # camino: fuera de la región vale el parent base; dentro, la regla de Dijkstra
+        # (entre los predecesores ajustados gana el de menor (dist, nombre))
+        out = [t]
+        v = t
+        while v != s:
+            if not afectado[v]:
+                v = parent[v]
+            else:
+                dv = nueva[v]
+                mejor, clave = -1, None
+                for k in range(offsets[v], offsets[v + 1]):
+                    u = targets[k]
+                    du = distancia(u)
+                    if du + weights[k] == dv and (clave is None or (du, rank[u]) < clave):
+                        mejor, clave = u, (du, rank[u])
+                v = mejor
+            out.append(v)
+        out.reverse()
+        return distancia(t), out
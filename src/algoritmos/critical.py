@@ -1,5 +1,10 @@
 from __future__ import annotations
-from typing import Dict, List, Optional, Set, Tuple
+from array import array
+from typing import List, Tuple
+
+from ..grafo.grafo_csr import GrafoCSR
+from . import contadores
+
 
 class TarjanCriticos:
     @staticmethod
@@ -8,40 +13,76 @@ class TarjanCriticos:
         Retorna (articulaciones, puentes) en grafo NO dirigido.
         - articulaciones: lista de vértices
         - puentes: lista de tuplas (u, v) con u < v
+        Corre TarjanCriticosIdx (sin recursión) sobre la vista CSR y traduce a nombres.
+        """
+        c = GrafoCSR.from_grafo(g)
+        arts, puentes = TarjanCriticosIdx.compute(c)
+        vs = c.vs
+        nombres = [(vs[u], vs[v]) if vs[u] < vs[v] else (vs[v], vs[u]) for u, v in puentes]
+        return sorted(vs[u] for u in arts), sorted(nombres)
+
+
+class TarjanCriticosIdx:
+    @staticmethod
+    def compute(g) -> Tuple[List[int], List[Tuple[int, int]]]:
+        """
+        Tarjan sobre índices de un GrafoCSR, con pila explícita (sin límite de profundidad).
+        Retorna (articulaciones, puentes) como índices; puentes con u < v (por índice).
+        La traducción a nombres y el orden alfabético quedan a cargo de quien llama.
+        O(V + E), también para grafos no conexos.
         """
+        n = g.vertex_count
+        offsets, targets = g.offsets, g.targets
+        disc = array("q", [0]) * n      # 0 = no visitado
+        low = array("q", [0]) * n
+        parent = array("q", [-1]) * n
+        cursor = array("q", offsets)    # próxima arista a mirar de cada vértice
+        es_art = bytearray(n)
+        puentes: List[Tuple[int, int]] = []
         time = 0
-        disc: Dict[str, int] = {}
-        low: Dict[str, int] = {}
-        parent: Dict[str, Optional[str]] = {}
-        arts: Set[str] = set()
-        edges: Set[Tuple[str, str]] = set()
-
-        def dfs(u: str):
-            nonlocal time
+
+        for raiz in range(n):
+            if disc[raiz]:
+                continue
             time += 1
-            disc[u] = low[u] = time
-            children = 0
-            for v in g.get_adjacency_list(u):
-                if v not in disc:
-                    parent[v] = u
-                    children += 1
-                    dfs(v)
-                    low[u] = min(low[u], low[v])
+            disc[raiz] = low[raiz] = time
+            hijos_raiz = 0
+            pila = [raiz]
+            while pila:
+                u = pila[-1]
+                k = cursor[u]
+                if k < offsets[u + 1]:
+                    cursor[u] = k + 1
+                    v = targets[k]
+                    if not disc[v]:
+                        # bajar a v (equivale a la llamada recursiva)
+                        parent[v] = u
+                        time += 1
+                        disc[v] = low[v] = time
+                        pila.append(v)
+                    elif v != parent[u] and disc[v] < low[u]:
+                        low[u] = disc[v]
+                    continue
+
+                # u terminado: propagar a su padre (equivale al retorno de la recursión)
+                pila.pop()
+                p = parent[u]
+                if p == -1:
+                    continue
+                if low[u] < low[p]:
+                    low[p] = low[u]
+                if p == raiz:
+                    hijos_raiz += 1
+                elif low[u] >= disc[p]:
                     # Articulación
-                    if parent.get(u) is None and children > 1:
-                        arts.add(u)
-                    if parent.get(u) is not None and low[v] >= disc[u]:
-                        arts.add(u)
-                    # Puente
-                    if low[v] > disc[u]:
-                        a, b = (u, v) if u < v else (v, u)
-                        edges.add((a, b))
-                elif v != parent.get(u):
-                    low[u] = min(low[u], disc[v])
-
-        for s in getattr(g, "vertices", lambda: [])():
-            if s not in disc:
-                parent[s] = None
-                dfs(s)
-
-        return sorted(arts), sorted(edges)
+                    es_art[p] = 1
+                # Puente
+                if low[u] > disc[p]:
+                    puentes.append((p, u) if p < u else (u, p))
+            if hijos_raiz > 1:
+                es_art[raiz] = 1
+
+        if contadores.ACTIVO:
+            # recorrido completo: cada vértice se expande y cada arista se mira una vez
+            contadores.sumar(n, offsets[n])
+        return [u for u in range(n) if es_art[u]], puentes
@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..grafo.grafo_csr import GrafoCSR
+from .traversal import ComponentesConexos
+from .critical import TarjanCriticos
+
+# -------------------------
+# Vistas derivadas estándar
+# -------------------------
+# Cada vista se calcula a demanda y queda guardada en el grafo (Grafo.vista)
+# hasta que una mutación cambie su epoch.
+
+def csr(g):
+    """Vista CSR congelada del grafo (base de los kernels enteros)."""
+    return GrafoCSR.from_grafo(g)
+
+
+def grados(g) -> Dict[str, int]:
+    """{barrio: grado}."""
+    c = derivado(g, "csr")
+    return {v: c.degree(i) for i, v in enumerate(c.vs)}
+
+
+def componentes(g) -> List[List[str]]:
+    """Componentes conexos (como ComponentesConexos.compute)."""
+    return ComponentesConexos.compute(derivado(g, "csr"))
+
+
+def etiquetas(g) -> Dict[str, int]:
+    """{barrio: número de componente} según el orden de la vista 'componentes'."""
+    return {v: k for k, comp in enumerate(derivado(g, "componentes")) for v in comp}
+
+
+def criticos(g) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """(articulaciones, puentes) con nombres y ordenados, igual que TarjanCriticos.compute."""
+    return TarjanCriticos.compute(derivado(g, "csr"))
+
+
+DERIVADOS: Dict[str, Callable[[Any], Any]] = {
+    "csr": csr,
+    "grados": grados,
+    "componentes": componentes,
+    "etiquetas": etiquetas,
+    "criticos": criticos,
+}
+
+
+def derivado(g, nombre: str) -> Any:
+    """
+    Devuelve la vista 'nombre' de g, reutilizándola mientras el grafo no cambie.
+    Grafos sin soporte de vistas (p. ej. dicts) la recalculan siempre.
+    """
+    calcular = DERIVADOS[nombre]
+    if hasattr(g, "vista"):
+        return g.vista(nombre, calcular)
+    return calcular(g)
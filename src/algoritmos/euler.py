@@ -1,6 +1,9 @@
 from __future__ import annotations
-from collections import defaultdict
-from typing import Dict, List
+from array import array
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from . import contadores
+from .derivados import derivado
 
 
 class Hierholzer:
@@ -8,50 +11,114 @@ class Hierholzer:
     def compute(g) -> List[str]:
         """
         Calcula un camino/circuito euleriano en un grafo NO dirigido (si existe).
-        Usa g.edges() para reconstruir el grafo.
+        Usa las aristas de la vista CSR (cada una una sola vez, i < j).
         Devuelve la secuencia de vértices que recorre cada arista exactamente una vez.
         Si no es euleriano/semieuleriano, retorna lista vacía.
         """
+        c = derivado(g, "csr")
+        offsets, targets = c.offsets, c.targets
+        dirigido = not getattr(c, "no_dirigido", True)
+        us = array("q")
+        vs = array("q")
+        for i in range(c.vertex_count):
+            for k in range(offsets[i], offsets[i + 1]):
+                j = targets[k]
+                if j > i or (dirigido and j != i):
+                    us.append(i)
+                    vs.append(j)
+        rank, _ = c.rangos()
+        return [c.vs[i] for i in HierholzerIdx.compute(c.vertex_count, us, vs, rank)]
+
+    @staticmethod
+    def desde_aristas(aristas: Iterable[Tuple]) -> List[str]:
+        """
+        Igual que compute pero sobre una lista de aristas (u, v) o (u, v, w) con nombres,
+        que puede tener calles paralelas (multiaristas) y lazos.
+        """
+        nombres: List[str] = []
+        idx: Dict[str, int] = {}
+        us = array("q")
+        vs = array("q")
+        for e in aristas:
+            for x, destino in ((e[0], us), (e[1], vs)):
+                i = idx.get(x)
+                if i is None:
+                    i = idx[x] = len(nombres)
+                    nombres.append(x)
+                destino.append(i)
+        rank = array("q", [0]) * len(nombres)
+        for r, i in enumerate(sorted(range(len(nombres)), key=nombres.__getitem__)):
+            rank[i] = r
+        return [nombres[i] for i in HierholzerIdx.compute(len(nombres), us, vs, rank)]
 
-        # 1) Construir adyacencias como grafo no dirigido
-        adj: Dict[str, List[str]] = defaultdict(list)
-        for u, v, w in g.edges():
-            adj[u].append(v)
-            adj[v].append(u)
 
-        if not adj:
+class HierholzerIdx:
+    @staticmethod
+    def compute(n: int, us: Sequence[int], vs: Sequence[int], rank: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Hierholzer sobre aristas por id (arista e = (us[e], vs[e]), se admiten paralelas y lazos).
+        O(V + E): incidencias en CSR, una marca de "usada" por arista y un cursor por vértice.
+        Arranca en el impar de menor rank (o el de menor rank con aristas si no hay impares);
+        rank por defecto = índice. Cada vértice toma primero su última arista libre, así el
+        recorrido es el mismo que el de Hierholzer.compute sobre listas de adyacencia.
+        Retorna [] si no es euleriano/semieuleriano.
+        """
+        m = len(us)
+        if m == 0:
             return []
+        if rank is None:
+            rank = range(n)
 
-        # 2) Determinar vértices de grado impar
-        impares = [v for v, neis in adj.items() if len(neis) % 2 == 1]
+        # incidencias por vértice en el orden de las aristas (conteo)
+        offsets = array("q", [0]) * (n + 1)
+        impar = bytearray(n)
+        for e in range(m):
+            u, v = us[e], vs[e]
+            offsets[u + 1] += 1
+            if u != v:
+                offsets[v + 1] += 1
+                impar[u] ^= 1
+                impar[v] ^= 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        inc = array("q", [0]) * offsets[n]
+        pos = offsets[:-1]
+        for e in range(m):
+            u, v = us[e], vs[e]
+            inc[pos[u]] = e
+            pos[u] += 1
+            if u != v:
+                inc[pos[v]] = e
+                pos[v] += 1
 
-        # 3) Si no es euleriano (0 impares) ni semieuleriano (2 impares) → no hay camino
+        impares = [v for v in range(n) if impar[v]]
         if len(impares) not in (0, 2):
             return []
-
-        # 4) Elegir vértice inicial de forma determinista
-        if len(impares) == 2:
-            # Camino euleriano: arrancamos en el menor de los impares
-            start = min(impares)
+        if impares:
+            start = min(impares, key=lambda v: rank[v])
         else:
-            # Circuito euleriano: arrancamos en el menor vértice con aristas
-            start = min(adj.keys())
-
-        # 5) Copia local de adyacencias para ir "borrando" aristas
-        local: Dict[str, List[str]] = {u: list(neis) for u, neis in adj.items()}
-
-        stack: List[str] = [start]
-        path: List[str] = []
+            start = min((v for v in range(n) if offsets[v + 1] > offsets[v]), key=lambda v: rank[v])
 
-        # 6) Algoritmo de Hierholzer
+        usada = bytearray(m)
+        cursor = array("q", offsets[1:])    # se recorre cada lista desde el final
+        stack: List[int] = [start]
+        path: List[int] = []
         while stack:
             u = stack[-1]
-            if local[u]:
-                v = local[u].pop()
-                local[v].remove(u)
-                stack.append(v)
+            c = cursor[u]
+            while c > offsets[u] and usada[inc[c - 1]]:
+                c -= 1
+            if c > offsets[u]:
+                e = inc[c - 1]
+                cursor[u] = c - 1
+                usada[e] = 1
+                stack.append(us[e] ^ vs[e] ^ u)     # el otro extremo (u mismo si es lazo)
             else:
+                cursor[u] = c
                 path.append(stack.pop())
 
+        if contadores.ACTIVO:
+            # cada paso saca un vértice de la pila; cada incidencia se mira una vez
+            contadores.sumar(len(path), offsets[n])
         path.reverse()
         return path
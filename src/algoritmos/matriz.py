@@ -0,0 +1,113 @@
+"""
+Matriz de distancias (todos contra todos) sobre un GrafoCSR, generada fila por fila.
+
+- "floyd": Floyd–Warshall vectorizado con NumPy (grafos chicos o densos; usa una matriz V×V);
+  sin NumPy se usa "dijkstra", que da las mismas distancias
+- "dijkstra": un Dijkstra por origen, repartido en un pool de procesos si el grafo es grande
+- "auto": elige según tamaño/densidad y si NumPy está disponible
+"""
+
+from __future__ import annotations
+import os
+from array import array
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+from . import contadores
+from .short_path import DijkstraIdx
+
+# grafo compartido con los workers (se hereda por fork, no se serializa por tarea)
+_GRAFO_WORKER = None
+
+
+def _fila_worker(s: int) -> array:
+    dist, _ = DijkstraIdx.compute(_GRAFO_WORKER, s)
+    return dist
+
+
+def _hay_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class MatrizDistancias:
+    # Floyd–Warshall si V <= FLOYD_MAX_V, o si V <= FLOYD_DENSO_MAX_V y el grafo es denso
+    FLOYD_MAX_V = 200
+    FLOYD_DENSO_MAX_V = 3000
+    DENSIDAD_MIN = 0.05
+    # por debajo de esto no vale la pena levantar procesos
+    POOL_MIN_V = 1000
+
+    @staticmethod
+    def metodo(g) -> str:
+        """
+        Elige "floyd" o "dijkstra" para g. Decide primero por tamaño y densidad: NumPy sólo
+        se importa (para ver si está) cuando ganaría Floyd.
+        """
+        n = g.vertex_count
+        chico_o_denso = n <= MatrizDistancias.FLOYD_MAX_V or (
+            n <= MatrizDistancias.FLOYD_DENSO_MAX_V and len(g.targets) >= MatrizDistancias.DENSIDAD_MIN * n * n
+        )
+        return "floyd" if chico_o_denso and _hay_numpy() else "dijkstra"
+
+    @staticmethod
+    def filas(g, metodo: str = "auto", procesos: Optional[int] = None) -> Iterator[Tuple[int, Sequence[float]]]:
+        """
+        Genera (origen, fila) con los orígenes en orden alfabético (g.rangos()).
+        fila[v] es la distancia del origen a v (inf si no hay camino).
+        """
+        if metodo == "auto":
+            metodo = MatrizDistancias.metodo(g)
+        _, por_rank = g.rangos()
+        fuentes = list(por_rank)
+        if metodo == "floyd" and _hay_numpy():
+            return MatrizDistancias._filas_floyd(g, fuentes)
+        if metodo == "floyd":
+            metodo = "dijkstra"     # sin NumPy: mismas distancias, un Dijkstra por origen
+        if metodo == "dijkstra":
+            return MatrizDistancias._filas_dijkstra(g, fuentes, procesos)
+        raise ValueError(f"método de matriz desconocido: {metodo}")
+
+    @staticmethod
+    def _filas_floyd(g, fuentes: List[int]) -> Iterator[Tuple[int, Sequence[float]]]:
+        import numpy as np
+
+        n = g.vertex_count
+        D = np.full((n, n), np.inf)
+        if n:
+            offsets = np.asarray(g.offsets, dtype=np.int64)
+            filas = np.repeat(np.arange(n), np.diff(offsets))
+            D[filas, np.asarray(g.targets, dtype=np.int64)] = np.asarray(g.weights, dtype=np.float64)
+            np.fill_diagonal(D, 0.0)
+        for k in range(n):
+            np.minimum(D, D[:, k, None] + D[None, k, :], out=D)
+        if contadores.ACTIVO:
+            contadores.sumar(n, n ** 3)
+        for s in fuentes:
+            yield s, D[s].tolist()
+
+    @staticmethod
+    def _filas_dijkstra(g, fuentes: List[int], procesos: Optional[int]) -> Iterator[Tuple[int, Sequence[float]]]:
+        global _GRAFO_WORKER
+        procesos = procesos or os.cpu_count() or 1
+        usar_pool = procesos > 1 and g.vertex_count >= MatrizDistancias.POOL_MIN_V
+        if usar_pool:
+            import multiprocessing      # sólo con pool: fuera del arranque
+            usar_pool = "fork" in multiprocessing.get_all_start_methods()
+        if not usar_pool:
+            for s in fuentes:
+                yield s, DijkstraIdx.compute(g, s)[0]
+            return
+
+        _GRAFO_WORKER = g
+        ventana = procesos * 4      # filas en vuelo: memoria acotada aunque la escritura sea lenta
+        try:
+            with multiprocessing.get_context("fork").Pool(procesos) as pool:
+                for i in range(0, len(fuentes), ventana):
+                    lote = fuentes[i:i + ventana]
+                    for s, fila in zip(lote, pool.map(_fila_worker, lote)):
+                        yield s, fila
+        finally:
+            _GRAFO_WORKER = None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import heapq
-from typing import List, Tuple
+from array import array
+from typing import Iterable, List, Set, Tuple
 
 # -------------------------
 # Union-Find (clase con estado)
@@ -27,6 +28,102 @@ class UnionFind:
             self.rank[ra] += 1
         return True
 
+class UnionFindIdx:
+    """Union-Find sobre índices 0..n-1 con arrays preasignados (sin hashing)."""
+    __slots__ = ("parent", "rank")
+    def __init__(self, n: int):
+        self.parent = array("q", range(n))
+        self.rank   = bytearray(n)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        # path halving: iterativo, sin recursión
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+        return True
+
+class UnionFindMiembros:
+    """
+    Union-Find sobre índices con tamaño y miembros por componente. Cada vértice guarda
+    directamente la etiqueta de su componente (find en O(1)); la unión re-etiqueta el
+    componente chico, y separar() parte un componente re-etiquetando sólo el grupo que sale.
+    Crece de a un vértice con agregar().
+    """
+    __slots__ = ("etiqueta", "size", "miembros", "libres", "cantidad")
+    def __init__(self, n: int = 0):
+        self.etiqueta = array("q", range(n))
+        self.size = array("q", [1]) * n                 # por etiqueta
+        self.miembros: List[Set[int]] = [{i} for i in range(n)]
+        self.libres: List[int] = []                     # etiquetas sin componente
+        self.cantidad = n                               # cantidad de componentes
+
+    def _nueva_etiqueta(self, grupo: Set[int]) -> int:
+        if self.libres:
+            e = self.libres.pop()
+            self.size[e] = len(grupo)
+            self.miembros[e] = grupo
+        else:
+            e = len(self.miembros)
+            self.size.append(len(grupo))
+            self.miembros.append(grupo)
+        for x in grupo:
+            self.etiqueta[x] = e
+        self.cantidad += 1
+        return e
+
+    def agregar(self) -> int:
+        i = len(self.etiqueta)
+        self.etiqueta.append(0)
+        self._nueva_etiqueta({i})
+        return i
+
+    def find(self, x: int) -> int:
+        return self.etiqueta[x]
+
+    def union(self, a: int, b: int) -> bool:
+        ea, eb = self.etiqueta[a], self.etiqueta[b]
+        if ea == eb:
+            return False
+        if self.size[ea] < self.size[eb]:
+            ea, eb = eb, ea
+        for x in self.miembros[eb]:
+            self.etiqueta[x] = ea
+        self.size[ea] += self.size[eb]
+        self.miembros[ea] |= self.miembros[eb]
+        self.miembros[eb] = set()
+        self.size[eb] = 0
+        self.libres.append(eb)
+        self.cantidad -= 1
+        return True
+
+    def separar(self, grupo: Iterable[int]) -> int:
+        """
+        Saca 'grupo' (vértices de un mismo componente) a un componente propio.
+        Cuesta O(len(grupo)): conviene pasar el lado chico. Devuelve su etiqueta.
+        """
+        grupo = set(grupo)
+        e = self.etiqueta[next(iter(grupo))]
+        if len(grupo) == self.size[e]:
+            return e
+        self.miembros[e] -= grupo
+        self.size[e] -= len(grupo)
+        return self._nueva_etiqueta(grupo)
+
+    def componente(self, x: int) -> Set[int]:
+        return self.miembros[self.etiqueta[x]]
+
 # Helper peso
 def _w(g, u: str, v: str) -> float:
     if hasattr(g, "get_weight"):
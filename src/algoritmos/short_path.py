@@ -1,6 +1,9 @@
 from __future__ import annotations
 import heapq
-from typing import Dict, Optional, Tuple, Set, List
+from array import array
+from typing import Dict, Iterable, Optional, Tuple, Set, List
+
+from . import contadores
 
 def _w(g, u: str, v: str) -> float:
     # Usa get_weight si existe; si no, 1.0
@@ -23,6 +26,8 @@ class Dijkstra:
         dist: Dict[str, float] = {s: 0.0}
         parent: Dict[str, Optional[str]] = {s: None}
         pq = [(0.0, s)]
+        push = 1
+        expandidos = relajadas = 0
 
         while pq:
             d, u = heapq.heappop(pq)
@@ -30,7 +35,10 @@ class Dijkstra:
                 continue
             if t is not None and u == t:
                 break
-            for v in g.get_adjacency_list(u):
+            vecinos = g.get_adjacency_list(u)
+            expandidos += 1
+            relajadas += len(vecinos)
+            for v in vecinos:
                 if v in banned:
                     continue
                 nd = d + _w(g, u, v)
@@ -38,6 +46,9 @@ class Dijkstra:
                     dist[v] = nd
                     parent[v] = u
                     heapq.heappush(pq, (nd, v))
+                    push += 1
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas, push, push - len(pq))
         return dist, parent
 
     @staticmethod
@@ -50,3 +61,237 @@ class Dijkstra:
             out.append(cur)
             cur = parent[cur]
         return out[::-1]
+
+
+def _holgura(x: float) -> float:
+    # tolerancia relativa para comparar sumas de pesos calculadas por caminos distintos
+    return x + 1e-9 * abs(x) + 1e-12
+
+
+class DijkstraIdx:
+    @staticmethod
+    def compute(g, s: int, t: Optional[int] = None, banned: Optional[Iterable[int]] = None) -> Tuple[array, array]:
+        """
+        Dijkstra sobre índices de un GrafoCSR. Retorna (dist, parent) como arrays de largo V:
+        dist[v] = inf si no se alcanzó, parent[v] = -1 si no se alcanzó y parent[s] = s.
+        Desempata por nombre (vía g.rangos()), igual que Dijkstra.compute.
+        """
+        n = g.vertex_count
+        dist = array("d", [float("inf")]) * n
+        parent = array("q", [-1]) * n
+        bloqueado = bytearray(n)
+        for b in banned or ():
+            bloqueado[b] = 1
+        if bloqueado[s]:
+            return dist, parent
+
+        rank, por_rank = g.rangos()
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        dist[s] = 0.0
+        parent[s] = s
+        pq = [(0.0, rank[s])]
+        push = 1
+        expandidos = relajadas = 0
+
+        while pq:
+            d, r = heapq.heappop(pq)
+            u = por_rank[r]
+            if d != dist[u]:
+                continue
+            if u == t:
+                break
+            expandidos += 1
+            fila = range(offsets[u], offsets[u + 1])
+            relajadas += len(fila)
+            for k in fila:
+                v = targets[k]
+                if bloqueado[v]:
+                    continue
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(pq, (nd, rank[v]))
+                    push += 1
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas, push, push - len(pq))
+        return dist, parent
+
+    @staticmethod
+    def uno_a_muchos(g, s: int, destinos: Iterable[int], banned: Optional[Iterable[int]] = None) -> Tuple[array, array]:
+        """
+        Una sola búsqueda desde s que corta cuando fijó todos los 'destinos'.
+        Para cada destino, dist[t] y path(parent, t) son los mismos que compute(g, s, t, banned).
+        """
+        n = g.vertex_count
+        dist = array("d", [float("inf")]) * n
+        parent = array("q", [-1]) * n
+        bloqueado = bytearray(n)
+        for b in banned or ():
+            bloqueado[b] = 1
+        if bloqueado[s]:
+            return dist, parent
+        pendientes = {t for t in destinos if not bloqueado[t]}
+
+        rank, por_rank = g.rangos()
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        dist[s] = 0.0
+        parent[s] = s
+        pq = [(0.0, rank[s])]
+        push = 1
+        expandidos = relajadas = 0
+
+        while pq and pendientes:
+            d, r = heapq.heappop(pq)
+            u = por_rank[r]
+            if d != dist[u]:
+                continue
+            pendientes.discard(u)
+            expandidos += 1
+            fila = range(offsets[u], offsets[u + 1])
+            relajadas += len(fila)
+            for k in fila:
+                v = targets[k]
+                if bloqueado[v]:
+                    continue
+                nd = d + weights[k]
+                if nd < dist[v]:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(pq, (nd, rank[v]))
+                    push += 1
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas, push, push - len(pq))
+        return dist, parent
+
+    @staticmethod
+    def bidireccional(g, s: int, t: int, banned: Optional[Iterable[int]] = None) -> Tuple[array, array]:
+        """
+        Dijkstra bidireccional punto a punto (grafo NO dirigido).
+        Mismo contrato que compute(g, s, t, banned) para el destino: dist[t] y path(parent, t)
+        coinciden exactamente, incluido el desempate por nombre.
+
+        Fase 1: búsquedas desde s y desde t hasta que tope_f + tope_b supera a mu (mejor s-t visto).
+          Así todo vértice de un camino mínimo quedó fijado por alguno de los dos lados.
+        Fase 2: se continúa la búsqueda hacia adelante sólo por vértices fijados desde t que
+          cumplen dist_f + dist_b <= mu, hasta sacar t. Los parent quedan como en compute.
+        """
+        if not getattr(g, "no_dirigido", True):
+            return DijkstraIdx.compute(g, s, t, banned)
+
+        n = g.vertex_count
+        INF = float("inf")
+        dist = array("d", [INF]) * n
+        parent = array("q", [-1]) * n
+        bloqueado = bytearray(n)
+        for b in banned or ():
+            bloqueado[b] = 1
+        if bloqueado[s] or bloqueado[t]:
+            return dist, parent
+        dist[s] = 0.0
+        parent[s] = s
+        if s == t:
+            return dist, parent
+
+        rank, por_rank = g.rangos()
+        offsets, targets, weights = g.offsets, g.targets, g.weights
+        dist_b = array("d", [INF]) * n
+        dist_b[t] = 0.0
+        fijo_b = bytearray(n)
+        pq_f = [(0.0, rank[s])]
+        pq_b = [(0.0, t)]
+        mu = INF
+        push = 2
+        expandidos = relajadas = 0
+        llego = False
+
+        # ---- fase 1: búsqueda alternada ----
+        while pq_f and pq_b:
+            if pq_f[0][0] + pq_b[0][0] > _holgura(mu):
+                break
+            if pq_f[0][0] <= pq_b[0][0]:
+                d, r = heapq.heappop(pq_f)
+                u = por_rank[r]
+                if d != dist[u]:
+                    continue
+                if u == t:
+                    llego = True
+                    break
+                expandidos += 1
+                fila = range(offsets[u], offsets[u + 1])
+                relajadas += len(fila)
+                for k in fila:
+                    v = targets[k]
+                    if bloqueado[v]:
+                        continue
+                    nd = d + weights[k]
+                    if nd < dist[v]:
+                        dist[v] = nd
+                        parent[v] = u
+                        heapq.heappush(pq_f, (nd, rank[v]))
+                        push += 1
+                    if nd + dist_b[v] < mu:
+                        mu = nd + dist_b[v]
+            else:
+                d, u = heapq.heappop(pq_b)
+                if d != dist_b[u] or fijo_b[u]:
+                    continue
+                fijo_b[u] = 1
+                expandidos += 1
+                fila = range(offsets[u], offsets[u + 1])
+                relajadas += len(fila)
+                for k in fila:
+                    v = targets[k]
+                    if bloqueado[v]:
+                        continue
+                    nd = d + weights[k]
+                    if nd < dist_b[v]:
+                        dist_b[v] = nd
+                        heapq.heappush(pq_b, (nd, v))
+                        push += 1
+                    if nd + dist[v] < mu:
+                        mu = nd + dist[v]
+
+        if llego or mu == INF:
+            if contadores.ACTIVO:
+                contadores.sumar(expandidos, relajadas, push, push - len(pq_f) - len(pq_b))
+            return dist, parent
+
+        # ---- fase 2: completar hacia adelante sólo sobre candidatos a camino mínimo ----
+        limite = _holgura(mu)
+        while pq_f:
+            d, r = heapq.heappop(pq_f)
+            u = por_rank[r]
+            if d != dist[u]:
+                continue
+            if u == t:
+                break
+            if not fijo_b[u] or d + dist_b[u] > limite:
+                continue
+            expandidos += 1
+            fila = range(offsets[u], offsets[u + 1])
+            relajadas += len(fila)
+            for k in fila:
+                v = targets[k]
+                if bloqueado[v] or not fijo_b[v]:
+                    continue
+                nd = d + weights[k]
+                if nd < dist[v] and nd + dist_b[v] <= limite:
+                    dist[v] = nd
+                    parent[v] = u
+                    heapq.heappush(pq_f, (nd, rank[v]))
+                    push += 1
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas, push, push - len(pq_f) - len(pq_b))
+        return dist, parent
+
+    @staticmethod
+    def path(parent: array, t: int) -> List[int]:
+        if parent[t] == -1:
+            return []
+        out: List[int] = [t]
+        cur = t
+        while parent[cur] != cur:
+            cur = parent[cur]
+            out.append(cur)
+        return out[::-1]
@@ -1,6 +1,9 @@
 from __future__ import annotations
+from array import array
 from collections import deque
-from typing import Dict, List, Optional, Set
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from . import contadores
 
 class BFS:
     @staticmethod
@@ -17,18 +20,24 @@ class BFS:
         dist: Dict[str, int] = {s: 0}
         parent: Dict[str, Optional[str]] = {s: None}
         orden: List[str] = [s]
+        expandidos = relajadas = 0
 
         while q:
             u = q.popleft()
             if t is not None and u == t:
                 break
-            for v in g.get_adjacency_list(u):
+            vecinos = g.get_adjacency_list(u)
+            expandidos += 1
+            relajadas += len(vecinos)
+            for v in vecinos:
                 if v in banned or v in dist:
                     continue
                 dist[v] = dist[u] + 1
                 parent[v] = u
                 q.append(v)
                 orden.append(v)
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas)
         return dist, parent, orden
 
     @staticmethod
@@ -43,6 +52,145 @@ class BFS:
         return out[::-1]
 
 
+class BFSIdx:
+    @staticmethod
+    def compute(g, s: int, t: Optional[int] = None, banned: Optional[Iterable[int]] = None) -> Tuple[array, array, List[int]]:
+        """
+        BFS sobre índices de un GrafoCSR.
+        Retorna (dist, parent, orden): dist[v] = -1 si no se alcanzó, parent[s] = s.
+        """
+        n = g.vertex_count
+        dist = array("q", [-1]) * n
+        parent = array("q", [-1]) * n
+        bloqueado = bytearray(n)
+        for b in banned or ():
+            bloqueado[b] = 1
+        if bloqueado[s]:
+            return dist, parent, []
+
+        offsets, targets = g.offsets, g.targets
+        dist[s] = 0
+        parent[s] = s
+        orden: List[int] = [s]
+        q = deque([s])
+        expandidos = relajadas = 0
+
+        while q:
+            u = q.popleft()
+            if u == t:
+                break
+            du = dist[u] + 1
+            expandidos += 1
+            fila = range(offsets[u], offsets[u + 1])
+            relajadas += len(fila)
+            for k in fila:
+                v = targets[k]
+                if bloqueado[v] or dist[v] != -1:
+                    continue
+                dist[v] = du
+                parent[v] = u
+                q.append(v)
+                orden.append(v)
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas)
+        return dist, parent, orden
+
+
+class BFSMultiorigen:
+    # desde este tamaño conviene la versión con fronteras de NumPy (si está instalado)
+    NUMPY_MIN_V = 20000
+
+    @staticmethod
+    def compute(g, fuentes: Sequence[int], usar_numpy: Optional[bool] = None) -> Tuple[array, array]:
+        """
+        BFS por niveles desde varias fuentes a la vez sobre un GrafoCSR, O(V + E).
+        Retorna (dist, dueno): dist[v] = -1 si no se alcanzó; dueno[v] = posición en
+        'fuentes' de la fuente que se queda con v: la de menor posición entre las más
+        cercanas (con las fuentes ordenadas por nombre, desempata por nombre).
+        """
+        n = g.vertex_count
+        if usar_numpy is None:
+            usar_numpy = n >= BFSMultiorigen.NUMPY_MIN_V
+        if usar_numpy:
+            try:
+                return BFSMultiorigen._compute_numpy(g, fuentes)
+            except ImportError:
+                pass
+
+        offsets, targets = g.offsets, g.targets
+        dist = array("q", [-1]) * n
+        dueno = array("q", [-1]) * n
+        frontera: List[int] = []
+        for r, s in enumerate(fuentes):
+            if dist[s] == -1:
+                dist[s] = 0
+                dueno[s] = r
+                frontera.append(s)
+        d = 0
+        expandidos = relajadas = 0
+        while frontera:
+            # los dueños del nivel d ya son definitivos: sólo los escribe el nivel d - 1
+            d += 1
+            siguiente: List[int] = []
+            expandidos += len(frontera)
+            for u in frontera:
+                r = dueno[u]
+                fila = range(offsets[u], offsets[u + 1])
+                relajadas += len(fila)
+                for k in fila:
+                    v = targets[k]
+                    if dist[v] == -1:
+                        dist[v] = d
+                        dueno[v] = r
+                        siguiente.append(v)
+                    elif dist[v] == d and r < dueno[v]:
+                        dueno[v] = r
+            frontera = siguiente
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas)
+        return dist, dueno
+
+    @staticmethod
+    def _compute_numpy(g, fuentes: Sequence[int]) -> Tuple[array, array]:
+        import numpy as np
+
+        n = g.vertex_count
+        offsets = np.asarray(g.offsets, dtype=np.int64)
+        targets = np.asarray(g.targets, dtype=np.int64)
+        dist = np.full(n, -1, dtype=np.int64)
+        dueno = np.full(n, -1, dtype=np.int64)
+        # la primera aparición de cada fuente tiene la menor posición
+        f = np.asarray(fuentes, dtype=np.int64)
+        f, primera = np.unique(f, return_index=True)
+        dist[f] = 0
+        dueno[f] = primera
+        frontera = f
+        d = 0
+        expandidos = relajadas = 0
+        while frontera.size:
+            d += 1
+            inicio = offsets[frontera]
+            largo = offsets[frontera + 1] - inicio
+            total = int(largo.sum())
+            expandidos += int(frontera.size)
+            relajadas += total
+            if not total:
+                break
+            # ids de las aristas salientes de toda la frontera, sin bucles de Python
+            base = np.repeat(inicio - np.cumsum(largo) + largo, largo)
+            vecinos = targets[base + np.arange(total)]
+            candidatos = np.repeat(dueno[frontera], largo)
+            nuevos = dist[vecinos] == -1
+            vecinos, candidatos = vecinos[nuevos], candidatos[nuevos]
+            dueno[vecinos] = n + len(fuentes)
+            np.minimum.at(dueno, vecinos, candidatos)
+            frontera = np.unique(vecinos)
+            dist[frontera] = d
+        if contadores.ACTIVO:
+            contadores.sumar(expandidos, relajadas)
+        return array("q", dist.tobytes()), array("q", dueno.tobytes())
+
+
 class DFS:
     @staticmethod
     def compute(g, s: str, banned: Optional[Set[str]] = None) -> List[str]:
@@ -55,15 +203,20 @@ class DFS:
         vis = {s}
         stack = [s]
         preorder: List[str] = []
+        relajadas = 0
 
         while stack:
             u = stack.pop()
             preorder.append(u)
             # determinismo opcional: recorrer vecinos en orden inverso
-            for v in sorted(g.get_adjacency_list(u), reverse=True):
+            vecinos = sorted(g.get_adjacency_list(u), reverse=True)
+            relajadas += len(vecinos)
+            for v in vecinos:
                 if v not in vis and v not in banned:
                     vis.add(v)
                     stack.append(v)
+        if contadores.ACTIVO:
+            contadores.sumar(len(preorder), relajadas)
         return preorder
 
 
@@ -75,6 +228,7 @@ class ComponentesConexos:
         """
         vis: Set[str] = set()
         comps: List[List[str]] = []
+        relajadas = 0
         for s in sorted(getattr(g, "vertices", lambda: [])()):
             if s in vis:
                 continue
@@ -84,9 +238,13 @@ class ComponentesConexos:
             while stack:
                 u = stack.pop()
                 comp.append(u)
-                for v in g.get_adjacency_list(u):
+                vecinos = g.get_adjacency_list(u)
+                relajadas += len(vecinos)
+                for v in vecinos:
                     if v not in vis:
                         vis.add(v)
                         stack.append(v)
             comps.append(sorted(comp))
+        if contadores.ACTIVO:
+            contadores.sumar(len(vis), relajadas)
         return comps
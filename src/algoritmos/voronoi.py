@@ -0,0 +1,148 @@
+"""
+Asignación incremental de barrios a plantas (regiones de Voronoi en cantidad de aristas).
+
+Cada barrio guarda (distancia, dueño): la planta más cercana y, en empate, la de nombre
+menor (mismo criterio que BFSMultiorigen). Al cambiar el conjunto de plantas sólo se toca
+lo que cambia:
+- agregar p: BFS desde p que sólo avanza por los barrios que p le gana a su dueño actual
+  (esa región es cerrada hacia p, así que no se pierde ninguno);
+- quitar p: sólo se reasignan los barrios que eran de p, sembrados desde su borde con
+  (distancia + 1, dueño) de los vecinos de afuera y propagados por niveles.
+"""
+
+from __future__ import annotations
+import heapq
+from array import array
+from typing import Dict, Iterable, List, Set
+
+from ..grafo.grafo_csr import GrafoCSR
+from . import contadores
+from .traversal import BFSMultiorigen
+
+
+class AsignacionPlantas:
+    def __init__(self, g, plantas: Iterable[int] = ()):
+        """g se congela a CSR; 'plantas' son índices de vértices."""
+        self.g: GrafoCSR = GrafoCSR.from_grafo(g)
+        self.rank, _ = self.g.rangos()
+        n = self.g.vertex_count
+        self.plantas: Set[int] = set(plantas)
+        fuentes = sorted(self.plantas, key=lambda p: self.rank[p])
+        self.dist, pos = BFSMultiorigen.compute(self.g, fuentes)
+        self.dueno = array("q", [-1]) * n       # índice de la planta dueña, -1 = sin planta
+        for v in range(n):
+            if pos[v] != -1:
+                self.dueno[v] = fuentes[pos[v]]
+        self.tocados = 0            # barrios revisados por la última actualización
+        self.aristas_revisadas = 0  # aristas miradas por la última actualización
+
+    def _gana(self, d: int, p: int, v: int) -> bool:
+        """True si la planta p a distancia d le gana v a su dueño actual."""
+        dv = self.dist[v]
+        if dv == -1 or d < dv:
+            return True
+        return d == dv and self.rank[p] < self.rank[self.dueno[v]]
+
+    def agregar(self, p: int):
+        if p in self.plantas:
+            return
+        self.plantas.add(p)
+        offsets, targets = self.g.offsets, self.g.targets
+        dist, dueno = self.dist, self.dueno
+        dist[p] = 0
+        dueno[p] = p
+        frontera = [p]
+        tocados = 1
+        revisadas = 0
+        d = 0
+        while frontera:
+            d += 1
+            siguiente: List[int] = []
+            for u in frontera:
+                revisadas += offsets[u + 1] - offsets[u]
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if dueno[v] != p and self._gana(d, p, v):
+                        dist[v] = d
+                        dueno[v] = p
+                        siguiente.append(v)
+            tocados += len(siguiente)
+            frontera = siguiente
+        self.tocados = tocados
+        self.aristas_revisadas = revisadas
+        if contadores.ACTIVO:
+            contadores.sumar(tocados, revisadas)
+
+    def quitar(self, p: int):
+        if p not in self.plantas:
+            return
+        self.plantas.discard(p)
+        offsets, targets = self.g.offsets, self.g.targets
+        dist, dueno, rank = self.dist, self.dueno, self.rank
+
+        # región de p: sus barrios son conexos vía caminos mínimos desde p
+        region = [p]
+        en_region = {p}
+        revisadas = 0
+        i = 0
+        while i < len(region):
+            u = region[i]
+            i += 1
+            revisadas += offsets[u + 1] - offsets[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if dueno[v] == p and v not in en_region:
+                    en_region.add(v)
+                    region.append(v)
+        self.tocados = len(region)
+        for v in region:
+            dist[v] = -1
+            dueno[v] = -1
+
+        # semillas desde el borde, por niveles (los dueños de un nivel se cierran antes
+        # de propagar al siguiente, como en el BFS multi-origen)
+        mejor: Dict[int, tuple] = {}
+        niveles: Dict[int, List[int]] = {}
+        for v in region:
+            for k in range(offsets[v], offsets[v + 1]):
+                u = targets[k]
+                if u in en_region or dueno[u] == -1:
+                    continue
+                cand = (dist[u] + 1, rank[dueno[u]], dueno[u])
+                if v not in mejor or cand < mejor[v]:
+                    mejor[v] = cand
+            if v in mejor:
+                niveles.setdefault(mejor[v][0], []).append(v)
+        revisadas *= 2              # al sembrar se vuelve a mirar cada barrio de la región
+        pendientes = list(niveles)
+        heapq.heapify(pendientes)
+        while pendientes:
+            d = heapq.heappop(pendientes)
+            for v in niveles.pop(d):
+                if dist[v] != -1 or mejor[v][0] != d:
+                    continue
+                dist[v] = d
+                dueno[v] = mejor[v][2]
+                revisadas += offsets[v + 1] - offsets[v]
+                cand = (d + 1, rank[dueno[v]], dueno[v])
+                for k in range(offsets[v], offsets[v + 1]):
+                    w = targets[k]
+                    if w not in en_region or dist[w] != -1:
+                        continue
+                    if w not in mejor or cand < mejor[w]:
+                        mejor[w] = cand
+                        if d + 1 not in niveles:
+                            niveles[d + 1] = []
+                            heapq.heappush(pendientes, d + 1)
+                        niveles[d + 1].append(w)
+        self.aristas_revisadas = revisadas
+        if contadores.ACTIVO:
+            contadores.sumar(self.tocados, revisadas)
+
+    def fijar(self, plantas: Iterable[int]):
+        """Lleva el conjunto de plantas a 'plantas' con los agregados/quitados necesarios."""
+        nuevas = set(plantas)
+        for p in sorted(self.plantas - nuevas):
+            self.quitar(p)
+        for p in sorted(nuevas - self.plantas):
+            self.agregar(p)
@@ -0,0 +1,246 @@
+"""
+Benchmark de escalado: genera ciudades sintéticas (src.generadores) de varios tamaños y mide
+la carga de los grafos, la preparación del procesador y cada tipo de consulta de
+process_queries. El resultado es un JSON con tiempo (s) y pico de memoria (bytes) de cada paso.
+
+Medición:
+- cada caso (generador, n) corre en un proceso propio, así la memoria de uno no afecta al otro;
+- cada tipo de consulta corre dos veces en procesos hijos (fork) con los grafos ya cargados:
+  una cronometrada y otra con tracemalloc para el pico de memoria (tracemalloc frena el
+  cálculo, por eso no se mezclan). Así todas arrancan con los cachés fríos;
+- sin fork (Windows) todo corre en el mismo proceso y los cachés quedan tibios.
+
+Con --ch, además se preprocesa ContractionHierarchies sobre el grafo vial, se responden con él
+los CAMINO_MINIMO y se agrega su reporte() (preproceso, atajos, latencia por consulta) junto
+con las discrepancias de ContractionHierarchies.verificar() contra Dijkstra en una muestra.
+
+Uso:
+    python -m src.benchmark [--generadores grilla,geometrico,...] [--tamanos 1000,10000]
+                            [--semilla S] [--salida resultados.json] [--csr] [--ch]
+
+GrafoAdyacencia guarda una matriz V×V, así que por encima de ADYACENCIA_MAX_V barrios (o
+siempre, con --csr) los grafos se cargan como GrafoCSR; el reporte indica cuál se usó.
+"""
+
+from __future__ import annotations
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+from src import __version__
+from src.generadores import GENERADORES, generar
+from src.main import ProcesadorConsultas, crear_motor, load_graph, load_weighted_graph
+
+TAMANOS = (1000, 10000, 100000)
+# GrafoAdyacencia guarda una matriz V×V: por encima de este tamaño se carga como GrafoCSR
+# (inmutable: OUTAGE responde que no está soportado)
+ADYACENCIA_MAX_V = 5000
+# pares de CAMINO_MINIMO que --ch vuelve a calcular con Dijkstra para verificar
+CH_VERIFICAR = 20
+
+
+def _en_hijo(fn: Callable[[], Any]) -> Any:
+    """Resultado de fn() calculado en un proceso hijo (fork); sin fork, en este mismo proceso."""
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return fn()
+    contexto = multiprocessing.get_context("fork")
+    recibir, enviar = contexto.Pipe(duplex=False)
+
+    def correr():
+        try:
+            enviar.send((True, fn()))
+        except BaseException as e:      # el error viaja al padre como texto
+            enviar.send((False, f"{type(e).__name__}: {e}"))
+
+    proceso = contexto.Process(target=correr)
+    proceso.start()
+    enviar.close()
+    try:
+        ok, valor = recibir.recv()
+    except EOFError:
+        ok, valor = False, f"el proceso terminó con código {proceso.exitcode}"
+    proceso.join()
+    if not ok:
+        raise RuntimeError(valor)
+    return valor
+
+
+def _cronometrar(fn: Callable[[], Any]) -> Tuple[float, Any]:
+    t0 = time.perf_counter()
+    resultado = fn()
+    return time.perf_counter() - t0, resultado
+
+
+def _pico(fn: Callable[[], Any]) -> int:
+    """Pico de memoria de Python (bytes, tracemalloc) reservada durante fn()."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _medir(fn: Callable[[], Any]) -> Dict[str, float]:
+    return {
+        "segundos": _en_hijo(lambda: _cronometrar(fn)[0]),
+        "pico_bytes": _en_hijo(lambda: _pico(fn)),
+    }
+
+
+def _consultas_por_tipo(lineas: List[str]) -> Dict[str, List[str]]:
+    tipos: Dict[str, List[str]] = {}
+    for line in lineas:
+        tipos.setdefault(line.split()[0].upper(), []).append(line)
+    return tipos
+
+
+def _responder_todas(procesador: ProcesadorConsultas, lineas: List[str]) -> int:
+    """Responde 'lineas' como process_queries (lote + formateo completo); devuelve los caracteres."""
+    procesador.preparar(lineas)
+    return sum(
+        len(salida) if isinstance(salida, str) else sum(map(len, salida))
+        for line in lineas
+        for salida in procesador.responder(line)
+    )
+
+
+def _reporte_ch(grafos, consultas: List[str]) -> Dict[str, Any]:
+    """reporte() de ContractionHierarchies tras responder los CAMINO_MINIMO, más la verificación."""
+    motor = crear_motor(grafos[1], "ch")
+    lineas = [line for line in consultas if line.split()[0].upper() == "CAMINO_MINIMO"]
+    _responder_todas(ProcesadorConsultas(*grafos, motor=motor), lineas)
+    reporte: Dict[str, Any] = dict(motor.reporte())
+    idx = motor.g.name_to_idx
+    pares = [
+        (idx[tokens[1]], idx[tokens[2]])
+        for tokens in (line.split() for line in lineas[:CH_VERIFICAR])
+        if len(tokens) >= 3 and tokens[1] in idx and tokens[2] in idx
+    ]
+    reporte["verificados"] = len(pares)
+    reporte["discrepancias"] = len(motor.verificar(pares))
+    return reporte
+
+
+def _caso(tipo: str, n: int, semilla: int, directorio: str, csr: bool, ch: bool = False) -> Dict[str, Any]:
+    ciudad = generar(tipo, n, semilla)
+    rutas = ciudad.escribir(directorio)
+    consultas = ciudad.consultas
+    del ciudad
+
+    def cargar():
+        return (
+            load_graph(rutas["electrico"], csr=csr),
+            load_weighted_graph(rutas["vial"], csr=csr),
+            load_graph(rutas["hidrico"], csr=csr),
+        )
+
+    resultado: Dict[str, Any] = {
+        "generador": tipo, "n": n, "semilla": semilla, "representacion": "csr" if csr else "adyacencia",
+    }
+    resultado["carga"] = {"pico_bytes": _en_hijo(lambda: _pico(cargar))}
+    resultado["carga"]["segundos"], grafos = _cronometrar(cargar)
+    resultado["vertices"] = {k: g.vertex_count for k, g in zip(("electrico", "vial", "hidrico"), grafos)}
+    resultado["aristas"] = {k: g.edge_count for k, g in zip(("electrico", "vial", "hidrico"), grafos)}
+
+    resultado["preparacion"] = {"pico_bytes": _en_hijo(lambda: _pico(lambda: ProcesadorConsultas(*grafos)))}
+    resultado["preparacion"]["segundos"], procesador = _cronometrar(lambda: ProcesadorConsultas(*grafos))
+
+    resultado["consultas"] = {}
+    for op, lineas in _consultas_por_tipo(consultas).items():
+        medida: Dict[str, Any] = {"lineas": len(lineas)}
+        try:
+            medida.update(_medir(lambda: _responder_todas(procesador, lineas)))
+        except RuntimeError as e:
+            medida["error"] = str(e)
+        resultado["consultas"][op] = medida
+    if ch:
+        try:
+            resultado["ch"] = _en_hijo(lambda: _reporte_ch(grafos, consultas))
+        except RuntimeError as e:
+            resultado["ch"] = {"error": str(e)}
+    try:
+        import resource     # sólo Unix
+        resultado["maxrss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+    return resultado
+
+
+def correr(
+    generadores: Sequence[str], tamanos: Sequence[int], semilla: int = 0, csr: bool = False, progreso=None,
+    ch: bool = False,
+) -> Dict[str, Any]:
+    """
+    Corre todos los casos (generador × tamaño) y devuelve el reporte como diccionario.
+    Los grafos se cargan como GrafoCSR con csr=True o si n > ADYACENCIA_MAX_V.
+    Con ch=True cada caso agrega el reporte de ContractionHierarchies (ver _reporte_ch).
+    """
+    casos = []
+    with tempfile.TemporaryDirectory(prefix="tp-bench-") as tmp:
+        for tipo in generadores:
+            for n in tamanos:
+                directorio = os.path.join(tmp, f"{tipo}-{n}")
+                try:
+                    caso = _en_hijo(lambda: _caso(tipo, n, semilla, directorio, csr or n > ADYACENCIA_MAX_V, ch))
+                except RuntimeError as e:
+                    caso = {"generador": tipo, "n": n, "semilla": semilla, "error": str(e)}
+                casos.append(caso)
+                if progreso is not None:
+                    progreso(caso)
+    return {
+        "version": __version__,
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "semilla": semilla,
+        "casos": casos,
+    }
+
+
+def main(argv: Sequence[str]):
+    args = list(argv)
+    csr = "--csr" in args
+    ch = "--ch" in args
+    args = [a for a in args if a not in ("--csr", "--ch")]
+    opciones = {"--generadores": ",".join(GENERADORES), "--tamanos": ",".join(map(str, TAMANOS)),
+                "--semilla": "0", "--salida": "-"}
+    for opcion in list(opciones):
+        if opcion in args:
+            i = args.index(opcion)
+            opciones[opcion] = args[i + 1] if i + 1 < len(args) else None
+            del args[i:i + 2]
+    try:
+        generadores = opciones["--generadores"].split(",")
+        tamanos = [int(t) for t in opciones["--tamanos"].split(",")]
+        semilla = int(opciones["--semilla"])
+        if args or opciones["--salida"] is None or any(t not in GENERADORES for t in generadores):
+            raise ValueError
+    except (AttributeError, ValueError):
+        print("Usage: python -m src.benchmark [--generadores grilla,geometrico,cadenas,alimentadores] "
+              "[--tamanos 1000,10000,100000] [--semilla S] [--salida resultados.json] [--csr] [--ch]")
+        sys.exit(1)
+
+    def progreso(caso):
+        estado = caso.get("error") or f"{caso['representacion']}, carga {caso['carga']['segundos']:.2f} s"
+        if "ch" in caso and "error" not in caso["ch"]:
+            estado += f", CH {caso['ch']['atajos']} atajos en {caso['ch']['preproceso_seg']:.2f} s"
+        print(f"  {caso['generador']:>13} n={caso['n']:<8} {estado}", file=sys.stderr)
+
+    reporte = correr(generadores, tamanos, semilla, csr, progreso, ch)
+    texto = json.dumps(reporte, indent=2, ensure_ascii=False)
+    if opciones["--salida"] == "-":
+        print(texto)
+    else:
+        with open(opciones["--salida"], "w", encoding="utf-8") as f:
+            f.write(texto + "\n")
+        print(f"✓ Benchmark saved to: {opciones['--salida']}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,44 @@
+"""
+Cache LRU acotado para resultados de consultas.
+Las claves son (operación, argumentos normalizados, identidad del grafo).
+"""
+
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class CacheConsultas:
+    """
+    LRU con tamaño máximo y contadores de aciertos/fallos.
+    maxsize <= 0 desactiva el cache (siempre recalcula).
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._datos: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def obtener(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        """Devuelve el valor cacheado para 'clave' o lo calcula, guarda y devuelve."""
+        if clave in self._datos:
+            self.hits += 1
+            self._datos.move_to_end(clave)
+            return self._datos[clave]
+        self.misses += 1
+        valor = calcular()
+        if self.maxsize > 0:
+            self._datos[clave] = valor
+            if len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+        return valor
+
+    def clear(self):
+        self._datos.clear()
+        self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._datos)
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._datos), "maxsize": self.maxsize}
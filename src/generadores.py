@@ -0,0 +1,215 @@
+"""
+Generadores deterministas de ciudades sintéticas en los formatos de texto del enunciado.
+
+Cada generador arma una topología de n barrios (mismo n y misma semilla → mismos archivos)
+y de ella salen las tres redes:
+- vial: todas las calles, con tiempo en minutos (por distancia en el geométrico);
+- eléctrica: las mismas conexiones menos ~1% de líneas caídas (aparecen componentes);
+- hídrica: un bosque generador más ~15% de las demás aristas (hay puentes y articulaciones).
+Además se arma un archivo de consultas con todos los tipos que entiende process_queries.
+
+Topologías:
+- grilla: ciudad en cuadrícula;
+- geometrico: puntos al azar en el cuadrado unidad unidos si están a menos de un radio;
+- cadenas: cadenas largas colgadas unas de otras, con pocos atajos (diámetro grande);
+- alimentadores: pocas subestaciones en anillo con muchas hojas cada una (grados muy altos).
+
+Uso:
+    python -m src.generadores <grilla|geometrico|cadenas|alimentadores> <n> <directorio> [--semilla S]
+"""
+
+from __future__ import annotations
+import math
+import os
+import random
+import sys
+from itertools import accumulate
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.algoritmos import UnionFindIdx
+
+Arista = Tuple[int, int]
+
+# las consultas MATRIZ_DISTANCIAS escriben V² distancias: sólo se generan hasta este tamaño
+MATRIZ_MAX_V = 2000
+
+
+def grilla(n: int, rng: random.Random) -> Tuple[List[Arista], Optional[List[float]]]:
+    columnas = max(1, math.isqrt(n))
+    aristas: List[Arista] = []
+    for i in range(n):
+        if (i + 1) % columnas and i + 1 < n:
+            aristas.append((i, i + 1))
+        if i + columnas < n:
+            aristas.append((i, i + columnas))
+    return aristas, None
+
+
+def geometrico(n: int, rng: random.Random, grado: float = 6.0) -> Tuple[List[Arista], Optional[List[float]]]:
+    """Grafo geométrico aleatorio con grado medio ~'grado'; tiempo proporcional a la distancia."""
+    radio = math.sqrt(grado / (math.pi * max(n, 1)))
+    xs = [rng.random() for _ in range(n)]
+    ys = [rng.random() for _ in range(n)]
+    # celdas de lado 'radio': sólo se comparan puntos de celdas vecinas
+    m = max(1, int(1 / radio))
+    celdas: Dict[Tuple[int, int], List[int]] = {}
+    for i in range(n):
+        celdas.setdefault((min(int(xs[i] * m), m - 1), min(int(ys[i] * m), m - 1)), []).append(i)
+    aristas: List[Arista] = []
+    pesos: List[float] = []
+    r2 = radio * radio
+    for (cx, cy), puntos in celdas.items():
+        for dx, dy in ((0, 0), (1, -1), (1, 0), (1, 1), (0, 1)):
+            otros = celdas.get((cx + dx, cy + dy))
+            if otros is None:
+                continue
+            for a in puntos:
+                for b in otros:
+                    if (dx, dy) == (0, 0) and b <= a:
+                        continue
+                    d2 = (xs[a] - xs[b]) ** 2 + (ys[a] - ys[b]) ** 2
+                    if d2 <= r2:
+                        aristas.append((min(a, b), max(a, b)))
+                        pesos.append(float(max(1, round(10 * math.sqrt(d2) / radio))))
+    return aristas, pesos
+
+
+def cadenas(n: int, rng: random.Random, largo: int = 1000) -> Tuple[List[Arista], Optional[List[float]]]:
+    """Cadenas de 'largo' barrios; cada una cuelga de un barrio de una anterior, más n/500 atajos."""
+    aristas: List[Arista] = []
+    for i in range(1, n):
+        if i % largo:
+            aristas.append((i - 1, i))
+        else:
+            aristas.append((rng.randrange(i), i))
+    vistas = set(aristas)
+    for _ in range(n // 500):
+        a, b = sorted(rng.sample(range(n), 2))
+        if (a, b) not in vistas:
+            vistas.add((a, b))
+            aristas.append((a, b))
+    return aristas, None
+
+
+def alimentadores(n: int, rng: random.Random) -> Tuple[List[Arista], Optional[List[float]]]:
+    """Subestaciones (~√n/4) en anillo; cada hoja cuelga de una (sesgado) y el 10% de dos."""
+    hubs = max(1, min(n, math.isqrt(n) // 4))
+    aristas: List[Arista] = [(i, i + 1) for i in range(hubs - 1)]
+    if hubs > 2:
+        aristas.append((0, hubs - 1))
+    # reparto tipo Zipf: las primeras subestaciones alimentan muchas más hojas
+    acumulado = list(accumulate(1 / (k + 1) for k in range(hubs)))
+    for hoja in range(hubs, n):
+        h = rng.choices(range(hubs), cum_weights=acumulado)[0]
+        aristas.append((h, hoja))
+        if rng.random() < 0.1:
+            otro = rng.randrange(hubs)
+            if otro != h:
+                aristas.append((otro, hoja))
+    return aristas, None
+
+
+GENERADORES: Dict[str, Callable] = {
+    "grilla": grilla,
+    "geometrico": geometrico,
+    "cadenas": cadenas,
+    "alimentadores": alimentadores,
+}
+
+
+class Ciudad:
+    """Las tres redes y las consultas de una ciudad sintética (aristas con nombres de barrio)."""
+
+    def __init__(self, tipo: str, n: int, semilla: int = 0):
+        if tipo not in GENERADORES:
+            raise ValueError(f"generador desconocido: {tipo} (opciones: {', '.join(GENERADORES)})")
+        self.tipo, self.n, self.semilla = tipo, n, semilla
+        rng = random.Random(f"{tipo}:{n}:{semilla}")
+        aristas, pesos = GENERADORES[tipo](n, rng)
+        ancho = len(str(max(n - 1, 0)))
+        self.nombres = [f"B{i:0{ancho}d}" for i in range(n)]     # orden alfabético = numérico
+        nombres = self.nombres
+
+        self.vial = [
+            (nombres[a], nombres[b], pesos[k] if pesos is not None else float(rng.randint(1, 15)))
+            for k, (a, b) in enumerate(aristas)
+        ]
+        self.electrico = [(nombres[a], nombres[b]) for a, b in aristas if rng.random() >= 0.01]
+        self.hidrico = [(nombres[a], nombres[b]) for a, b in _bosque_mas_extras(n, aristas, rng, 0.15)]
+        self.consultas = self._consultas(rng)
+
+    def _consultas(self, rng: random.Random) -> List[str]:
+        nombres = self.nombres
+        if len(nombres) < 2 or not self.vial:
+            return []
+        elegir = lambda k: rng.sample(nombres, min(k, len(nombres)))
+        # un vecino del origen entre los cortes, así el corte suele tocar el camino
+        u0, v0, _ = self.vial[rng.randrange(len(self.vial))]
+        lineas = ["COMPONENTES_CONEXOS ELECTRICA", "ORDEN_FALLOS ELECTRICA"]
+        lineas += [f"MISMA_RED {a} {b}" for a, b in (elegir(2) for _ in range(3))]
+        lineas += [f"CAMINO_MINIMO {a} {b}" for a, b in (elegir(2) for _ in range(5))]
+        origen, *destinos = elegir(6)
+        lineas.append(f"CAMINO_MINIMO_MULTI {origen} {{{','.join(destinos)}}}")
+        for _ in range(3):
+            destino = elegir(1)[0]
+            lineas.append(f"CAMINO_MINIMO_SIMULAR_CORTE {{{','.join([v0] + elegir(2))}}} {u0} {destino}")
+        lineas.append("CAMINO_RECOLECCION_BASURA")
+        escenarios = " ".join("{" + ",".join(elegir(2)) + "}" for _ in range(4))
+        pares = " ".join(f"{a}:{b}" for a, b in (elegir(2) for _ in range(3)))
+        lineas.append(f"BARRIDO_CORTES {escenarios} {pares}")
+        if self.n <= MATRIZ_MAX_V:
+            lineas.append("MATRIZ_DISTANCIAS")
+        lineas.append("PUENTES_Y_ARTICULACIONES")
+        lineas.append("PLANTAS_ASIGNADAS " + " ".join(sorted(elegir(3))))
+        if self.electrico:
+            caidas = [self.electrico[rng.randrange(len(self.electrico))] for _ in range(3)]
+            lineas.append("OUTAGE " + " ".join(f"{a}:{b}" for a, b in caidas) + f" {elegir(1)[0]}")
+        return lineas
+
+    def escribir(self, directorio: str) -> Dict[str, str]:
+        """Escribe grafo_electrico.txt, grafo_vial.txt, grafo_hidrico.txt y consultas.txt."""
+        os.makedirs(directorio, exist_ok=True)
+        cabecera = f"# Ciudad sintética '{self.tipo}' - {self.n} barrios (semilla {self.semilla})\n"
+        rutas = {
+            "electrico": os.path.join(directorio, "grafo_electrico.txt"),
+            "vial": os.path.join(directorio, "grafo_vial.txt"),
+            "hidrico": os.path.join(directorio, "grafo_hidrico.txt"),
+            "consultas": os.path.join(directorio, "consultas.txt"),
+        }
+        contenidos = {
+            "electrico": (f"{u} {v}\n" for u, v in self.electrico),
+            "vial": (f"{u} {v} {w:g}\n" for u, v, w in self.vial),
+            "hidrico": (f"{u} {v}\n" for u, v in self.hidrico),
+            "consultas": (f"{q}\n" for q in self.consultas),
+        }
+        for clave, ruta in rutas.items():
+            with open(ruta, "w", encoding="utf-8") as f:
+                f.write(cabecera)
+                f.writelines(contenidos[clave])
+        return rutas
+
+
+def _bosque_mas_extras(n: int, aristas: List[Arista], rng: random.Random, extra: float) -> List[Arista]:
+    """Bosque generador (aristas en orden aleatorio) más cada arista restante con prob. 'extra'."""
+    orden = aristas[:]
+    rng.shuffle(orden)
+    uf = UnionFindIdx(n)
+    return [(a, b) for a, b in orden if uf.union(a, b) or rng.random() < extra]
+
+
+def generar(tipo: str, n: int, semilla: int = 0) -> Ciudad:
+    return Ciudad(tipo, n, semilla)
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    semilla = 0
+    if "--semilla" in args:
+        i = args.index("--semilla")
+        semilla = int(args[i + 1])
+        del args[i:i + 2]
+    if len(args) != 3 or args[0] not in GENERADORES:
+        print("Usage: python -m src.generadores <grilla|geometrico|cadenas|alimentadores> <n> <directorio> [--semilla S]")
+        sys.exit(1)
+    rutas = generar(args[0], int(args[1]), semilla).escribir(args[2])
+    print(f"✓ Generated: {', '.join(rutas.values())}")
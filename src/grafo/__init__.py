@@ -5,8 +5,21 @@ Contiene la interfaz y la implementación principal usada por los algoritmos.
 
 from .interfaz_grafo import Grafo
 from .grafo_adyacencia import GrafoAdyacencia
+from .grafo_csr import GrafoCSR
+
+_SNAPSHOT = ("guardar_snapshot", "abrir_snapshot", "es_snapshot")
+
+
+def __getattr__(nombre):
+    # snapshot se importa a demanda: así "python -m src.grafo.snapshot" no lo carga dos veces
+    if nombre in _SNAPSHOT:
+        from . import snapshot
+        return getattr(snapshot, nombre)
+    raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
 
 __all__ = [
     "Grafo",
     "GrafoAdyacencia",
+    "GrafoCSR",
+    "guardar_snapshot", "abrir_snapshot", "es_snapshot",
 ]
\ No newline at end of file
@@ -1,3 +1,5 @@
+from typing import Iterable
+
 from .interfaz_grafo import Grafo
 
 class GrafoAdyacencia(Grafo):
@@ -8,6 +10,29 @@ class GrafoAdyacencia(Grafo):
         self.vertex_count: int = 0
         self.edge_count: int = 0    # en no dirigidos, cuenta cada arista una sola vez
         self.no_dirigido = no_dirigido
+        self.epoch: int = 0         # se incrementa en cada mutación (invalida vistas derivadas)
+
+    @classmethod
+    def from_edges(cls, aristas: Iterable[tuple], no_dirigido: bool = True) -> "GrafoAdyacencia":
+        """
+        Construcción masiva desde (u, v) o (u, v, w).
+        Primero junta los nombres, dimensiona la matriz una sola vez y la llena en una pasada
+        (evita el O(V²) de _ensure_vertex al ir agregando columnas).
+        Aristas repetidas y actualizaciones de peso se tratan igual que en add_edge.
+        """
+        g = cls(no_dirigido=no_dirigido)
+        aristas = list(aristas)
+        for e in aristas:
+            for v in (e[0], e[1]):
+                if v not in g.name_to_idx:
+                    g.name_to_idx[v] = len(g.vs)
+                    g.vs.append(v)
+        g.vertex_count = len(g.vs)
+        g.matrix = [[0.0] * g.vertex_count for _ in range(g.vertex_count)]
+        idx = g.name_to_idx
+        for e in aristas:
+            g._set_edge(idx[e[0]], idx[e[1]], e[2] if len(e) > 2 else 1.0)
+        return g
 
     # ---------- helpers internos ----------
     def _ensure_vertex(self, v: str) -> int:
@@ -22,8 +47,28 @@ class GrafoAdyacencia(Grafo):
             fila.append(0.0)
         self.matrix.append([0.0] * (idx + 1))
         self.vertex_count += 1
+        self.epoch += 1
+        self._notificar("vertice_agregado", idx)
         return idx
 
+    def _set_edge(self, i: int, j: int, w: float):
+        """Pone el peso de (i, j) con índices ya existentes."""
+        self.epoch += 1
+        # si no existía la arista, incrementa contador
+        if self.matrix[i][j] == 0.0:
+            self.matrix[i][j] = float(w)
+            if self.no_dirigido:
+                self.matrix[j][i] = float(w)
+                self.edge_count += 1
+            else:
+                self.edge_count += 1
+            self._notificar("arista_agregada", i, j)
+        else:
+            # si ya existía, actualizá el peso (por si el vial actualiza tiempos)
+            self.matrix[i][j] = float(w)
+            if self.no_dirigido:
+                self.matrix[j][i] = float(w)
+
     # ---------- interfaz requerida ----------
     def add_vertex(self, v: str):
         self._ensure_vertex(v)
@@ -32,6 +77,7 @@ class GrafoAdyacencia(Grafo):
         if v not in self.name_to_idx:
             return
         idx = self.name_to_idx[v]
+        self._notificar("vertice_eliminado", idx)
 
         # calcular cuántas aristas elimina este vértice
         # En no dirigidos: cada arista (idx, j) cuenta una sola vez
@@ -57,25 +103,11 @@ class GrafoAdyacencia(Grafo):
             self.name_to_idx[name] = i
 
         self.vertex_count -= 1
+        self.epoch += 1
 
     def add_edge(self, u: str, v: str, w: float = 1.0):
         """Compatible con la interfaz (u, v). Si te llaman sin peso, usa 1.0."""
-        i = self._ensure_vertex(u)
-        j = self._ensure_vertex(v)
-
-        # si no existía la arista, incrementa contador
-        if self.matrix[i][j] == 0.0:
-            self.matrix[i][j] = float(w)
-            if self.no_dirigido:
-                self.matrix[j][i] = float(w)
-                self.edge_count += 1
-            else:
-                self.edge_count += 1
-        else:
-            # si ya existía, actualizá el peso (por si el vial actualiza tiempos)
-            self.matrix[i][j] = float(w)
-            if self.no_dirigido:
-                self.matrix[j][i] = float(w)
+        self._set_edge(self._ensure_vertex(u), self._ensure_vertex(v), w)
 
     def delete_edge(self, u: str, v: str):
         if u not in self.name_to_idx or v not in self.name_to_idx:
@@ -83,12 +115,14 @@ class GrafoAdyacencia(Grafo):
         i = self.name_to_idx[u]
         j = self.name_to_idx[v]
         if self.matrix[i][j] != 0.0:
+            self.epoch += 1
             self.matrix[i][j] = 0.0
             if self.no_dirigido:
                 self.matrix[j][i] = 0.0
                 self.edge_count -= 1
             else:
                 self.edge_count -= 1
+            self._notificar("arista_eliminada", i, j)
 
     def exists_edge(self, u: str, v: str) -> bool:
         if u not in self.name_to_idx or v not in self.name_to_idx:
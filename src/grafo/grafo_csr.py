@@ -0,0 +1,190 @@
+from __future__ import annotations
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .interfaz_grafo import Grafo
+
+
+class GrafoCSR(Grafo):
+    """
+    Grafo inmutable en formato CSR (compressed sparse row).
+    - offsets[i] .. offsets[i+1] delimitan la fila del vértice i
+    - targets: índices de los vecinos (ordenados de menor a mayor dentro de cada fila)
+    - weights: peso de cada entrada de targets
+    En no dirigidos cada arista aparece en las dos filas.
+    Memoria O(V + E) e iteración de vecinos O(grado).
+    """
+
+    def __init__(
+        self,
+        vs: List[str],
+        offsets: Sequence[int],
+        targets: Sequence[int],
+        weights: Sequence[float],
+        no_dirigido: bool = True,
+        edge_count: Optional[int] = None,
+    ):
+        self.vs: List[str] = list(vs)
+        self.name_to_idx: Dict[str, int] = {v: i for i, v in enumerate(self.vs)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.vertex_count: int = len(self.vs)
+        self.no_dirigido = no_dirigido
+        self.edge_count: int = self._contar_aristas() if edge_count is None else edge_count
+        self._rangos: Optional[Tuple[array, array]] = None
+
+    # ---------- construcción ----------
+    @classmethod
+    def from_grafo(cls, g) -> "GrafoCSR":
+        """Congela cualquier grafo con vertices()/get_adjacency_list()/get_weight()."""
+        if isinstance(g, GrafoCSR):
+            return g
+        vs = list(g.vertices())
+        idx = {v: i for i, v in enumerate(vs)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for u in vs:
+            fila = sorted(idx[v] for v in g.get_adjacency_list(u))
+            for j in fila:
+                w = g.get_weight(u, vs[j]) if hasattr(g, "get_weight") else None
+                targets.append(j)
+                weights.append(float(w) if w is not None else 1.0)
+            offsets.append(len(targets))
+        return cls(vs, offsets, targets, weights, getattr(g, "no_dirigido", True))
+
+    @classmethod
+    def from_edges(cls, aristas: Iterable[Tuple], no_dirigido: bool = True) -> "GrafoCSR":
+        """
+        Construye el CSR directamente desde (u, v) o (u, v, w), sin pasar por la matriz.
+        Mismas reglas que GrafoAdyacencia.add_edge: los vértices se numeran por orden de
+        aparición, una arista repetida actualiza el peso (gana la última) y peso 0.0 = sin arista.
+        """
+        vs: List[str] = []
+        name_to_idx: Dict[str, int] = {}
+
+        def ensure(v: str) -> int:
+            i = name_to_idx.get(v)
+            if i is None:
+                i = name_to_idx[v] = len(vs)
+                vs.append(v)
+            return i
+
+        src = array("q")
+        dst = array("q")
+        wts = array("d")
+        for e in aristas:
+            i = ensure(e[0])
+            j = ensure(e[1])
+            w = float(e[2]) if len(e) > 2 else 1.0
+            src.append(i); dst.append(j); wts.append(w)
+            if no_dirigido and i != j:
+                src.append(j); dst.append(i); wts.append(w)
+
+        n = len(vs)
+        # orden estable por (fila, columna): entre repetidas gana la última
+        orden = sorted(range(len(src)), key=lambda k: src[k] * n + dst[k])
+        counts = [0] * (n + 1)
+        targets = array("q")
+        weights = array("d")
+        for pos, k in enumerate(orden):
+            if pos + 1 < len(orden):
+                sig = orden[pos + 1]
+                if src[sig] == src[k] and dst[sig] == dst[k]:
+                    continue
+            if wts[k] == 0.0:
+                continue
+            counts[src[k] + 1] += 1
+            targets.append(dst[k])
+            weights.append(wts[k])
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        return cls(vs, array("q", counts), targets, weights, no_dirigido)
+
+    def _contar_aristas(self) -> int:
+        if not self.no_dirigido:
+            return len(self.targets)
+        # en no dirigidos cada arista una sola vez (j >= i, incluye lazos)
+        total = 0
+        for i in range(self.vertex_count):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                if self.targets[k] >= i:
+                    total += 1
+        return total
+
+    # ---------- helpers internos ----------
+    def _pos(self, i: int, j: int) -> Optional[int]:
+        """Posición de la entrada (i, j) en targets, o None si no existe."""
+        a, b = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.targets, j, a, b)
+        if k < b and self.targets[k] == j:
+            return k
+        return None
+
+    def _inmutable(self, *_):
+        raise TypeError("GrafoCSR es inmutable: modificá el GrafoAdyacencia y volvé a congelarlo")
+
+    # ---------- interfaz requerida ----------
+    add_vertex = _inmutable
+    delete_vertex = _inmutable
+    add_edge = _inmutable
+    delete_edge = _inmutable
+
+    def exists_edge(self, u: str, v: str) -> bool:
+        if u not in self.name_to_idx or v not in self.name_to_idx:
+            return False
+        return self._pos(self.name_to_idx[u], self.name_to_idx[v]) is not None
+
+    def order(self) -> int:
+        return self.vertex_count
+
+    def get_adjacency_list(self, v: str) -> List[str]:
+        if v not in self.name_to_idx:
+            return []
+        i = self.name_to_idx[v]
+        vs = self.vs
+        return [vs[j] for j in self.targets[self.offsets[i]:self.offsets[i + 1]]]
+
+    # ---------- helpers opcionales (útiles para algoritmos) ----------
+    def get_weight(self, u: str, v: str) -> Optional[float]:
+        if u not in self.name_to_idx or v not in self.name_to_idx:
+            return None
+        k = self._pos(self.name_to_idx[u], self.name_to_idx[v])
+        return self.weights[k] if k is not None else None
+
+    def vertices(self) -> List[str]:
+        return list(self.vs)
+
+    def edges(self) -> List[Tuple[str, str, float]]:
+        """Devuelve aristas con peso. En no dirigidos, cada arista una sola vez (i<j)."""
+        es = []
+        for i in range(self.vertex_count):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                j = self.targets[k]
+                if self.no_dirigido and j <= i:
+                    continue
+                es.append((self.vs[i], self.vs[j], self.weights[k]))
+        return es
+
+    # ---------- acceso por índice ----------
+    def degree(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def neighbors(self, i: int) -> Sequence[int]:
+        """Índices de los vecinos de i (sin copiar nombres)."""
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def rangos(self) -> Tuple[array, array]:
+        """
+        (rank, por_rank): posición alfabética de cada vértice y su inversa.
+        Permite desempatar por nombre comparando enteros.
+        """
+        if self._rangos is None:
+            por_rank = array("q", sorted(range(self.vertex_count), key=self.vs.__getitem__))
+            rank = array("q", [0]) * self.vertex_count
+            for r, i in enumerate(por_rank):
+                rank[i] = r
+            self._rangos = (rank, por_rank)
+        return self._rangos
@@ -1,6 +1,33 @@
 from abc import ABC, abstractmethod
 
 class Grafo(ABC):
+    # contador de mutaciones: las implementaciones mutables lo incrementan en cada cambio
+    epoch = 0
+
+    def vista(self, nombre, calcular):
+        """
+        Vista derivada perezosa (grados, componentes, puentes...).
+        Se calcula con calcular(self) la primera vez y se reutiliza mientras epoch no cambie.
+        """
+        vistas = self.__dict__.setdefault("_vistas", {})
+        cacheada = vistas.get(nombre)
+        if cacheada is not None and cacheada[0] == self.epoch:
+            return cacheada[1]
+        valor = calcular(self)
+        vistas[nombre] = (self.epoch, valor)
+        return valor
+
+    def observar(self, observador):
+        """
+        Registra un objeto que se entera de cada mutación, para mantener índices al día sin
+        recalcular: se le llama vertice_agregado(i), arista_agregada(i, j),
+        arista_eliminada(i, j) y vertice_eliminado(i) (índices previos al cambio).
+        """
+        self.__dict__.setdefault("_observadores", []).append(observador)
+
+    def _notificar(self, evento, *args):
+        for observador in self.__dict__.get("_observadores", ()):
+            getattr(observador, evento)(*args)
 
     @abstractmethod
     def add_edge(self, u, v):
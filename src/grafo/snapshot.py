@@ -0,0 +1,144 @@
+"""
+Snapshot binario de grafos (formato CSR) para arranques rápidos.
+
+Layout (little-endian):
+- header: MAGIC, versión, flags (bit 0 = no dirigido), V, entradas CSR, aristas,
+  largo de la tabla de nombres y CRC32 del cuerpo
+- cuerpo: nombres en UTF-8 separados por '\\n' (con relleno a 8 bytes),
+  offsets (V+1 int64), targets (entradas int64) y weights (entradas float64)
+
+Al reabrirlo con mmap los arrays no se copian: varios procesos que abran el mismo
+archivo comparten las páginas del sistema operativo.
+
+Un grafo abierto desde un snapshot es un GrafoCSR de sólo lectura: las consultas que
+modifican la red (OUTAGE) responden que no están soportadas. Para simular bajas hay que
+cargar el archivo de texto.
+
+Uso:
+    guardar_snapshot(load_weighted_graph("grafo_vial.txt"), "grafo_vial.grafo")
+    load_weighted_graph("grafo_vial.grafo")   # detecta el formato y usa abrir_snapshot
+
+    python -m src.grafo.snapshot <grafo.txt> <salida.grafo> [--ponderado]
+"""
+
+from __future__ import annotations
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from typing import Sequence, Tuple
+
+from .grafo_csr import GrafoCSR
+
+MAGIC = b"TPGRAFO\x00"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIqqqqI")
+_FLAG_NO_DIRIGIDO = 1
+
+
+def _pad(n: int) -> int:
+    return (-n) % 8
+
+
+def es_snapshot(path: str) -> bool:
+    """True si el archivo empieza con la firma del formato binario."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def guardar_snapshot(g, path: str) -> str:
+    """Escribe el grafo (cualquier implementación; se congela a CSR) como snapshot binario."""
+    csr = GrafoCSR.from_grafo(g)
+    nombres = "\n".join(csr.vs).encode("utf-8")
+    offsets = array("q", csr.offsets)
+    targets = array("q", csr.targets)
+    weights = array("d", csr.weights)
+    if sys.byteorder != "little":
+        for a in (offsets, targets, weights):
+            a.byteswap()
+
+    cuerpo = [nombres, b"\x00" * _pad(len(nombres)), offsets.tobytes(), targets.tobytes(), weights.tobytes()]
+    crc = 0
+    for parte in cuerpo:
+        crc = zlib.crc32(parte, crc)
+
+    flags = _FLAG_NO_DIRIGIDO if csr.no_dirigido else 0
+    header = _HEADER.pack(
+        MAGIC, VERSION, flags, csr.vertex_count, len(csr.targets), csr.edge_count, len(nombres), crc
+    )
+    with open(path, "wb") as f:
+        f.write(header)
+        for parte in cuerpo:
+            f.write(parte)
+    return path
+
+
+def _leer_header(buf) -> Tuple[int, int, int, int, int, int]:
+    if len(buf) < _HEADER.size:
+        raise ValueError("snapshot truncado: falta el header")
+    magic, version, flags, n, nnz, aristas, largo_nombres, crc = _HEADER.unpack_from(buf, 0)
+    if magic != MAGIC:
+        raise ValueError("no es un snapshot de grafo")
+    if version != VERSION:
+        raise ValueError(f"versión de snapshot no soportada: {version}")
+    return flags, n, nnz, aristas, largo_nombres, crc
+
+
+def abrir_snapshot(path: str, verificar: bool = True) -> GrafoCSR:
+    """
+    Abre un snapshot con mmap y devuelve un GrafoCSR cuyos arrays apuntan al archivo.
+    Con verificar=True controla el CRC32 del cuerpo antes de usarlo.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    flags, n, nnz, aristas, largo_nombres, crc = _leer_header(mm)
+
+    inicio = _HEADER.size
+    pos_offsets = inicio + largo_nombres + _pad(largo_nombres)
+    pos_targets = pos_offsets + 8 * (n + 1)
+    pos_weights = pos_targets + 8 * nnz
+    fin = pos_weights + 8 * nnz
+    if len(mm) < fin:
+        raise ValueError("snapshot truncado: faltan datos CSR")
+
+    vista = memoryview(mm)
+    if verificar and zlib.crc32(vista[inicio:fin]) != crc:
+        raise ValueError("snapshot corrupto: no coincide el checksum")
+
+    vs = bytes(vista[inicio:inicio + largo_nombres]).decode("utf-8").split("\n") if n else []
+    if sys.byteorder == "little":
+        offsets = vista[pos_offsets:pos_targets].cast("q")
+        targets = vista[pos_targets:pos_weights].cast("q")
+        weights = vista[pos_weights:fin].cast("d")
+    else:
+        # en big-endian no se puede mapear directo: se copia y se da vuelta
+        offsets = array("q", bytes(vista[pos_offsets:pos_targets])); offsets.byteswap()
+        targets = array("q", bytes(vista[pos_targets:pos_weights])); targets.byteswap()
+        weights = array("d", bytes(vista[pos_weights:fin])); weights.byteswap()
+
+    return GrafoCSR(vs, offsets, targets, weights, bool(flags & _FLAG_NO_DIRIGIDO), edge_count=aristas)
+
+
+
+def main(argv: Sequence[str]):
+    """Convierte un archivo de aristas de texto (formato del enunciado) en snapshot."""
+    args = list(argv)
+    ponderado = "--ponderado" in args
+    args = [a for a in args if a != "--ponderado"]
+    if len(args) != 2:
+        print("Usage: python -m src.grafo.snapshot <graph.txt> <output.grafo> [--ponderado]")
+        print("  --ponderado  The file has a third column with weights (road graph)")
+        sys.exit(1)
+    from src.main import load_graph, load_weighted_graph
+    entrada, salida = args
+    g = load_weighted_graph(entrada, csr=True) if ponderado else load_graph(entrada, csr=True)
+    guardar_snapshot(g, salida)
+    print(f"✓ Snapshot saved to: {salida} ({g.vertex_count} vertices, {g.edge_count} edges)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,163 @@
+"""
+Instrumentación opcional de process_queries: tiempos por consulta y contadores de los recorridos.
+
+Sólo actúa mientras dura la traza (with Instrumentacion("traza.jsonl") as instr):
+- prende src.algoritmos.contadores, donde los propios kernels (Dijkstra, BFS, DFS, A*, CH,
+  Tarjan, Hierholzer, los índices incrementales...) suman lo que hicieron;
+- cada consulta pasa por ProcesadorConsultas.responder con procesador.tiempos apuntando a
+  su registro, donde se suman el parseo y el formato.
+Al salir todo vuelve a estar apagado. Sin traza los kernels sólo cuentan en variables locales.
+
+Cada consulta genera una línea JSON con:
+- parse_s, calculo_s, formato_s, total_s (el cálculo es el total menos parseo y formato; en
+  las respuestas que se escriben por trozos, como MATRIZ_DISTANCIAS, cada fila se calcula al
+  escribirla y ese tiempo va a formato_s; en "(preparar)", el armado de los lotes de caminos
+  de la ventana, todo cuenta como cálculo);
+- heap_push, heap_pop, vertices_visitados, aristas_relajadas: ver src.algoritmos.contadores;
+- cache_aciertos: respuestas que salieron del CacheConsultas;
+- fijados (sólo con motor ALT): vértices que fijó el A* para la consulta (ALT.total_fijados).
+Al final se agrega una línea con el resumen por tipo de consulta (ver tabla()).
+"""
+
+from __future__ import annotations
+import json
+import sys
+import time
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.algoritmos import contadores
+
+CONTADORES = contadores.NOMBRES
+TIEMPOS = ("parse_s", "calculo_s", "formato_s", "total_s")
+
+
+class Instrumentacion:
+    def __init__(self, traza: str):
+        """'traza' es el archivo JSON-lines de salida ("-" = stderr)."""
+        self.traza = traza
+        self.registros: List[Dict[str, Any]] = []
+        self._out = None
+
+    # ---------- activar / desactivar ----------
+    def __enter__(self) -> "Instrumentacion":
+        self._out = sys.stderr if self.traza == "-" else open(self.traza, "w", encoding="utf-8")
+        contadores.activar()
+        return self
+
+    def __exit__(self, *exc):
+        contadores.activar(False)
+        self._escribir({"tipo": "resumen", "consultas": self.resumen()})
+        if self._out is not sys.stderr:
+            self._out.close()
+        self._out = None
+        return False
+
+    def _trozos(self, trozos: Iterable[str], registro: Dict[str, Any]) -> Iterator[str]:
+        """Reenvía los trozos de una respuesta sumando a formato_s el tiempo de producirlos."""
+        it = iter(trozos)
+        while True:
+            t0 = time.perf_counter()
+            try:
+                trozo = next(it)
+            except StopIteration:
+                return
+            finally:
+                dt = time.perf_counter() - t0
+                registro["formato_s"] += dt
+                registro["total_s"] += dt
+            yield trozo
+
+    # ---------- registros ----------
+    def _empezar(self, tipo: str, numero: int, consulta: Optional[str], op: str) -> Dict[str, Any]:
+        registro: Dict[str, Any] = {"tipo": tipo, "n": numero, "op": op, "consulta": consulta}
+        registro.update(dict.fromkeys(TIEMPOS, 0.0))
+        registro["_contadores"] = contadores.leer()
+        return registro
+
+    def _terminar(self, registro: Dict[str, Any]):
+        antes = registro.pop("_contadores")
+        ahora = contadores.leer()
+        for c in CONTADORES:
+            registro[c] = ahora[c] - antes[c]
+        self.registros.append(registro)
+        self._escribir(registro)
+
+    def _escribir(self, registro: Dict[str, Any]):
+        self._out.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+    def respuestas(self, procesador, lineas: Iterable[str], ventana: int = 256) -> Iterator[Optional[Any]]:
+        """Igual que procesador.respuestas(lineas, ventana), registrando cada consulta."""
+        it = iter(lineas)
+        numero = 0
+        while True:
+            bloque = list(islice(it, ventana))
+            if not bloque:
+                return
+            registro = self._empezar("preparar", numero + 1, None, "(preparar)")
+            t0 = time.perf_counter()
+            procesador.preparar(bloque)
+            registro["total_s"] = registro["calculo_s"] = time.perf_counter() - t0
+            registro["cache_aciertos"] = 0
+            self._terminar(registro)
+
+            for line in bloque:
+                numero += 1
+                registro = self._empezar("consulta", numero, line, line.split()[0].upper())
+                hits = procesador.cache.hits
+                fijados = getattr(procesador.motor, "total_fijados", None)
+                procesador.tiempos = registro
+                t0 = time.perf_counter()
+                try:
+                    salidas = procesador.responder(line)
+                finally:
+                    registro["total_s"] = time.perf_counter() - t0
+                    procesador.tiempos = None
+                registro["calculo_s"] = registro["total_s"] - registro["parse_s"] - registro["formato_s"]
+                registro["cache_aciertos"] = procesador.cache.hits - hits
+                if fijados is not None:
+                    registro["fijados"] = procesador.motor.total_fijados - fijados
+                for salida in salidas:
+                    yield salida if isinstance(salida, str) else self._trozos(salida, registro)
+                self._terminar(registro)
+            yield None
+
+    # ---------- resumen ----------
+    def resumen(self) -> Dict[str, Dict[str, Any]]:
+        """Por tipo de consulta: cantidad, tiempos (total y máximo) y contadores sumados."""
+        por_op: Dict[str, Dict[str, Any]] = {}
+        for r in self.registros:
+            fila = por_op.get(r["op"])
+            if fila is None:
+                fila = por_op[r["op"]] = {"cantidad": 0, "max_s": 0.0}
+                fila.update(dict.fromkeys(TIEMPOS, 0.0))
+                fila.update(dict.fromkeys(CONTADORES, 0))
+            fila["cantidad"] += 1
+            fila["max_s"] = max(fila["max_s"], r["total_s"])
+            for k in TIEMPOS + CONTADORES:
+                fila[k] += r[k]
+            if "fijados" in r:
+                fila["fijados"] = fila.get("fijados", 0) + r["fijados"]
+        return por_op
+
+    def tabla(self) -> str:
+        """Resumen como tabla de texto (tiempos en ms), de la consulta más cara a la más barata."""
+        columnas = ("cant", "total", "prom", "máx", "parse", "cálculo", "formato",
+                    "push", "pop", "vértices", "aristas")
+        lineas = [
+            "=" * 60,
+            "RESUMEN DE LA TRAZA (tiempos en ms)",
+            "=" * 60,
+            f"{'consulta':<28}" + "".join(f"{c:>10}" for c in columnas),
+        ]
+        resumen = self.resumen()
+        for op, f in sorted(resumen.items(), key=lambda x: -x[1]["total_s"]):
+            ms = lambda s: f"{1000 * s:>10.2f}"
+            lineas.append(
+                f"{op:<28}{f['cantidad']:>10}" + ms(f["total_s"]) + ms(f["total_s"] / f["cantidad"])
+                + ms(f["max_s"]) + ms(f["parse_s"]) + ms(f["calculo_s"]) + ms(f["formato_s"])
+                + "".join(f"{f[c]:>10}" for c in CONTADORES)
+            )
+        total = sum(f["total_s"] for f in resumen.values())
+        lineas.append(f"{'total':<28}{sum(f['cantidad'] for f in resumen.values()):>10}{1000 * total:>10.2f}")
+        return "\n".join(lineas) + "\n"
@@ -4,63 +4,83 @@ Módulo principal para 'Los 100 Grafos Porteños'.
 - Procesa el archivo de consultas y escribe el archivo de respuestas
 """
 
-from typing import List, Dict, Tuple, Optional, Set
+import re
+import sys
+import time
+from itertools import islice
+from typing import Callable, Iterable, Iterator, List, Dict, Tuple, Optional, Union
 
 from src.grafo.grafo_adyacencia import GrafoAdyacencia
+from src.grafo.grafo_csr import GrafoCSR
+from src.grafo.snapshot import es_snapshot, abrir_snapshot
+from src.cache import CacheConsultas
 from src.algoritmos import (
-    BFS, ComponentesConexos, Dijkstra, TarjanCriticos, Hierholzer
+    ALT, ContractionHierarchies, Hierholzer, DijkstraIdx, MatrizDistancias, SimuladorCortes, BarridoCortes,
+    IndiceConectividad, AsignacionPlantas, derivado,
 )
 
 from src.output import (
     format_componentes_conexos,
+    format_misma_red,
+    format_outage,
     format_orden_fallos,
     format_camino_minimo,
     format_simulacion_corte,
     format_ruta_recoleccion,
     format_plantas_asignadas,
     format_puentes_y_articulaciones,
+    format_matriz_distancias_filas,
+    format_barrido_cortes,
 )
 
 # ----------------------------------------------------
 # CARGA DE GRAFOS (según formatos del enunciado)
 # ----------------------------------------------------
 
-def load_graph(path: str) -> GrafoAdyacencia:
+def _leer_aristas(path: str, ponderado: bool) -> Iterator[Tuple]:
     """
-    Carga grafo simple (no dirigido).
-    Formato: 'Barrio1 Barrio2' por línea.
+    Recorre el archivo de aristas y devuelve (u, v) o (u, v, w) por línea válida.
+    Ignora líneas vacías, comentarios y líneas incompletas.
     """
-    g = GrafoAdyacencia(no_dirigido=True)
+    minimo = 3 if ponderado else 2
     with open(path, encoding="utf-8") as f:
         for raw in f:
             line = raw.strip()
             if not line or line.startswith("#"):
                 continue
             parts = line.split()
-            if len(parts) < 2:
+            if len(parts) < minimo:
                 continue
-            u, v = parts[0], parts[1]
-            g.add_edge(u, v)
-    return g
+            if ponderado:
+                yield parts[0], parts[1], float(parts[2])
+            else:
+                yield parts[0], parts[1]
+
+
+def load_graph(path: str, csr: bool = False) -> Union[GrafoAdyacencia, GrafoCSR]:
+    """
+    Carga grafo simple (no dirigido).
+    Formato: 'Barrio1 Barrio2' por línea, o snapshot binario (ver src.grafo.snapshot).
+    Con csr=True, o si el archivo es un snapshot, devuelve un GrafoCSR inmutable.
+    """
+    if es_snapshot(path):
+        return abrir_snapshot(path)
+    if csr:
+        return GrafoCSR.from_edges(_leer_aristas(path, ponderado=False))
+    return GrafoAdyacencia.from_edges(_leer_aristas(path, ponderado=False))
 
 
-def load_weighted_graph(path: str) -> GrafoAdyacencia:
+def load_weighted_graph(path: str, csr: bool = False) -> Union[GrafoAdyacencia, GrafoCSR]:
     """
     Carga grafo ponderado (no dirigido, pesos positivos).
-    Formato: 'Barrio1 Barrio2 Tiempo' por línea.
+    Formato: 'Barrio1 Barrio2 Tiempo' por línea, o snapshot binario (ver src.grafo.snapshot).
+    Con csr=True, o si el archivo es un snapshot, devuelve un GrafoCSR inmutable.
     """
-    g = GrafoAdyacencia(no_dirigido=True)
-    with open(path, encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            u, v, w = parts[0], parts[1], float(parts[2])
-            g.add_edge(u, v, w)
-    return g
+    if es_snapshot(path):
+        return abrir_snapshot(path)
+    if csr:
+        return GrafoCSR.from_edges(_leer_aristas(path, ponderado=True))
+    return GrafoAdyacencia.from_edges(_leer_aristas(path, ponderado=True))
 
 
 # ----------------------------------------------------
@@ -94,159 +114,647 @@ def _parse_plantas(line: str) -> List[str]:
     return tokens[1:] if len(tokens) > 1 else []
 
 
+def _parse_simular_corte(line: str, tokens: List[str]) -> Tuple[str, str, List[str]]:
+    """
+    Soporta dos formatos y devuelve (origen, destino, cortes), con "?" si faltan datos:
+    1) SIMULAR_CORTE origen destino cortes: a,b,c
+    2) CAMINO_MINIMO_SIMULAR_CORTE {a,b,c} origen destino   (como en consultas.txt)
+    """
+    origen = destino = "?"
+    cortes: List[str] = []
+
+    # Formato con llaves: CAMINO_MINIMO_SIMULAR_CORTE {a,b,c} origen destino
+    if len(tokens) >= 4 and tokens[1].startswith("{"):
+        cortes_token = tokens[1]
+        cortes_str = cortes_token.strip("{}")
+        cortes = [c.strip() for c in cortes_str.split(",") if c.strip()]
+        origen, destino = tokens[2], tokens[3]
+    else:
+        # Formato original: SIMULAR_CORTE origen destino cortes: ...
+        if len(tokens) >= 3:
+            origen, destino = tokens[1], tokens[2]
+        cortes = _parse_cortes(line)
+    return origen, destino, cortes
+
+
+def _parse_multi(tokens: List[str]) -> Tuple[str, List[str]]:
+    """
+    CAMINO_MINIMO_MULTI origen {d1,d2,...} → (origen, destinos).
+    Tolera espacios dentro de las llaves; origen "?" si falta.
+    """
+    if len(tokens) < 2:
+        return "?", []
+    resto = " ".join(tokens[2:]).strip("{} ")
+    return tokens[1], [d.strip() for d in resto.replace(",", " ").split() if d.strip()]
+
+
+def _parse_barrido(line: str) -> Tuple[List[List[str]], List[Tuple[str, str]]]:
+    """
+    BARRIDO_CORTES {a,b} {c} ... origen:destino ... → (escenarios, pares).
+    Cada par de llaves es un escenario ({} = sin cortes); tolera espacios dentro.
+    """
+    escenarios = [
+        [c.strip() for c in grupo.replace(",", " ").split() if c.strip()]
+        for grupo in re.findall(r"\{([^}]*)\}", line)
+    ]
+    resto = re.sub(r"\{[^}]*\}", " ", line).split()[1:]
+    pares = [tuple(p.split(":", 1)) for p in resto if p.count(":") == 1 and p[0] != ":" and p[-1] != ":"]
+    return escenarios, pares
+
+
+def _parse_outage(line: str) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """
+    OUTAGE a:b c:d x ... → (líneas, subestaciones): los tokens a:b son líneas y los
+    sueltos, subestaciones. Tolera llaves y comas.
+    """
+    tokens = line.replace("{", " ").replace("}", " ").replace(",", " ").split()[1:]
+    lineas = [tuple(t.split(":", 1)) for t in tokens if ":" in t and t[0] != ":" and t[-1] != ":"]
+    subestaciones = [t for t in tokens if ":" not in t]
+    return lineas, subestaciones
+
+
+def _pedidos_viales(line: str) -> List[Tuple[str, str, List[str]]]:
+    """(origen, destino, cortes) que pide una línea de consulta vial (vacío si no es vial)."""
+    tokens = line.split()
+    op = tokens[0].upper()
+    if op == "CAMINO_MINIMO" and len(tokens) >= 3:
+        return [(tokens[1], tokens[2], [])]
+    if op in ("SIMULAR_CORTE", "CAMINO_MINIMO_SIMULAR_CORTE"):
+        origen, destino, cortes = _parse_simular_corte(line, tokens)
+        if origen != "?" and destino != "?":
+            return [(origen, destino, cortes)]
+    if op == "CAMINO_MINIMO_MULTI":
+        origen, destinos = _parse_multi(tokens)
+        return [(origen, d, []) for d in destinos]
+    return []
+
+
 # ----------------------------------------------------
-# ASIGNACIÓN DE PLANTAS (multi-origen)
+# TRADUCCIÓN NOMBRES <-> ÍNDICES (kernels enteros)
 # ----------------------------------------------------
 
-def _asignar_plantas_bfs_multiorigen(g: GrafoAdyacencia, plantas: List[str]) -> Dict[str, Optional[str]]:
+def _camino_minimo(g: GrafoCSR, origen: str, destino: str, cortes: Iterable[str] = (), motor=None) -> Tuple[float, List[str]]:
+    """
+    Traduce los barrios a índices, corre Dijkstra bidireccional (o 'motor', p. ej. ALT o
+    ContractionHierarchies, si fue preprocesado sobre g) y devuelve (distancia, camino) con nombres.
+    Mismo resultado que Dijkstra.compute(g, origen, destino, banned=set(cortes)).
+    """
+    cortes = set(cortes)
+    if origen in cortes:
+        return float("inf"), []
+    s = g.name_to_idx.get(origen)
+    t = g.name_to_idx.get(destino)
+    if s is None or t is None:
+        # barrio inexistente: sólo existe el camino trivial origen == destino
+        return (0.0, [origen]) if origen == destino else (float("inf"), [])
+    banned = [g.name_to_idx[c] for c in cortes if c in g.name_to_idx]
+    if motor is not None and motor.g is g:
+        d, camino = motor.camino(s, t, banned)
+    else:
+        dist, parent = DijkstraIdx.bidireccional(g, s, t, banned)
+        d, camino = dist[t], DijkstraIdx.path(parent, t)
+    return d, [g.vs[i] for i in camino]
+
+
+def _caminos_desde(g: GrafoCSR, origen: str, destinos: Iterable[str], cortes: Iterable[str] = ()) -> Dict[str, Tuple[float, List[str]]]:
+    """
+    Versión uno-a-muchos de _camino_minimo: una sola búsqueda desde 'origen' que termina al
+    fijar todos los destinos. Devuelve {destino: (distancia, camino)} con nombres.
     """
-    Asigna a cada barrio la planta más cercana en cantidad de aristas (no ponderado).
-    En empates de distancia, elige lexicográficamente la planta con nombre menor.
-    Implementación: Dijkstra/BFS multi-origen con cola de prioridad (dist, nodo, planta).
+    cortes = set(cortes)
+    destinos = list(destinos)
+    s = g.name_to_idx.get(origen)
+    if origen in cortes or s is None:
+        return {d: _camino_minimo(g, origen, d, cortes) for d in destinos}
+    banned = [g.name_to_idx[c] for c in cortes if c in g.name_to_idx]
+    objetivos = [g.name_to_idx[d] for d in destinos if d in g.name_to_idx]
+    dist, parent = DijkstraIdx.uno_a_muchos(g, s, objetivos, banned)
+    out: Dict[str, Tuple[float, List[str]]] = {}
+    for d in destinos:
+        t = g.name_to_idx.get(d)
+        if t is None:
+            out[d] = (float("inf"), [])
+        else:
+            out[d] = (dist[t], [g.vs[i] for i in DijkstraIdx.path(parent, t)])
+    return out
+
+
+def _caminos_agrupados(g: GrafoCSR, lineas: Iterable[str]) -> Dict[Tuple[str, str, frozenset], Tuple[float, List[str]]]:
     """
-    import heapq
-    dist: Dict[str, int] = {}
-    owner: Dict[str, str] = {}
-    pq: List[Tuple[int, str, str]] = []
+    Agrupa los pedidos viales de 'lineas' por (origen, cortes) y resuelve cada grupo con más
+    de un destino con una sola búsqueda. Devuelve {(origen, destino, cortes): (distancia, camino)}.
+    """
+    grupos: Dict[Tuple[str, frozenset], Dict[str, None]] = {}
+    for line in lineas:
+        for origen, destino, cortes in _pedidos_viales(line):
+            grupos.setdefault((origen, frozenset(cortes)), {})[destino] = None
+    resueltos: Dict[Tuple[str, str, frozenset], Tuple[float, List[str]]] = {}
+    for (origen, cortes), destinos in grupos.items():
+        if len(destinos) < 2:
+            continue
+        for destino, res in _caminos_desde(g, origen, destinos, cortes).items():
+            resueltos[(origen, destino, cortes)] = res
+    return resueltos
 
-    # inicialización: cada planta a distancia 0 de sí misma
-    for p in plantas:
-        dist[p] = 0
-        owner[p] = p
-        heapq.heappush(pq, (0, p, p))
 
-    while pq:
-        d, u, planta = heapq.heappop(pq)
-        if dist.get(u, float("inf")) < d or owner.get(u) != planta:
-            continue
-        for v in g.get_adjacency_list(u):
-            nd = d + 1
-            better = (nd < dist.get(v, float("inf"))) or (
-                nd == dist.get(v, float("inf")) and planta < owner.get(v, "\uffff")
-            )
-            if better:
-                dist[v] = nd
-                owner[v] = planta
-                heapq.heappush(pq, (nd, v, planta))
+MOTORES = ("alt", "ch")
 
-    # completar con None los barrios aislados que no se alcanzan
-    asign = {v: owner.get(v, None) for v in g.vertices()}
-    return asign
+
+def crear_motor(road_graph, nombre: str, landmarks: Optional[str] = None):
+    """
+    Motor de caminos mínimos preprocesado sobre la vista CSR de road_graph, para pasar como
+    'motor' a process_queries / ProcesadorConsultas: "alt" (ALT) o "ch" (ContractionHierarchies).
+    Con "alt", 'landmarks' es un archivo de tablas (ALT.guardar): se reabre si corresponde a
+    este grafo; si no existe o es de otro grafo, se recalcula y se vuelve a escribir.
+    """
+    c = derivado(road_graph, "csr")
+    if nombre == "ch":
+        return ContractionHierarchies(c)
+    if nombre != "alt":
+        raise ValueError(f"motor desconocido: {nombre} (opciones: {', '.join(MOTORES)})")
+    if landmarks is None:
+        return ALT(c)
+    try:
+        return ALT.cargar(c, landmarks)
+    except (OSError, ValueError):
+        alt = ALT(c)
+        alt.guardar(landmarks)
+        return alt
+
+
+def _filas_matriz(g: GrafoCSR, metodo: str = "auto", procesos: Optional[int] = None) -> Iterator[Tuple[str, Dict[str, float]]]:
+    """
+    Filas de la matriz de distancias con nombres, de a una y en orden alfabético de origen:
+    (origen, {destino: distancia}). Nunca arma la matriz completa como dict de dicts.
+    """
+    vs = g.vs
+    for s, fila in MatrizDistancias.filas(g, metodo, procesos):
+        yield vs[s], {vs[v]: fila[v] for v in range(len(vs))}
+
+
+def _barrido_cortes(
+    g: GrafoCSR, escenarios: List[List[str]], pares: List[Tuple[str, str]], procesos: Optional[int] = None
+) -> Tuple[List[float], List[List[float]]]:
+    """
+    Traduce escenarios y pares a índices y corre BarridoCortes. Devuelve (base, demoras)
+    alineados con 'pares'; los barrios inexistentes siguen la regla de _camino_minimo.
+    """
+    idx = g.name_to_idx
+    conocidos = [j for j, (o, d) in enumerate(pares) if o in idx and d in idx]
+    barrido = BarridoCortes(g)
+    base_c, tabla_c = barrido.demoras(
+        [[idx[c] for c in e if c in idx] for e in escenarios],
+        [(idx[pares[j][0]], idx[pares[j][1]]) for j in conocidos],
+        procesos=procesos,
+    )
+    INF = float("inf")
+    base = [0.0 if o == d else INF for o, d in pares]
+    tabla = [[INF if o in e and base[j] != INF else 0.0 for j, (o, d) in enumerate(pares)] for e in escenarios]
+    for k, j in enumerate(conocidos):
+        base[j] = base_c[k]
+        for i in range(len(escenarios)):
+            tabla[i][j] = tabla_c[i][k]
+    return base, tabla
+
+
+# ----------------------------------------------------
+# ASIGNACIÓN DE PLANTAS (multi-origen)
+# ----------------------------------------------------
+
+def _asignar_plantas(motor: AsignacionPlantas, plantas: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Asigna a cada barrio la planta más cercana en cantidad de aristas (no ponderado); en
+    empates de distancia, la planta de nombre menor. Los nombres que no están en el grafo se
+    ignoran y los barrios que no alcanza ninguna planta quedan en None.
+    Mueve 'motor' desde el conjunto de plantas anterior: sólo se recalculan las regiones que
+    ganan o pierden las plantas que cambian.
+    """
+    c = motor.g
+    motor.fijar(c.name_to_idx[p] for p in plantas if p in c.name_to_idx)
+    vs = c.vs
+    return {v: (vs[motor.dueno[i]] if motor.dueno[i] != -1 else None) for i, v in enumerate(vs)}
 
 
 # ----------------------------------------------------
 # PROCESAMIENTO DE CONSULTAS
 # ----------------------------------------------------
 
+def _clave(op: str, args, g) -> tuple:
+    """
+    Clave de cache: (operación, argumentos normalizados, identidad del grafo).
+    La identidad incluye el epoch, así una mutación del grafo invalida sus resultados.
+    """
+    return op, args, id(g), getattr(g, "epoch", 0)
+
+
+def _ruta_recoleccion(g) -> List[str]:
+    """Hierholzer; si no hay recorrido euleriano, la componente más grande."""
+    ruta = Hierholzer.compute(g)
+    if not ruta:
+        comps = derivado(g, "componentes")
+        ruta = max(comps, key=len) if comps else []
+    return ruta
+
+
+# Una respuesta es un bloque de texto o un iterable de trozos (p. ej. la matriz de
+# distancias, que se genera fila por fila). None en el flujo = momento de hacer flush.
+Salida = Union[str, Iterable[str]]
+
+
+def _leer_consultas(queries_file: str) -> Iterator[str]:
+    """Líneas de consulta (sin vacías ni comentarios) de un archivo, o de stdin con "-"."""
+    if queries_file == "-":
+        for raw in sys.stdin:
+            line = raw.strip()
+            if line and not line.startswith("#"):
+                yield line
+        return
+    with open(queries_file, encoding="utf-8") as f:
+        for raw in f:
+            line = raw.strip()
+            if line and not line.startswith("#"):
+                yield line
+
+
+def _escribir_salidas(salidas: Iterable[Optional[Salida]], output_file: str):
+    """
+    Escribe las respuestas separadas por una línea en blanco (igual que "\n".join) a medida
+    que llegan, en un archivo o en stdout con "-". Un None en 'salidas' fuerza un flush.
+    """
+    out = sys.stdout if output_file == "-" else open(output_file, "w", encoding="utf-8")
+    try:
+        primera = True
+        for salida in salidas:
+            if salida is None:
+                out.flush()
+                continue
+            if not primera:
+                out.write("\n")
+            primera = False
+            if isinstance(salida, str):
+                out.write(salida)
+            else:
+                for trozo in salida:
+                    out.write(trozo)
+        out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+class ProcesadorConsultas:
+    """
+    Ejecuta consultas de a una sobre los tres grafos, con el estado que comparten entre sí:
+    cache de resultados, motores preprocesados y lotes de caminos de la ventana actual.
+    """
+
+    def __init__(
+        self,
+        electric_graph: GrafoAdyacencia,
+        road_graph: GrafoAdyacencia,
+        water_graph: GrafoAdyacencia,
+        cache: Optional[CacheConsultas] = None,
+        motor=None,
+        procesos: Optional[int] = None,
+    ):
+        """
+        procesos: tamaño del pool de MATRIZ_DISTANCIAS y BARRIDO_CORTES (None = uno por CPU);
+        con 1 todo corre en este proceso, p. ej. desde un hilo, donde hacer fork no es seguro.
+        """
+        self.electric_graph = electric_graph
+        self.road_graph = road_graph
+        self.water_graph = water_graph
+        self.cache = cache if cache is not None else CacheConsultas()
+        self.motor = motor
+        self.procesos = procesos
+        # los kernels enteros trabajan sobre la vista CSR (se congela una vez por epoch)
+        self.road_csr = derivado(road_graph, "csr")
+        # caminos por lotes (uno-a-muchos) de la ventana actual; ver preparar()
+        self.agrupados: Dict[Tuple[str, str, frozenset], Tuple[float, List[str]]] = {}
+        # los cortes reutilizan el árbol sin cortes de cada origen
+        self.simulador = SimuladorCortes(self.road_csr) if motor is None else None
+        # asignación de plantas incremental: cada consulta parte de las plantas de la anterior
+        self.plantas_motor = AsignacionPlantas(derivado(water_graph, "csr"))
+        # con traza: dict donde sumar "parse_s" / "formato_s" de la consulta en curso
+        self.tiempos: Optional[Dict[str, float]] = None
+
+    def preparar(self, lineas: List[str]):
+        """Resuelve juntos los caminos de 'lineas' que comparten origen y cortes."""
+        self.agrupados = _caminos_agrupados(self.road_csr, lineas) if self.motor is None else {}
+
+    def respuestas(self, lineas: Iterable[str], ventana: int = 256) -> Iterator[Optional[Salida]]:
+        """
+        Respuestas de 'lineas' en orden, leyendo de a 'ventana' líneas (memoria acotada aunque
+        la entrada sea enorme). Tras cada ventana emite None para que el escritor haga flush.
+        """
+        it = iter(lineas)
+        while True:
+            bloque = list(islice(it, ventana))
+            if not bloque:
+                return
+            self.preparar(bloque)
+            for line in bloque:
+                yield from self.responder(line)
+            yield None
+
+    def _camino(self, origen: str, destino: str, cortes: List[str]) -> Tuple[float, List[str]]:
+        args = (origen, destino, frozenset(cortes))
+        motor = self.motor or (self.simulador if cortes else None)
+        return self.cache.obtener(
+            _clave("CAMINO_MINIMO", args, self.road_graph),
+            lambda: self.agrupados.get(args) or _camino_minimo(self.road_csr, origen, destino, cortes, motor),
+        )
+
+    def _fase(self, fase: str, funcion: Callable, *args):
+        """funcion(*args), sumando su tiempo a self.tiempos[fase] si hay traza."""
+        if self.tiempos is None:
+            return funcion(*args)
+        t0 = time.perf_counter()
+        try:
+            return funcion(*args)
+        finally:
+            self.tiempos[fase] += time.perf_counter() - t0
+
+    def responder(self, line: str) -> List[Salida]:
+        """Respuestas formateadas de una línea de consulta (una por destino en las MULTI)."""
+        electric_graph, road_graph, water_graph = self.electric_graph, self.road_graph, self.water_graph
+        cache = self.cache
+        tokens = line.split()
+        op = tokens[0].upper()
+
+        # ---------------- Eléctrica ----------------
+        if op in ("COMPONENTES_CONEXOS", "COMPONENTES_ELECTRICA"):
+            comps = cache.obtener(
+                _clave("COMPONENTES_CONEXOS", (), electric_graph),
+                lambda: IndiceConectividad.de(electric_graph).componentes(),
+            )
+            return [self._fase("formato_s", format_componentes_conexos, comps)]
+
+        if op in ("MISMA_RED", "MISMA_RED_ELECTRICA"):
+            a, b = (tokens[1], tokens[2]) if len(tokens) >= 3 else ("?", "?")
+            conectados = IndiceConectividad.de(electric_graph).mismo_componente(a, b)
+            return [self._fase("formato_s", format_misma_red, a, b, conectados)]
+
+        if op in ("OUTAGE", "OUTAGE_ELECTRICA"):
+            # aplica las bajas sobre el grafo (quedan para las consultas siguientes)
+            # sólo se informan las bajas que existían; las pedidas que no, aparte
+            lineas_out, subestaciones = self._fase("parse_s", _parse_outage, line)
+            indice = IndiceConectividad.de(electric_graph)
+            caidas: List[Tuple[str, str]] = []
+            fuera: List[str] = []
+            inexistentes: List[str] = []
+            try:
+                for a, b in lineas_out:
+                    if electric_graph.exists_edge(a, b):
+                        electric_graph.delete_edge(a, b)
+                        caidas.append((a, b))
+                    else:
+                        inexistentes.append(f"{a}-{b}")
+                for v in subestaciones:
+                    if v in electric_graph.name_to_idx:
+                        electric_graph.delete_vertex(v)
+                        fuera.append(v)
+                    else:
+                        inexistentes.append(v)
+            except TypeError:
+                return [f"# OUTAGE no soportado: el grafo eléctrico es de sólo lectura (snapshot o CSR): {line}\n"]
+            return [self._fase("formato_s", format_outage, caidas, fuera, indice.componentes(), inexistentes)]
+
+        if op in ("ORDEN_FALLOS", "ORDEN_FALLOS_ELECTRICA"):
+            grados = cache.obtener(
+                _clave("ORDEN_FALLOS", (), electric_graph),
+                lambda: list(derivado(electric_graph, "grados").items()),
+            )
+            return [self._fase("formato_s", format_orden_fallos, grados)]
+
+        # ---------------- Vial (ponderado) ----------------
+        if op == "CAMINO_MINIMO":
+            if len(tokens) < 3:
+                return [self._fase("formato_s", format_camino_minimo, "?", "?", float("inf"), [])]
+            origen, destino = tokens[1], tokens[2]
+            d, ruta = self._camino(origen, destino, [])
+            return [self._fase("formato_s", format_camino_minimo, origen, destino, d, ruta)]
+
+        if op == "CAMINO_MINIMO_MULTI":
+            origen, destinos = self._fase("parse_s", _parse_multi, tokens)
+            if origen == "?" or not destinos:
+                return [self._fase("formato_s", format_camino_minimo, origen, "?", float("inf"), [])]
+            salidas: List[Salida] = []
+            for destino in destinos:
+                d, ruta = self._camino(origen, destino, [])
+                salidas.append(self._fase("formato_s", format_camino_minimo, origen, destino, d, ruta))
+            return salidas
+
+        if op in ("SIMULAR_CORTE", "CAMINO_MINIMO_SIMULAR_CORTE"):
+            origen, destino, cortes = self._fase("parse_s", _parse_simular_corte, line, tokens)
+            if origen == "?" or destino == "?":
+                return [self._fase("formato_s", format_simulacion_corte, origen, destino, cortes, float("inf"), [])]
+            d, ruta = self._camino(origen, destino, cortes)
+            return [self._fase("formato_s", format_simulacion_corte, origen, destino, cortes, d, ruta)]
+
+        if op in ("RUTA_RECOLECCION", "CAMINO_RECOLECCION_BASURA"):
+            ruta = cache.obtener(
+                _clave("CAMINO_RECOLECCION_BASURA", (), road_graph),
+                lambda: _ruta_recoleccion(road_graph),
+            )
+            return [self._fase("formato_s", format_ruta_recoleccion, ruta)]
+
+        if op == "BARRIDO_CORTES":
+            escenarios, pares = self._fase("parse_s", _parse_barrido, line)
+            base, demoras = _barrido_cortes(self.road_csr, escenarios, pares, self.procesos)
+            return [self._fase("formato_s", format_barrido_cortes, escenarios, pares, base, demoras)]
+
+        if op == "MATRIZ_DISTANCIAS":
+            metodo = tokens[1].lower() if len(tokens) > 1 else "auto"
+            if metodo not in ("auto", "floyd", "dijkstra"):
+                return [f"# Consulta desconocida: {line}\n"]
+            return [self._fase("formato_s", format_matriz_distancias_filas, _filas_matriz(self.road_csr, metodo, self.procesos))]
+
+        # ---------------- Hídrica ----------------
+        if op in ("PUENTES_Y_ARTICULACIONES", "PUENTES_ARTICULACIONES"):
+            articulaciones, puentes = cache.obtener(
+                _clave("PUENTES_Y_ARTICULACIONES", (), water_graph),
+                lambda: derivado(water_graph, "criticos"),
+            )
+            return [self._fase("formato_s", format_puentes_y_articulaciones, articulaciones, puentes)]
+
+        if op in ("PLANTAS", "PLANTAS_ASIGNADAS"):
+            # PLANTAS_ASIGNADAS Saavedra VillaSoldati
+            # o PLANTAS plantas: Saavedra, VillaSoldati
+            plantas = self._fase("parse_s", _parse_plantas, line)
+            asign = cache.obtener(
+                _clave("PLANTAS_ASIGNADAS", frozenset(plantas), water_graph),
+                lambda: _asignar_plantas(self.plantas_motor, plantas),
+            )
+            return [self._fase("formato_s", format_plantas_asignadas, plantas, asign)]
+
+        # Comando desconocido → comentario (te puede ayudar a debuggear)
+        return [f"# Consulta desconocida: {line}\n"]
+
+
+# ---------- ejecución en paralelo (--workers) ----------
+# Quedan fuera del pool: OUTAGE modifica el grafo eléctrico (barrera: lo que sigue tiene
+# que verlo, así que se re-forkean los workers) y las consultas que ya reparten su trabajo
+# en procesos propios (los workers de un Pool no pueden tener hijos).
+_BARRERAS = ("OUTAGE", "OUTAGE_ELECTRICA")
+_LOCALES = ("MATRIZ_DISTANCIAS", "BARRIDO_CORTES")
+
+# procesador que heredan los workers por fork (grafos incluidos, sin serializarlos)
+_PROCESADOR_WORKER: Optional["ProcesadorConsultas"] = None
+
+
+def _responder_lote(lineas: List[str]) -> List[str]:
+    """En un worker: responde un lote de líneas consecutivas y devuelve el texto de cada respuesta."""
+    procesador = _PROCESADOR_WORKER
+    procesador.preparar(lineas)
+    return [
+        salida if isinstance(salida, str) else "".join(salida)
+        for line in lineas
+        for salida in procesador.responder(line)
+    ]
+
+
+def _planificar(lineas: List[str], workers: int) -> List[Tuple[str, Union[str, List[str]]]]:
+    """
+    Parte 'lineas' en tareas en orden: ("local", línea) o ("lote", líneas consecutivas)
+    para el pool, con lotes chicos para repartir bien entre 'workers'.
+    """
+    tam = max(1, len(lineas) // (workers * 4))
+    tareas: List[Tuple[str, Union[str, List[str]]]] = []
+    lote: List[str] = []
+    for line in lineas:
+        if line.split()[0].upper() in _LOCALES:
+            if lote:
+                tareas.append(("lote", lote))
+                lote = []
+            tareas.append(("local", line))
+            continue
+        lote.append(line)
+        if len(lote) >= tam:
+            tareas.append(("lote", lote))
+            lote = []
+    if lote:
+        tareas.append(("lote", lote))
+    return tareas
+
+
+def _respuestas_paralelas(
+    procesador: "ProcesadorConsultas", lineas: Iterable[str], workers: int, ventana: int
+) -> Iterator[Optional[Salida]]:
+    """
+    Igual que procesador.respuestas(lineas, ventana), pero repartiendo los lotes de cada
+    ventana en un pool de 'workers' procesos (fork) y devolviendo las respuestas en el
+    orden de entrada.
+    """
+    global _PROCESADOR_WORKER
+    import multiprocessing
+    contexto = multiprocessing.get_context("fork")
+    pool = None
+    it = iter(lineas)
+    try:
+        while True:
+            bloque = list(islice(it, ventana))
+            if not bloque:
+                break
+            segmento: List[str] = []
+            for line in bloque + [None]:
+                es_barrera = line is not None and line.split()[0].upper() in _BARRERAS
+                if line is not None and not es_barrera:
+                    segmento.append(line)
+                    continue
+                if segmento:
+                    if pool is None:
+                        _PROCESADOR_WORKER = procesador
+                        pool = contexto.Pool(workers)
+                    # se encola todo el segmento y se consume en orden
+                    tareas = [
+                        (tipo, pool.apply_async(_responder_lote, (x,)) if tipo == "lote" else x)
+                        for tipo, x in _planificar(segmento, workers)
+                    ]
+                    for tipo, x in tareas:
+                        if tipo == "lote":
+                            yield from x.get()
+                        else:
+                            yield from procesador.responder(x)
+                    segmento = []
+                if es_barrera:
+                    yield from procesador.responder(line)
+                    if pool is not None:
+                        # los workers tienen el grafo de antes: se descartan
+                        pool.close()
+                        pool.join()
+                        pool = None
+            yield None
+        if pool is not None:
+            pool.close()
+            pool.join()
+            pool = None
+    finally:
+        if pool is not None:
+            pool.terminate()
+        _PROCESADOR_WORKER = None
+
+
 def process_queries(
     queries_file: str,
     output_file: str,
     electric_graph: GrafoAdyacencia,
     road_graph: GrafoAdyacencia,
     water_graph: GrafoAdyacencia,
+    cache: Optional[CacheConsultas] = None,
+    motor=None,
+    ventana: int = 256,
+    workers: int = 1,
+    traza: Optional[str] = None,
 ):
     """
-    Lee el archivo de consultas y escribe las respuestas formateadas.
+    Lee el archivo de consultas y escribe las respuestas formateadas, en flujo:
+    leer → parsear → ejecutar → formatear → escribir, de a 'ventana' líneas y con flush
+    al terminar cada una. queries_file / output_file pueden ser "-" (stdin / stdout).
+    La conectividad eléctrica se sirve del IndiceConectividad enganchado al grafo, que sigue
+    al día si se agregan o quitan líneas entre consultas (p. ej. con OUTAGE).
+    Los resultados se memorizan en 'cache' (LRU; por defecto uno nuevo de 1024 entradas),
+    así las consultas repetidas no se recalculan.
+    'motor' es un motor de caminos mínimos preprocesado sobre la vista CSR de road_graph
+    (p. ej. ALT(derivado(road_graph, "csr"))) con método camino(s, t, banned).
+    Si no se da, las consultas viales de una misma ventana que comparten origen y cortes se
+    resuelven juntas con una búsqueda uno-a-muchos, las sueltas con Dijkstra bidireccional
+    y las que tienen cortes con SimuladorCortes (repara sólo lo que el corte cambia del
+    árbol sin cortes).
     Soporta tanto los nombres "cortos" como los del enunciado/consultas.txt:
       - COMPONENTES_CONEXOS ELECTRICA
       - ORDEN_FALLOS ELECTRICA
+      - MISMA_RED <a> <b>
+      - OUTAGE <a>:<b> ... <subestacion> ...   (modifica electric_graph)
       - CAMINO_MINIMO <origen> <destino>
       - CAMINO_MINIMO_SIMULAR_CORTE {a,b,c} <origen> <destino>
+      - CAMINO_MINIMO_MULTI <origen> {d1,d2,...}
       - CAMINO_RECOLECCION_BASURA
       - PLANTAS_ASIGNADAS p1 p2 ...
       - PUENTES_Y_ARTICULACIONES
+      - MATRIZ_DISTANCIAS [floyd|dijkstra]
+      - BARRIDO_CORTES {a,b} {c} ... origen:destino ...
+    La matriz de distancias se calcula y escribe fila por fila.
+    Con workers > 1 las consultas de cada ventana se reparten en un pool de procesos que
+    heredan los grafos por fork; la salida queda en el mismo orden que la entrada.
+    Con 'traza' (archivo, o "-" para stderr) cada consulta deja una línea JSON con sus tiempos
+    de parseo, cálculo y formato y los contadores de los recorridos (ver src.instrumentacion),
+    y al final se imprime el resumen en stderr. Con traza las consultas corren en este proceso.
     """
-    outputs: List[str] = []
-
-    with open(queries_file, encoding="utf-8") as f:
-        for raw in f:
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            tokens = line.split()
-            op = tokens[0].upper()
-
-            # ---------------- Eléctrica ----------------
-            if op in ("COMPONENTES_CONEXOS", "COMPONENTES_ELECTRICA"):
-                comps = ComponentesConexos.compute(electric_graph)
-                outputs.append(format_componentes_conexos(comps))
-
-            elif op in ("ORDEN_FALLOS", "ORDEN_FALLOS_ELECTRICA"):
-                grados = [
-                    (v, len(electric_graph.get_adjacency_list(v)))
-                    for v in electric_graph.vertices()
-                ]
-                outputs.append(format_orden_fallos(grados))
-
-            # ---------------- Vial (ponderado) ----------------
-            elif op == "CAMINO_MINIMO":
-                if len(tokens) < 3:
-                    outputs.append(format_camino_minimo("?", "?", float("inf"), []))
-                    continue
-                origen, destino = tokens[1], tokens[2]
-                dist, parent = Dijkstra.compute(road_graph, origen, destino)
-                d = dist.get(destino, float("inf"))
-                camino = Dijkstra.path(parent, destino)
-                outputs.append(format_camino_minimo(origen, destino, d, camino))
-
-            elif op in ("SIMULAR_CORTE", "CAMINO_MINIMO_SIMULAR_CORTE"):
-                # Soportar dos formatos:
-                # 1) SIMULAR_CORTE origen destino cortes: a,b,c
-                # 2) CAMINO_MINIMO_SIMULAR_CORTE {a,b,c} origen destino   (como en consultas.txt)
-                origen = destino = "?"
-                cortes: List[str] = []
-
-                # Formato con llaves: CAMINO_MINIMO_SIMULAR_CORTE {a,b,c} origen destino
-                if len(tokens) >= 4 and tokens[1].startswith("{"):
-                    cortes_token = tokens[1]
-                    cortes_str = cortes_token.strip("{}")
-                    cortes = [c.strip() for c in cortes_str.split(",") if c.strip()]
-                    origen, destino = tokens[2], tokens[3]
-                else:
-                    # Formato original: SIMULAR_CORTE origen destino cortes: ...
-                    if len(tokens) >= 3:
-                        origen, destino = tokens[1], tokens[2]
-                    cortes = _parse_cortes(line)
-
-                if origen == "?" or destino == "?":
-                    outputs.append(
-                        format_simulacion_corte(origen, destino, cortes, float("inf"), [])
-                    )
-                    continue
-
-                dist, parent = Dijkstra.compute(
-                    road_graph, origen, destino, banned=set(cortes)
-                )
-                d = dist.get(destino, float("inf"))
-                camino = Dijkstra.path(parent, destino)
-                outputs.append(
-                    format_simulacion_corte(origen, destino, cortes, d, camino)
-                )
-
-            elif op in ("RUTA_RECOLECCION", "CAMINO_RECOLECCION_BASURA"):
-                ruta = Hierholzer.compute(road_graph)
-                if not ruta:
-                    comps = ComponentesConexos.compute(road_graph)
-                    ruta = max(comps, key=len) if comps else []
-                outputs.append(format_ruta_recoleccion(ruta))
-
-            # ---------------- Hídrica ----------------
-            elif op in ("PUENTES_Y_ARTICULACIONES", "PUENTES_ARTICULACIONES"):
-                articulaciones, puentes = TarjanCriticos.compute(water_graph)
-                outputs.append(
-                    format_puentes_y_articulaciones(articulaciones, puentes)
-                )
-
-            elif op in ("PLANTAS", "PLANTAS_ASIGNADAS"):
-                # PLANTAS_ASIGNADAS Saavedra VillaSoldati
-                # o PLANTAS plantas: Saavedra, VillaSoldati
-                plantas = _parse_plantas(line)
-                asign = _asignar_plantas_bfs_multiorigen(water_graph, plantas)
-                outputs.append(format_plantas_asignadas(plantas, asign))
-
-            else:
-                # Comando desconocido → comentario (te puede ayudar a debuggear)
-                outputs.append(f"# Consulta desconocida: {line}\n")
-
-    with open(output_file, "w", encoding="utf-8") as out:
-        out.write("\n".join(outputs))
+    procesador = ProcesadorConsultas(electric_graph, road_graph, water_graph, cache, motor)
+    lineas = _leer_consultas(queries_file)
+    if traza is not None:
+        from src.instrumentacion import Instrumentacion
+        with Instrumentacion(traza) as instrumentacion:
+            _escribir_salidas(instrumentacion.respuestas(procesador, lineas, ventana), output_file)
+        print(instrumentacion.tabla(), end="", file=sys.stderr)
+        return
+    salidas = None
+    if workers > 1:
+        # multiprocessing se importa recién acá: pesa ~10 ms en cada arranque
+        import multiprocessing
+        if "fork" in multiprocessing.get_all_start_methods():
+            salidas = _respuestas_paralelas(procesador, lineas, workers, ventana)
+    if salidas is None:
+        salidas = procesador.respuestas(lineas, ventana)
+    _escribir_salidas(salidas, output_file)
@@ -57,6 +57,66 @@ def format_componentes_conexos(componentes):
     return "\n".join(output)
 
 
+def format_misma_red(a, b, conectados):
+    """
+    Formatea la consulta "¿A y B están en la misma red eléctrica?".
+
+    Args:
+        a: Primer nodo
+        b: Segundo nodo
+        conectados: True si están en el mismo componente conexo
+
+    Returns:
+        String formateado con la respuesta
+    """
+    output = []
+    output.append("-" * 60)
+    output.append(f"MISMA RED ELÉCTRICA: {a} ↔ {b}")
+    output.append("-" * 60)
+    if conectados:
+        output.append("Resultado: SÍ, están en la misma red")
+    else:
+        output.append("Resultado: NO, están en redes distintas")
+    output.append("")
+    return "\n".join(output)
+
+
+def format_outage(lineas, subestaciones, componentes, inexistentes=()):
+    """
+    Formatea el resultado de sacar de servicio líneas y subestaciones eléctricas.
+
+    Args:
+        lineas: Lista de tuplas (u, v) de líneas quitadas
+        subestaciones: Lista de nodos quitados
+        componentes: Componentes conexos resultantes (islas)
+        inexistentes: Líneas ('u-v') y subestaciones pedidas que no existían (no se quitó nada)
+
+    Returns:
+        String formateado con las islas resultantes
+    """
+    output = []
+    output.append("=" * 60)
+    output.append("OUTAGE - RED ELÉCTRICA")
+    output.append("=" * 60)
+    output.append(f"Líneas fuera de servicio: {', '.join(f'{u}-{v}' for u, v in sorted(lineas)) or '(ninguna)'}")
+    output.append(f"Subestaciones fuera de servicio: {', '.join(sorted(subestaciones)) or '(ninguna)'}")
+    if inexistentes:
+        output.append(f"Inexistentes (ignoradas): {', '.join(sorted(inexistentes))}")
+    output.append(f"Islas resultantes: {len(componentes)}")
+
+    # Mismo orden que format_componentes_conexos
+    componentes_sorted = sorted(
+        [sorted(comp) for comp in componentes],
+        key=lambda c: (-len(c), c[0] if c else "")
+    )
+    for i, comp in enumerate(componentes_sorted, 1):
+        output.append(f"Isla {i} ({len(comp)} nodos):")
+        output.append(wrap_list(comp))
+
+    output.append("")
+    return "\n".join(output)
+
+
 def format_orden_fallos(nodos_grados):
     """
     Formatea la salida de orden de fallos agrupado por grado.
@@ -269,29 +329,79 @@ def format_matriz_distancias(matriz):
     Returns:
         String formateado con la matriz de distancias
     """
-    output = []
-    output.append("=" * 60)
-    output.append("MATRIZ DE DISTANCIAS")
-    output.append("=" * 60)
-    output.append("")
-
     # Obtener todos los nodos ordenados
     nodos = sorted(matriz.keys())
+    return "".join(format_matriz_distancias_filas((origen, matriz[origen]) for origen in nodos))
+
+
+def format_matriz_distancias_filas(filas):
+    """
+    Versión por partes de format_matriz_distancias: recibe las filas de a una y va
+    generando el texto, sin necesitar la matriz completa en memoria.
+
+    Args:
+        filas: Iterable de (origen, {destino: distancia}), ya ordenado por origen
+
+    Returns:
+        Generador de strings; concatenados dan lo mismo que format_matriz_distancias
+    """
+    yield "=" * 60
+    yield "\nMATRIZ DE DISTANCIAS"
+    yield "\n" + "=" * 60
+    yield "\n"
 
     # Mostrar en formato de tabla compacta
-    for origen in nodos:
-        output.append(f"{origen}:")
-        destinos_con_dist = [(dest, matriz[origen][dest])
-                            for dest in sorted(matriz[origen].keys())
-                            if matriz[origen][dest] != float('inf') and dest != origen]
+    for origen, fila in filas:
+        yield f"\n{origen}:"
+        destinos_con_dist = [(dest, fila[dest])
+                            for dest in sorted(fila.keys())
+                            if fila[dest] != float('inf') and dest != origen]
 
         if destinos_con_dist:
             lineas = []
             for dest, dist in destinos_con_dist:
                 lineas.append(f"{dest}:{dist}")
-            output.append(f"  {', '.join(lineas)}")
+            yield f"\n  {', '.join(lineas)}"
         else:
-            output.append("  (sin conexiones)")
+            yield "\n  (sin conexiones)"
+
+    yield "\n"
 
+
+def format_barrido_cortes(escenarios, pares, base, demoras):
+    """
+    Formatea un barrido de escenarios de corte como tabla compacta de demoras.
+
+    Args:
+        escenarios: Lista de escenarios (cada uno, lista de nodos cortados)
+        pares: Lista de tuplas (origen, destino)
+        base: Distancias sin cortes de cada par (float o inf)
+        demoras: demoras[i][j] = demora del par j con el escenario i (float o inf)
+
+    Returns:
+        String formateado con la tabla de demoras
+    """
+    def celda(x, signo):
+        if x == float('inf'):
+            return "SIN RUTA"
+        return f"+{x}" if signo else f"{x}"
+
+    columnas = [f"{o}→{d}" for o, d in pares]
+    filas = [["Sin cortes"] + [celda(b, False) for b in base]]
+    for escenario, fila in zip(escenarios, demoras):
+        # Ordenar cortes alfabéticamente para determinismo
+        nombre = ", ".join(sorted(escenario)) or "(ninguno)"
+        # sin ruta base no hay demora que medir
+        filas.append([nombre] + [celda(x, True) if b != float('inf') else "-" for x, b in zip(fila, base)])
+    encabezado = ["Escenario"] + columnas
+    anchos = [max(len(f[k]) for f in [encabezado] + filas) for k in range(len(encabezado))]
+
+    output = []
+    output.append("-" * 60)
+    output.append(f"BARRIDO DE CORTES: {len(escenarios)} escenarios x {len(pares)} pares")
+    output.append("Demora respecto de la ruta sin cortes (minutos)")
+    output.append("-" * 60)
+    for fila in [encabezado] + filas:
+        output.append("  ".join(c.ljust(a) for c, a in zip(fila, anchos)).rstrip())
     output.append("")
     return "\n".join(output)
@@ -0,0 +1,166 @@
+"""
+Servidor de consultas: carga las tres redes una sola vez y responde consultas por socket.
+
+Protocolo (texto UTF-8, una consulta por línea, misma sintaxis que el archivo de consultas):
+- cada consulta se responde con el mismo texto que process_queries escribiría para ella,
+  un salto de línea y la línea FIN ("# FIN");
+- errores y tiempo agotado: una línea "# ERROR: ..." y después la línea FIN. Una consulta
+  cuyo plazo vence mientras espera turno ya no se ejecuta; la que vence calculando termina
+  en segundo plano (el hilo no se puede interrumpir) y su resultado se descarta;
+- comandos del servidor: PING, RELOAD [electrico vial hidrico] (recarga y cambia los
+  grafos de una vez; las consultas en curso terminan con los anteriores) y QUIT.
+
+Con --motor alt|ch los caminos mínimos se responden con un motor preprocesado (ver
+src.main.crear_motor); se vuelve a preparar en cada RELOAD.
+
+Uso:
+    python -m src.servidor <electric_file> <road_file> <water_file> [--port N | --unix PATH] [--timeout S]
+                           [--motor alt|ch [--landmarks FILE]]
+"""
+
+from __future__ import annotations
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from src.main import MOTORES, ProcesadorConsultas, crear_motor, load_graph, load_weighted_graph
+
+FIN = "# FIN"
+
+
+def _cargar(archivos: Sequence[str], motor: Optional[str] = None, landmarks: Optional[str] = None) -> ProcesadorConsultas:
+    electrico, vial, hidrico = archivos
+    road_graph = load_weighted_graph(vial)
+    # las consultas corren en un hilo del executor: hacer fork ahí (pools de MATRIZ_DISTANCIAS
+    # y BARRIDO_CORTES) puede dejar el hijo trabado con un lock tomado, así que todo en proceso
+    return ProcesadorConsultas(
+        load_graph(electrico), road_graph, load_graph(hidrico),
+        motor=crear_motor(road_graph, motor, landmarks) if motor else None,
+        procesos=1,
+    )
+
+
+class _Vencida(Exception):
+    """El plazo de la consulta venció antes de que le tocara ejecutarse."""
+
+
+def _responder(procesador: ProcesadorConsultas, line: str, vence: Optional[float] = None) -> str:
+    """
+    Texto de la respuesta a una línea (las respuestas múltiples van separadas como en el archivo).
+    'vence' es el plazo en time.monotonic(): si ya pasó, no se calcula nada.
+    """
+    if vence is not None and time.monotonic() >= vence:
+        raise _Vencida
+    procesador.preparar([line])
+    partes = [s if isinstance(s, str) else "".join(s) for s in procesador.responder(line)]
+    return "\n".join(partes)
+
+
+class ServidorConsultas:
+    def __init__(
+        self, archivos: Sequence[str], timeout: float = 30.0, motor: Optional[str] = None, landmarks: Optional[str] = None
+    ):
+        self.archivos: Tuple[str, str, str] = tuple(archivos)
+        self.timeout = timeout
+        self.motor, self.landmarks = motor, landmarks
+        self.procesador = _cargar(self.archivos, motor, landmarks)
+        # el procesador no es seguro entre hilos: las consultas se ejecutan de a una,
+        # fuera del event loop, que sigue atendiendo conexiones mientras tanto
+        self._consultas = ThreadPoolExecutor(max_workers=1, thread_name_prefix="consulta")
+        self._recargas = ThreadPoolExecutor(max_workers=1, thread_name_prefix="recarga")
+        self.clientes = 0
+        self.atendidas = 0
+
+    # ---------- comandos ----------
+    async def _recargar(self, archivos: Optional[List[str]]) -> str:
+        archivos = tuple(archivos) if archivos else self.archivos
+        loop = asyncio.get_running_loop()
+        nuevo = await loop.run_in_executor(self._recargas, _cargar, archivos, self.motor, self.landmarks)
+        # un solo cambio de referencia: las consultas ya lanzadas siguen con el anterior
+        self.procesador, self.archivos = nuevo, archivos
+        return f"# RECARGADO: {', '.join(archivos)}"
+
+    async def _consulta(self, line: str) -> str:
+        loop = asyncio.get_running_loop()
+        tokens = line.split()
+        op = tokens[0].upper()
+        if op == "PING":
+            return "# PONG"
+        if op == "RELOAD":
+            if len(tokens) not in (1, 4):
+                return "# ERROR: uso RELOAD [electrico vial hidrico]"
+            return await self._recargar(tokens[1:])
+        vence = time.monotonic() + self.timeout
+        futuro = loop.run_in_executor(self._consultas, _responder, self.procesador, line, vence)
+        try:
+            # al vencer, wait_for cancela el futuro: si seguía en la cola ya no se ejecuta
+            # (y si justo arrancaba, _responder ve el plazo vencido y no calcula)
+            respuesta = await asyncio.wait_for(futuro, self.timeout)
+        except (asyncio.TimeoutError, _Vencida):
+            return f"# ERROR: tiempo agotado ({self.timeout:g} s): {line}"
+        self.atendidas += 1
+        return respuesta
+
+    # ---------- conexiones ----------
+    async def atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.clientes += 1
+        try:
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                line = raw.decode("utf-8", errors="replace").strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line.upper() == "QUIT":
+                    break
+                try:
+                    respuesta = await self._consulta(line)
+                except Exception as e:      # la conexión sigue viva ante una consulta rota
+                    respuesta = f"# ERROR: {type(e).__name__}: {e}"
+                writer.write((respuesta + "\n" + FIN + "\n").encode("utf-8"))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.clientes -= 1
+            writer.close()
+
+    async def servir(self, host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None):
+        if unix:
+            server = await asyncio.start_unix_server(self.atender, path=unix)
+        else:
+            server = await asyncio.start_server(self.atender, host, port)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv: Sequence[str]):
+    args = list(argv)
+    opciones = {"--port": "8765", "--unix": None, "--timeout": "30", "--motor": None, "--landmarks": None}
+    for opcion in list(opciones):
+        if opcion in args:
+            i = args.index(opcion)
+            opciones[opcion] = args[i + 1] if i + 1 < len(args) else None
+            del args[i:i + 2]
+    motor, landmarks = opciones["--motor"], opciones["--landmarks"]
+    motor_invalido = ("--motor" in argv and motor not in MOTORES) or (
+        "--landmarks" in argv and (motor != "alt" or landmarks is None)
+    )
+    if len(args) != 3 or opciones["--port"] is None or opciones["--timeout"] is None or motor_invalido:
+        print("Usage: python -m src.servidor <electric_file> <road_file> <water_file> "
+              "[--port N | --unix PATH] [--timeout S] [--motor alt|ch [--landmarks FILE]]")
+        sys.exit(1)
+    servidor = ServidorConsultas(args, timeout=float(opciones["--timeout"]), motor=motor, landmarks=landmarks)
+    destino = opciones["--unix"] or f"127.0.0.1:{opciones['--port']}"
+    print(f"✓ Graphs loaded. Listening on {destino}", file=sys.stderr)
+    try:
+        asyncio.run(servidor.servir(port=int(opciones["--port"]), unix=opciones["--unix"]))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,34 @@
+"""
+Grafos aleatorios para las pruebas de equivalencia contra los algoritmos de referencia
+(Dijkstra.compute, ComponentesConexos.compute, BFSMultiorigen.compute).
+"""
+
+import random
+
+import pytest
+
+from src.grafo import GrafoAdyacencia
+
+
+def grafo_aleatorio(rng: random.Random, n: int, p: float, pesos=(1.0, 2.0, 3.0)) -> GrafoAdyacencia:
+    """
+    G(n, p) no dirigido con barrios de nombres desordenados respecto de los índices (el
+    desempate por nombre no coincide con el orden de carga). Pesos chicos y repetidos:
+    hay muchos caminos mínimos empatados. pesos=None deja todas las aristas en 1.0.
+    """
+    nombres = [f"B{i:03d}" for i in range(n)]
+    rng.shuffle(nombres)
+    aristas = [
+        (nombres[a], nombres[b], rng.choice(pesos) if pesos else 1.0)
+        for a in range(n) for b in range(a + 1, n) if rng.random() < p
+    ]
+    g = GrafoAdyacencia.from_edges(aristas)
+    for v in nombres:      # los aislados también son barrios
+        g.add_vertex(v)
+    return g
+
+
+@pytest.fixture
+def grafos():
+    """Fábrica de grafos aleatorios: grafos(semilla, n, p, pesos=...)."""
+    return lambda semilla, n, p, **kw: grafo_aleatorio(random.Random(semilla), n, p, **kw)
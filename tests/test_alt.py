@@ -0,0 +1,103 @@
+"""ALT contra Dijkstra.compute; tablas de landmarks guardadas y reabiertas."""
+
+import json
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from src.algoritmos import ALT, Dijkstra, derivado
+from src.grafo import GrafoCSR
+from src.main import MOTORES, _camino_minimo, crear_motor, load_graph, load_weighted_graph, process_queries
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+INF = float("inf")
+
+
+def _referencia(g, origen, destino, cortes=()):
+    dist, parent = Dijkstra.compute(g, origen, destino, banned=set(cortes))
+    return dist.get(destino, INF), Dijkstra.path(parent, destino)
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_alt_igual_a_dijkstra(grafos, semilla):
+    """Mismo camino que Dijkstra, con cortes y muchos empates (desempate por nombre)."""
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(2, 40), rng.choice((0.05, 0.1, 0.3)), pesos=rng.choice(((1.0, 2.0), None)))
+    csr = GrafoCSR.from_grafo(g)
+    alt = ALT(csr, k=rng.randint(1, 4))
+    for _ in range(30):
+        s, t = rng.choice(g.vs), rng.choice(g.vs)
+        cortes = rng.sample(g.vs, rng.randint(0, 3))
+        esperado = _referencia(g, s, t, cortes)
+        d, camino = alt.camino(csr.name_to_idx[s], csr.name_to_idx[t], [csr.name_to_idx[c] for c in cortes])
+        assert (d, [csr.vs[i] for i in camino]) == esperado, (s, t, cortes)
+        assert _camino_minimo(csr, s, t, cortes, motor=alt) == esperado
+    assert alt.consultas >= 30 and alt.total_fijados >= alt.fijados
+
+
+def test_crear_motor_reutiliza_landmarks(grafos, tmp_path):
+    g, otro = grafos(1, 30, 0.15), grafos(2, 30, 0.15)
+    tablas = tmp_path / "vial.alt"
+    alt = crear_motor(g, "alt", str(tablas))
+    assert tablas.exists() and alt.g is derivado(g, "csr")
+    reabierto = crear_motor(g, "alt", str(tablas))
+    assert reabierto.preproceso_seg == 0.0 and reabierto.landmarks == alt.landmarks
+    # tablas de otro grafo: se recalculan y se reescriben
+    assert crear_motor(otro, "alt", str(tablas)).preproceso_seg > 0.0
+    assert crear_motor(otro, "alt", str(tablas)).preproceso_seg == 0.0
+    for nombre in MOTORES:
+        motor = crear_motor(g, nombre)
+        csr = derivado(g, "csr")
+        for s in g.vs[:5]:
+            for t in g.vs[-5:]:
+                assert _camino_minimo(csr, s, t, motor=motor)[0] == _referencia(g, s, t)[0]
+    with pytest.raises(ValueError):
+        crear_motor(g, "otro")
+
+
+
+def test_tablas_de_un_grafo_con_otro_peso_se_rechazan(grafos, tmp_path):
+    g = grafos(3, 30, 0.15)
+    tablas = tmp_path / "vial.alt"
+    ALT(derivado(g, "csr")).guardar(str(tablas))
+    # mismo n y mismas aristas; sólo cambia un peso
+    a, b, w = next(iter(g.edges()))
+    g.add_edge(a, b, w + 5.0)
+    assert derivado(g, "csr").get_weight(a, b) == w + 5.0
+    with pytest.raises(ValueError):
+        ALT.cargar(derivado(g, "csr"), str(tablas))
+    motor = crear_motor(g, "alt", str(tablas))
+    assert motor.preproceso_seg > 0.0
+    csr = derivado(g, "csr")
+    for s in g.vs[:6]:
+        for t in g.vs[-6:]:
+            assert _camino_minimo(csr, s, t, motor=motor) == _referencia(g, s, t)
+    assert ALT.cargar(csr, str(tablas)).landmarks == motor.landmarks
+
+
+def test_fijados_en_la_traza_y_en_stderr(tmp_path):
+    datos = os.path.join(RAIZ, "resources", "ejemplo-48")
+    electrico, vial, hidrico = (os.path.join(datos, f"grafo_{n}_48.txt") for n in ("electrico", "vial", "hidrico"))
+    consultas = os.path.join(datos, "consultas.txt")
+    road = load_weighted_graph(vial)
+    motor = crear_motor(road, "alt")
+    traza = tmp_path / "traza.jsonl"
+    process_queries(consultas, str(tmp_path / "r.txt"), load_graph(electrico), road, load_graph(hidrico),
+                    motor=motor, traza=str(traza))
+    registros = [json.loads(l) for l in traza.read_text(encoding="utf-8").splitlines()]
+    caminos = [r for r in registros if r.get("op", "").startswith("CAMINO_MINIMO")]
+    assert caminos and all(r["fijados"] > 0 for r in caminos)
+    assert sum(r.get("fijados", 0) for r in registros) == motor.total_fijados > 0
+    assert motor.consultas == len(caminos)
+
+    res = subprocess.run(
+        [sys.executable, os.path.join(RAIZ, "run.py"), electrico, vial, hidrico, consultas, "-",
+         "--no-draw", "--motor", "alt"],
+        capture_output=True, text=True, check=True,
+    )
+    promedio = motor.total_fijados / motor.consultas
+    assert f"ALT: {promedio:.1f} vertices settled per query on average" in res.stderr
+    assert "settled" not in res.stdout
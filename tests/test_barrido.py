@@ -0,0 +1,65 @@
+"""BARRIDO_CORTES: la tabla de demoras contra _camino_minimo escenario por escenario."""
+
+import random
+
+import pytest
+
+from src.grafo import GrafoAdyacencia, GrafoCSR
+from src.main import ProcesadorConsultas, _camino_minimo
+from src.output import format_barrido_cortes
+
+INF = float("inf")
+
+
+def _procesador(vial, procesos=1):
+    otro = GrafoAdyacencia.from_edges([("A", "B")])
+    return ProcesadorConsultas(otro, vial, otro, procesos=procesos)
+
+
+def _esperado(vial, escenarios, pares):
+    """La misma tabla armada con un _camino_minimo por escenario y par."""
+    csr = GrafoCSR.from_grafo(vial)
+    base = [_camino_minimo(csr, o, d)[0] for o, d in pares]
+    demoras = [
+        [INF if d == INF else d - b for d, b in
+         ((_camino_minimo(csr, o, t, e)[0], b) for (o, t), b in zip(pares, base))]
+        for e in escenarios
+    ]
+    return format_barrido_cortes(escenarios, pares, base, demoras)
+
+
+def test_tabla_de_un_grafo_chico():
+    #   A -1- B -1- C
+    #    \         /
+    #     ---5-----      D aislado
+    vial = GrafoAdyacencia.from_edges([("A", "B", 1.0), ("B", "C", 1.0), ("A", "C", 5.0)])
+    vial.add_vertex("D")
+    respuesta = _procesador(vial).responder("BARRIDO_CORTES {B} { } {A, C} A:C C:A A:D X:X")[0]
+    assert respuesta == "\n".join([
+        "-" * 60,
+        "BARRIDO DE CORTES: 3 escenarios x 4 pares",
+        "Demora respecto de la ruta sin cortes (minutos)",
+        "-" * 60,
+        "Escenario   A→C       C→A       A→D       X→X",
+        "Sin cortes  2.0       2.0       SIN RUTA  0.0",
+        "B           +3.0      +3.0      -         +0.0",
+        "(ninguno)   +0.0      +0.0      -         +0.0",
+        "A, C        SIN RUTA  SIN RUTA  -         +0.0",
+        "",
+    ])
+    assert respuesta == _esperado(vial, [["B"], [], ["A", "C"]], [("A", "C"), ("C", "A"), ("A", "D"), ("X", "X")])
+
+
+@pytest.mark.parametrize("semilla", range(15))
+def test_igual_a_un_camino_minimo_por_escenario(grafos, semilla):
+    rng = random.Random(semilla)
+    vial = grafos(semilla, rng.randint(2, 30), rng.choice((0.05, 0.1, 0.3)))
+    barrios = vial.vs + ["X"]       # también un barrio inexistente
+    escenarios = [rng.sample(barrios, rng.randint(0, 3)) for _ in range(rng.randint(1, 10))]
+    pares = [(rng.choice(barrios), rng.choice(barrios)) for _ in range(rng.randint(1, 6))]
+    linea = "BARRIDO_CORTES " + " ".join("{" + ",".join(e) + "}" for e in escenarios) + " " + " ".join(
+        f"{o}:{d}" for o, d in pares)
+    esperado = _esperado(vial, escenarios, pares)
+    assert _procesador(vial).responder(linea) == [esperado]
+    # repartido en un pool de procesos (a partir de POOL_MIN_ESCENARIOS) da lo mismo
+    assert _procesador(vial, procesos=2).responder(linea) == [esperado]
@@ -0,0 +1,68 @@
+"""BFSMultiorigen contra la asignación de plantas original (heap de (dist, barrio, planta))."""
+
+import heapq
+import random
+
+import pytest
+
+from src.algoritmos import BFSMultiorigen
+from src.grafo import GrafoCSR
+
+
+def _asignar_con_heap(g, plantas):
+    """La implementación original de PLANTAS_ASIGNADAS, O(E log E), como referencia."""
+    dist, owner, pq = {}, {}, []
+    for p in plantas:
+        dist[p] = 0
+        owner[p] = p
+        heapq.heappush(pq, (0, p, p))
+    while pq:
+        d, u, planta = heapq.heappop(pq)
+        if dist.get(u, float("inf")) < d or owner.get(u) != planta:
+            continue
+        for v in g.get_adjacency_list(u):
+            nd = d + 1
+            better = (nd < dist.get(v, float("inf"))) or (
+                nd == dist.get(v, float("inf")) and planta < owner.get(v, "\uffff")
+            )
+            if better:
+                dist[v] = nd
+                owner[v] = planta
+                heapq.heappush(pq, (nd, v, planta))
+    return {v: owner.get(v, None) for v in g.vertices()}
+
+
+def _asignar_por_niveles(c, plantas, usar_numpy):
+    # fuentes en orden alfabético: la posición del dueño es el rango de la planta
+    ordenadas = sorted(set(plantas))
+    _, dueno = BFSMultiorigen.compute(c, [c.name_to_idx[p] for p in ordenadas], usar_numpy=usar_numpy)
+    return {v: (ordenadas[dueno[i]] if dueno[i] != -1 else None) for i, v in enumerate(c.vs)}
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_igual_a_la_asignacion_con_heap(grafos, semilla):
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(1, 60), rng.choice((0.02, 0.05, 0.2)), pesos=None)
+    c = GrafoCSR.from_grafo(g)
+    for _ in range(5):
+        # plantas repetidas y en cualquier orden; muchos empates de distancia
+        plantas = [rng.choice(g.vs) for _ in range(rng.randint(0, 6))]
+        esperado = _asignar_con_heap(g, plantas)
+        assert _asignar_por_niveles(c, plantas, usar_numpy=False) == esperado
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            continue
+        assert _asignar_por_niveles(c, plantas, usar_numpy=True) == esperado
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_bfs_multiorigen_numpy_igual_a_python(grafos, semilla):
+    pytest.importorskip("numpy")
+    rng = random.Random(semilla)
+    g = GrafoCSR.from_grafo(grafos(semilla, rng.randint(1, 60), rng.choice((0.02, 0.05, 0.2)), pesos=None))
+    # fuentes repetidas y en cualquier orden: gana la primera posición entre las más cercanas
+    fuentes = [rng.randrange(g.vertex_count) for _ in range(rng.randint(0, 6))]
+    python = BFSMultiorigen.compute(g, fuentes, usar_numpy=False)
+    numpy = BFSMultiorigen.compute(g, fuentes, usar_numpy=True)
+    assert (list(python[0]), list(python[1])) == ([int(x) for x in numpy[0]], [int(x) for x in numpy[1]])
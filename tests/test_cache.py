@@ -0,0 +1,69 @@
+"""CacheConsultas: orden de desalojo LRU, contadores y claves que cambian con cada mutación."""
+
+from src.cache import CacheConsultas
+from src.grafo import GrafoAdyacencia
+from src.main import ProcesadorConsultas, _clave
+
+
+def _calcular(calculados, valor):
+    def calcular():
+        calculados.append(valor)
+        return valor
+    return calcular
+
+
+def test_desaloja_el_menos_usado():
+    cache = CacheConsultas(maxsize=3)
+    calculados = []
+    for c in "abc":
+        cache.obtener(c, _calcular(calculados, c))
+    # usar "a" la vuelve la más reciente: al entrar "d" sale "b"
+    assert cache.obtener("a", _calcular(calculados, "?")) == "a"
+    cache.obtener("d", _calcular(calculados, "d"))
+    assert list(cache._datos) == ["c", "a", "d"]
+    cache.obtener("b", _calcular(calculados, "b"))
+    assert list(cache._datos) == ["a", "d", "b"]
+    assert calculados == ["a", "b", "c", "d", "b"]
+    assert cache.stats() == {"hits": 1, "misses": 5, "size": 3, "maxsize": 3}
+
+
+def test_contadores():
+    cache = CacheConsultas(maxsize=2)
+    calculados = []
+    for c in "aabab":
+        cache.obtener(c, _calcular(calculados, c))
+    assert (cache.hits, cache.misses, len(cache)) == (3, 2, 2)
+    assert calculados == ["a", "b"]
+    cache.clear()
+    assert cache.stats() == {"hits": 0, "misses": 0, "size": 0, "maxsize": 2}
+
+    # maxsize <= 0: nunca guarda, todo es un fallo
+    apagado = CacheConsultas(maxsize=0)
+    calculados = []
+    for c in "aa":
+        apagado.obtener(c, _calcular(calculados, c))
+    assert (apagado.hits, apagado.misses, len(apagado)) == (0, 2, 0)
+    assert calculados == ["a", "a"]
+
+
+def test_una_mutacion_del_grafo_no_reutiliza_resultados():
+    electrico = GrafoAdyacencia.from_edges([("A", "B"), ("C", "D")])
+    clave = _clave("COMPONENTES_CONEXOS", (), electrico)
+    assert _clave("COMPONENTES_CONEXOS", (), electrico) == clave
+    otro = GrafoAdyacencia.from_edges([("A", "B"), ("C", "D")])
+    assert _clave("COMPONENTES_CONEXOS", (), otro) != clave
+
+    procesador = ProcesadorConsultas(
+        electrico, GrafoAdyacencia.from_edges([("A", "B", 1.0)]), GrafoAdyacencia.from_edges([("A", "B")]))
+    cache = procesador.cache
+    antes = procesador.responder("COMPONENTES_CONEXOS")
+    assert procesador.responder("COMPONENTES_CONEXOS") == antes
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    electrico.add_edge("B", "C")
+    assert _clave("COMPONENTES_CONEXOS", (), electrico) != clave
+    despues = procesador.responder("COMPONENTES_CONEXOS")
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert despues != antes
+    assert procesador.responder("COMPONENTES_CONEXOS") == despues
+    assert (cache.hits, cache.misses) == (2, 2)
@@ -0,0 +1,107 @@
+"""DijkstraIdx, _camino_minimo y CAMINO_MINIMO_MULTI contra Dijkstra.compute."""
+
+import random
+
+import pytest
+
+from src.algoritmos import Dijkstra, DijkstraIdx
+from src.grafo import GrafoAdyacencia, GrafoCSR
+from src.main import ProcesadorConsultas, _camino_minimo, _caminos_desde, _parse_multi
+from src.output import format_camino_minimo
+
+INF = float("inf")
+
+
+def _referencia(g, origen, destino, cortes=()):
+    dist, parent = Dijkstra.compute(g, origen, destino, banned=set(cortes))
+    return dist.get(destino, INF), Dijkstra.path(parent, destino)
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_bidireccional_igual_a_dijkstra(grafos, semilla):
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(2, 40), rng.choice((0.05, 0.1, 0.3)))
+    csr = GrafoCSR.from_grafo(g)
+    for _ in range(20):
+        s, t = rng.choice(g.vs), rng.choice(g.vs)
+        cortes = rng.sample(g.vs, rng.randint(0, 3))
+        banned = [csr.name_to_idx[c] for c in cortes]
+        dist, parent = DijkstraIdx.bidireccional(csr, csr.name_to_idx[s], csr.name_to_idx[t], banned)
+        it = csr.name_to_idx[t]
+        esperado = _referencia(g, s, t, cortes)
+        assert (dist[it], [csr.vs[i] for i in DijkstraIdx.path(parent, it)]) == esperado
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_uno_a_muchos_igual_a_dijkstra(grafos, semilla):
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(2, 40), rng.choice((0.05, 0.1, 0.3)))
+    csr = GrafoCSR.from_grafo(g)
+    for _ in range(5):
+        s = rng.choice(g.vs)
+        destinos = rng.sample(g.vs, rng.randint(1, len(g.vs)))
+        cortes = rng.sample(g.vs, rng.randint(0, 3))
+        dist, parent = DijkstraIdx.uno_a_muchos(
+            csr, csr.name_to_idx[s], [csr.name_to_idx[d] for d in destinos], [csr.name_to_idx[c] for c in cortes]
+        )
+        for d in destinos:
+            it = csr.name_to_idx[d]
+            assert (dist[it], [csr.vs[i] for i in DijkstraIdx.path(parent, it)]) == _referencia(g, s, d, cortes)
+        assert _caminos_desde(csr, s, destinos, cortes) == {d: _referencia(g, s, d, cortes) for d in destinos}
+
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_camino_minimo_casos_borde(grafos, semilla):
+    rng = random.Random(semilla)
+    g = grafos(semilla, 25, 0.15)
+    csr = GrafoCSR.from_grafo(g)
+    s, t = rng.sample(g.vs, 2)
+    casos = [
+        (s, t, ()),
+        (s, t, (s,)),                 # el origen está entre los cortes
+        (s, t, (t,)),                 # el destino está entre los cortes
+        (s, s, ()),                   # origen == destino
+        (s, s, (s,)),
+        (s, "NOEXISTE", ()),          # barrio desconocido
+        ("NOEXISTE", t, ()),
+        ("NOEXISTE", "NOEXISTE", ()),
+        (s, t, ("NOEXISTE", t)),      # cortes desconocidos se ignoran
+    ]
+    for origen, destino, cortes in casos:
+        assert _camino_minimo(csr, origen, destino, cortes) == _referencia(g, origen, destino, cortes), (origen, destino, cortes)
+
+
+def test_parse_multi():
+    assert _parse_multi("CAMINO_MINIMO_MULTI A {B,C,D}".split()) == ("A", ["B", "C", "D"])
+    assert _parse_multi("CAMINO_MINIMO_MULTI A { B , C  D }".split()) == ("A", ["B", "C", "D"])
+    assert _parse_multi("CAMINO_MINIMO_MULTI A {B}".split()) == ("A", ["B"])
+    assert _parse_multi("CAMINO_MINIMO_MULTI A {}".split()) == ("A", [])
+    assert _parse_multi("CAMINO_MINIMO_MULTI A".split()) == ("A", [])
+    assert _parse_multi("CAMINO_MINIMO_MULTI".split()) == ("?", [])
+
+
+@pytest.mark.parametrize("semilla", range(15))
+def test_multi_igual_a_caminos_minimos_sueltos(grafos, semilla):
+    """CAMINO_MINIMO_MULTI (resuelto en lote por preparar) responde lo mismo que un CAMINO_MINIMO por destino."""
+    rng = random.Random(semilla)
+    vial = grafos(semilla, rng.randint(2, 40), rng.choice((0.05, 0.1, 0.3)))
+    otro = GrafoAdyacencia.from_edges([("A", "B")])
+    s = rng.choice(vial.vs)
+    # repetidos, el propio origen y un barrio inexistente
+    destinos = rng.sample(vial.vs, rng.randint(1, len(vial.vs))) + [s, "NOEXISTE", vial.vs[0]]
+    rng.shuffle(destinos)
+    linea = f"CAMINO_MINIMO_MULTI {s} {{{', '.join(destinos)}}}"
+    respuestas = [r for r in ProcesadorConsultas(otro, vial, otro).respuestas([linea]) if r is not None]
+
+    sueltos = ProcesadorConsultas(otro, vial, otro)
+    esperado = [sueltos.responder(f"CAMINO_MINIMO {s} {d}")[0] for d in destinos]
+    assert respuestas == esperado
+    assert esperado == [format_camino_minimo(s, d, *_referencia(vial, s, d)) for d in destinos]
+
+
+def test_multi_incompleto():
+    vial = GrafoAdyacencia.from_edges([("A", "B", 1.0)])
+    procesador = ProcesadorConsultas(vial, vial, vial)
+    sin_camino = format_camino_minimo("?", "?", INF, [])
+    assert procesador.responder("CAMINO_MINIMO_MULTI") == [sin_camino]
+    assert procesador.responder("CAMINO_MINIMO_MULTI A {}") == [format_camino_minimo("A", "?", INF, [])]
@@ -0,0 +1,71 @@
+"""ContractionHierarchies contra Dijkstra: distancias, verificación y reporte."""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from src.algoritmos import ContractionHierarchies, Dijkstra
+from src.benchmark import correr
+from src.grafo import GrafoCSR
+from src.main import _camino_minimo
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+INF = float("inf")
+
+
+def _referencia(g, origen, destino, cortes=()):
+    dist, parent = Dijkstra.compute(g, origen, destino, banned=set(cortes))
+    return dist.get(destino, INF), Dijkstra.path(parent, destino)
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_ch_igual_a_dijkstra(grafos, semilla):
+    """Misma distancia, con cortes y muchos empates; ante empates el camino puede ser otro igual de corto."""
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(2, 40), rng.choice((0.05, 0.1, 0.3)), pesos=rng.choice(((1.0, 2.0), None)))
+    csr = GrafoCSR.from_grafo(g)
+    ch = ContractionHierarchies(csr)
+    for _ in range(30):
+        s, t = rng.choice(g.vs), rng.choice(g.vs)
+        cortes = rng.sample(g.vs, rng.randint(0, 2)) if rng.random() < 0.3 else []
+        esperado = _referencia(g, s, t, cortes)
+        d, camino = ch.camino(csr.name_to_idx[s], csr.name_to_idx[t], [csr.name_to_idx[c] for c in cortes])
+        assert d == esperado[0]
+        assert bool(camino) == bool(esperado[1])
+        if camino:
+            nombres = [csr.vs[i] for i in camino]
+            assert (nombres[0], nombres[-1]) == (s, t) and not set(nombres) & set(cortes)
+            assert sum(g.get_weight(a, b) for a, b in zip(nombres, nombres[1:])) == d
+        assert _camino_minimo(csr, s, t, cortes, motor=ch)[0] == esperado[0]
+
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_verificar_sin_discrepancias(grafos, semilla):
+    rng = random.Random(semilla)
+    csr = GrafoCSR.from_grafo(grafos(semilla, rng.randint(2, 60), rng.choice((0.05, 0.1, 0.3))))
+    ch = ContractionHierarchies(csr, limite_testigo=rng.choice((4, 64)))
+    n = csr.vertex_count
+    pares = [(rng.randrange(n), rng.randrange(n)) for _ in range(40)]
+    assert ch.verificar(pares) == []
+    reporte = ch.reporte()
+    assert reporte["consultas"] == len(pares) and reporte["atajos"] == ch.atajos
+    assert reporte["consulta_seg_promedio"] >= 0.0
+
+
+def test_reporte_en_stderr_y_en_el_benchmark():
+    datos = os.path.join(RAIZ, "resources", "ejemplo-48")
+    archivos = [os.path.join(datos, f"grafo_{n}_48.txt") for n in ("electrico", "vial", "hidrico")]
+    res = subprocess.run(
+        [sys.executable, os.path.join(RAIZ, "run.py"), *archivos, os.path.join(datos, "consultas.txt"), "-",
+         "--no-draw", "--motor", "ch"],
+        capture_output=True, text=True, check=True,
+    )
+    assert "CH: preprocessing" in res.stderr and "shortcuts" in res.stderr
+    assert "CH:" not in res.stdout
+
+    caso = correr(["grilla"], [200], ch=True)["casos"][0]
+    assert caso["ch"]["discrepancias"] == 0
+    assert caso["ch"]["consultas"] > 0 and caso["ch"]["verificados"] > 0
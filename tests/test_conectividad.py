@@ -0,0 +1,61 @@
+"""IndiceConectividad contra ComponentesConexos.compute recalculado desde cero."""
+
+import random
+
+import pytest
+
+from src.algoritmos import ComponentesConexos, IndiceConectividad
+
+
+def _verificar(indice, g, rng):
+    esperado = ComponentesConexos.compute(g)
+    assert indice.componentes() == esperado
+    assert indice.cantidad() == len(esperado)
+    comp = {v: i for i, c in enumerate(esperado) for v in c}
+    for _ in range(5):
+        a, b = rng.choice(g.vs + ["NOEXISTE"]), rng.choice(g.vs + ["NOEXISTE"])
+        assert indice.mismo_componente(a, b) == (a in comp and b in comp and comp[a] == comp[b])
+    for v in rng.sample(g.vs, min(3, len(g.vs))):
+        assert indice.componente(v) == esperado[comp[v]]
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_altas_igual_a_componentes_conexos(grafos, semilla):
+    """Sólo altas (líneas nuevas que se cargan): Union-Find con miembros."""
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(1, 30), rng.choice((0.0, 0.03, 0.1)), pesos=None)
+    indice = IndiceConectividad.de(g)
+    assert IndiceConectividad.de(g) is indice
+    for nuevo in range(40):
+        if rng.random() < 0.2:
+            g.add_vertex(f"N{nuevo:03d}")
+        elif len(g.vs) >= 2:
+            g.add_edge(*rng.sample(g.vs, 2))
+        _verificar(indice, g, rng)
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_altas_y_bajas_igual_a_componentes_conexos(grafos, semilla):
+    """Altas, bajas (OUTAGE), vértices nuevos y borrados, y lazos."""
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(1, 30), rng.choice((0.05, 0.1, 0.2)), pesos=None)
+    indice = IndiceConectividad.de(g)
+    nuevos = 0
+    for _ in range(60):
+        op = rng.random()
+        vs = g.vertices()
+        if op < 0.45 and g.edges():
+            u, v, _ = rng.choice(g.edges())
+            g.delete_edge(u, v)
+        elif op < 0.55 and vs:
+            g.delete_vertex(rng.choice(vs))
+        elif op < 0.65:
+            nuevos += 1
+            g.add_vertex(f"N{nuevos:03d}")
+        elif op < 0.7 and vs:
+            v = rng.choice(vs)
+            g.add_edge(v, v)            # lazo: no conecta nada, pero es vecino de sí mismo
+        elif len(vs) >= 2:
+            u, v = rng.sample(vs, 2)
+            g.add_edge(u, v)
+        _verificar(indice, g, rng)
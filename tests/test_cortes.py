@@ -0,0 +1,35 @@
+"""SimuladorCortes contra Dijkstra.compute con los mismos cortes."""
+
+import random
+
+import pytest
+
+from src.algoritmos import Dijkstra, SimuladorCortes
+from src.grafo import GrafoCSR
+from src.main import _camino_minimo
+
+INF = float("inf")
+
+
+def _referencia(g, origen, destino, cortes=()):
+    dist, parent = Dijkstra.compute(g, origen, destino, banned=set(cortes))
+    return dist.get(destino, INF), Dijkstra.path(parent, destino)
+
+
+@pytest.mark.parametrize("semilla", range(20))
+def test_simulador_igual_a_dijkstra(grafos, semilla):
+    """Mismo camino que Dijkstra, con cortes y muchos empates (desempate por nombre)."""
+    rng = random.Random(semilla)
+    g = grafos(semilla, rng.randint(2, 40), rng.choice((0.05, 0.1, 0.3)), pesos=rng.choice(((1.0, 2.0), None)))
+    csr = GrafoCSR.from_grafo(g)
+    simulador = SimuladorCortes(csr, max_origenes=4)
+    for _ in range(30):
+        s, t = rng.choice(g.vs), rng.choice(g.vs)
+        # cortes cerca del camino base, así el simulador tiene que reparar
+        _, base = _referencia(g, s, t)
+        cortes = rng.sample(base[1:-1], min(max(len(base) - 2, 0), rng.randint(0, 2))) + rng.sample(g.vs, rng.randint(0, 2))
+        esperado = _referencia(g, s, t, cortes)
+        d, camino = simulador.camino(csr.name_to_idx[s], csr.name_to_idx[t], [csr.name_to_idx[c] for c in cortes])
+        assert (d, [csr.vs[i] for i in camino]) == esperado, (s, t, cortes)
+        assert _camino_minimo(csr, s, t, cortes, motor=simulador) == esperado
+    assert len(simulador._arboles) <= 4
@@ -0,0 +1,94 @@
+"""TarjanCriticosIdx (pila explícita) contra el Tarjan recursivo original."""
+
+import random
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+import pytest
+
+from src.algoritmos import TarjanCriticos, TarjanCriticosIdx
+from src.grafo import GrafoCSR
+
+
+def _tarjan_recursivo(g) -> Tuple[List[str], List[Tuple[str, str]]]:
+    """La versión recursiva original (TarjanCriticos.compute antes de pasar a índices)."""
+    time = 0
+    disc: Dict[str, int] = {}
+    low: Dict[str, int] = {}
+    parent: Dict[str, Optional[str]] = {}
+    arts: Set[str] = set()
+    edges: Set[Tuple[str, str]] = set()
+
+    def dfs(u: str):
+        nonlocal time
+        time += 1
+        disc[u] = low[u] = time
+        children = 0
+        for v in g.get_adjacency_list(u):
+            if v not in disc:
+                parent[v] = u
+                children += 1
+                dfs(v)
+                low[u] = min(low[u], low[v])
+                # Articulación
+                if parent.get(u) is None and children > 1:
+                    arts.add(u)
+                if parent.get(u) is not None and low[v] >= disc[u]:
+                    arts.add(u)
+                # Puente
+                if low[v] > disc[u]:
+                    a, b = (u, v) if u < v else (v, u)
+                    edges.add((a, b))
+            elif v != parent.get(u):
+                low[u] = min(low[u], disc[v])
+
+    for s in getattr(g, "vertices", lambda: [])():
+        if s not in disc:
+            parent[s] = None
+            dfs(s)
+
+    return sorted(arts), sorted(edges)
+
+
+@pytest.fixture
+def recursion_alta():
+    limite = sys.getrecursionlimit()
+    sys.setrecursionlimit(10_000)
+    yield
+    sys.setrecursionlimit(limite)
+
+
+def _en_nombres(g, resultado):
+    arts, puentes = resultado
+    vs = g.vs
+    return sorted(vs[u] for u in arts), sorted(tuple(sorted((vs[u], vs[v]))) for u, v in puentes)
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_igual_al_recursivo(grafos, recursion_alta, semilla):
+    rng = random.Random(semilla)
+    n = rng.randint(1, 120)
+    # de muy ralo (bosques, muchos puentes) a denso (casi sin articulaciones)
+    g = GrafoCSR.from_grafo(grafos(semilla, n, rng.choice((0.5 / n, 1.5 / n, 3.0 / n, 0.2))))
+    esperado = _tarjan_recursivo(g)
+    assert _en_nombres(g, TarjanCriticosIdx.compute(g)) == esperado
+    assert TarjanCriticos.compute(g) == esperado
+
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_arboles_profundos_igual_al_recursivo(recursion_alta, semilla):
+    # árboles aleatorios colgados de un camino largo, con algunos ciclos que cierran
+    rng = random.Random(semilla)
+    n = 3000
+    aristas = [(f"B{i:04d}", f"B{i - 1 if rng.random() < 0.9 else rng.randrange(i):04d}") for i in range(1, n)]
+    aristas += [(f"B{rng.randrange(n):04d}", f"B{rng.randrange(n):04d}") for _ in range(20)]
+    g = GrafoCSR.from_edges([(a, b) for a, b in aristas if a != b])
+    assert _en_nombres(g, TarjanCriticosIdx.compute(g)) == _tarjan_recursivo(g)
+
+
+def test_cadena_mas_larga_que_el_limite_de_recursion():
+    n = 3 * sys.getrecursionlimit()
+    g = GrafoCSR.from_edges([(f"B{i:06d}", f"B{i + 1:06d}") for i in range(n - 1)])
+    arts, puentes = TarjanCriticos.compute(g)
+    assert arts == [f"B{i:06d}" for i in range(1, n - 1)]
+    assert puentes == [(f"B{i:06d}", f"B{i + 1:06d}") for i in range(n - 1)]
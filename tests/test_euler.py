@@ -0,0 +1,65 @@
+"""Hierholzer.desde_aristas sobre multigrafos: calles paralelas, lazos y grafos sin recorrido."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from src.algoritmos import Hierholzer
+
+
+def _usa_cada_arista_una_vez(ruta, aristas):
+    """La ruta camina por aristas existentes y usa cada una (con sus repeticiones) exactamente una vez."""
+    pasos = Counter(frozenset(par) for par in zip(ruta, ruta[1:]))
+    return len(ruta) == len(aristas) + 1 and pasos == Counter(frozenset(e[:2]) for e in aristas)
+
+
+def test_calles_paralelas():
+    aristas = [("A", "B"), ("A", "B"), ("B", "C"), ("C", "A"), ("A", "B", 2.5)]
+    ruta = Hierholzer.desde_aristas(aristas)
+    assert _usa_cada_arista_una_vez(ruta, aristas)
+    # grados A 4, B 4, C 2: circuito desde el menor; con otra A-C quedan A y C impares
+    assert ruta[0] == ruta[-1] == "A"
+    ruta = Hierholzer.desde_aristas(aristas + [("A", "C")])
+    assert _usa_cada_arista_una_vez(ruta, aristas + [("A", "C")])
+    assert {ruta[0], ruta[-1]} == {"A", "C"} and ruta[0] == "A"
+
+
+def test_lazos():
+    aristas = [("B", "B"), ("A", "B"), ("B", "C"), ("C", "C"), ("C", "C")]
+    ruta = Hierholzer.desde_aristas(aristas)
+    assert _usa_cada_arista_una_vez(ruta, aristas)
+    assert (ruta[0], ruta[-1]) == ("A", "C")
+    # sólo lazos: circuito sobre el único vértice
+    assert Hierholzer.desde_aristas([("Z", "Z"), ("Z", "Z")]) == ["Z", "Z", "Z"]
+
+
+def test_sin_recorrido_euleriano():
+    # cuatro vértices de grado impar
+    assert Hierholzer.desde_aristas([("A", "B"), ("C", "D")]) == []
+    assert Hierholzer.desde_aristas([("A", "B"), ("A", "C"), ("A", "D")]) == []
+    # conexo y con calles paralelas: A 5, B 3, C 1, D 1
+    assert Hierholzer.desde_aristas([("A", "B"), ("A", "B"), ("A", "B"), ("A", "C"), ("D", "A")]) == []
+    assert Hierholzer.desde_aristas([]) == []
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_multigrafos_aleatorios(semilla):
+    # un paseo al azar (con repeticiones y lazos) es siempre un recorrido euleriano de sus aristas
+    rng = random.Random(semilla)
+    nombres = [f"B{i:02d}" for i in range(rng.randint(1, 8))]
+    paseo = [rng.choice(nombres)]
+    for _ in range(rng.randint(1, 40)):
+        paseo.append(rng.choice(nombres))
+    aristas = [(a, b) if rng.random() < 0.5 else (b, a) for a, b in zip(paseo, paseo[1:])]
+    rng.shuffle(aristas)
+    ruta = Hierholzer.desde_aristas(aristas)
+    assert _usa_cada_arista_una_vez(ruta, aristas)
+    grado = Counter()
+    for a, b in aristas:
+        if a != b:
+            grado[a] += 1
+            grado[b] += 1
+    impares = sorted(v for v in grado if grado[v] % 2)
+    # arranca en el impar de nombre menor (o, si no hay, en el menor vértice con aristas)
+    assert ruta[0] == (impares[0] if impares else min(v for e in aristas for v in e))
@@ -0,0 +1,55 @@
+"""Traza de process_queries y contadores de los kernels."""
+
+import json
+import os
+
+from src.algoritmos import DijkstraIdx, contadores
+from src.grafo import GrafoCSR
+from src.main import load_graph, load_weighted_graph, process_queries
+
+DIR = os.path.join(os.path.dirname(__file__), "..", "resources", "ejemplo-48")
+
+
+def test_contadores_por_consulta(tmp_path):
+    traza = tmp_path / "traza.jsonl"
+    salida = tmp_path / "respuestas.txt"
+    hidrico = load_graph(os.path.join(DIR, "grafo_hidrico_48.txt"))
+    process_queries(
+        os.path.join(DIR, "consultas.txt"), str(salida),
+        load_graph(os.path.join(DIR, "grafo_electrico_48.txt")),
+        load_weighted_graph(os.path.join(DIR, "grafo_vial_48.txt")),
+        hidrico,
+        traza=str(traza),
+    )
+    assert not contadores.ACTIVO
+    registros = [json.loads(l) for l in traza.read_text(encoding="utf-8").splitlines()]
+    resumen = registros[-1]["consultas"]
+    for op in ("COMPONENTES_CONEXOS", "PUENTES_Y_ARTICULACIONES", "PLANTAS_ASIGNADAS",
+               "CAMINO_RECOLECCION_BASURA", "CAMINO_MINIMO"):
+        assert resumen[op]["aristas_relajadas"] >= resumen[op]["vertices_visitados"] > 0, op
+    camino = resumen["CAMINO_MINIMO"]
+    assert camino["heap_push"] >= camino["heap_pop"] > 0
+    # Tarjan recorre todo el grafo hídrico una vez (después responde el cache)
+    puentes = [r for r in registros if r.get("op") == "PUENTES_Y_ARTICULACIONES"]
+    assert (puentes[0]["vertices_visitados"], puentes[0]["aristas_relajadas"]) == (
+        len(hidrico.vs), 2 * hidrico.edge_count)
+    for r in registros[:-1]:
+        assert r["parse_s"] + r["formato_s"] <= r["total_s"] + 1e-9
+
+
+def test_dijkstra_cuenta_relajaciones(grafos):
+    g = GrafoCSR.from_grafo(grafos(4, 40, 0.1))
+    contadores.activar()
+    try:
+        dist, _ = DijkstraIdx.compute(g, 0)
+        valores = contadores.leer()
+    finally:
+        contadores.activar(False)
+    alcanzados = [u for u in range(g.vertex_count) if dist[u] != float("inf")]
+    assert valores["vertices_visitados"] == len(alcanzados)
+    assert valores["aristas_relajadas"] == sum(g.degree(u) for u in alcanzados)
+    # búsqueda completa: el heap queda vacío
+    assert valores["heap_push"] == valores["heap_pop"] >= len(alcanzados)
+    # apagados no suman
+    DijkstraIdx.compute(g, 0)
+    assert contadores.leer() == valores
@@ -0,0 +1,50 @@
+"""MatrizDistancias: Floyd–Warshall (NumPy) y Dijkstra por origen dan la misma matriz."""
+
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from src.algoritmos import DijkstraIdx, MatrizDistancias
+from src.grafo import GrafoCSR
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+
+
+def _matriz(g, metodo):
+    return [(s, list(fila)) for s, fila in MatrizDistancias.filas(g, metodo, procesos=1)]
+
+
+def _esperada(g):
+    _, por_rank = g.rangos()
+    return [(s, list(DijkstraIdx.compute(g, s)[0])) for s in por_rank]
+
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_floyd_igual_a_dijkstra(grafos, semilla):
+    pytest.importorskip("numpy")
+    rng = random.Random(semilla)
+    g = GrafoCSR.from_grafo(grafos(semilla, rng.randint(1, 30), rng.choice((0.05, 0.2))))
+    assert _matriz(g, "floyd") == _matriz(g, "dijkstra") == _esperada(g)
+
+
+def test_floyd_sin_numpy_usa_dijkstra(grafos, monkeypatch):
+    monkeypatch.setitem(sys.modules, "numpy", None)     # import numpy -> ImportError
+    g = GrafoCSR.from_grafo(grafos(0, 25, 0.15))
+    assert MatrizDistancias.metodo(g) == "dijkstra"
+    assert _matriz(g, "floyd") == _esperada(g)
+
+
+def test_grafo_grande_y_ralo_no_importa_numpy():
+    # en otro proceso: en este numpy ya puede estar cargado por otras pruebas
+    codigo = (
+        "import sys\n"
+        "from src.algoritmos import MatrizDistancias\n"
+        "from src.grafo import GrafoCSR\n"
+        "g = GrafoCSR.from_edges([(f'B{i}', f'B{i + 1}', 1.0) for i in range(5000)])\n"
+        "print(MatrizDistancias.metodo(g), 'numpy' in sys.modules)\n"
+    )
+    res = subprocess.run([sys.executable, "-c", codigo], cwd=RAIZ, capture_output=True, text=True, check=True)
+    assert res.stdout.split() == ["dijkstra", "False"]
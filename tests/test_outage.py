@@ -0,0 +1,30 @@
+"""OUTAGE: informa sólo las bajas que existían y mantiene la conectividad al día."""
+
+from src.algoritmos import ComponentesConexos
+from src.grafo import GrafoAdyacencia
+from src.main import ProcesadorConsultas
+
+
+def _procesador(electrico):
+    vial = GrafoAdyacencia.from_edges([("A", "B", 1.0)])
+    return ProcesadorConsultas(electrico, vial, GrafoAdyacencia.from_edges([("A", "B")]))
+
+
+def test_outage_marca_las_bajas_inexistentes():
+    electrico = GrafoAdyacencia.from_edges([("A", "B"), ("B", "C"), ("C", "D"), ("D", "A")])
+    procesador = _procesador(electrico)
+    # A:C no existe, B:A aparece dos veces (la segunda ya no existe), X no es un barrio
+    respuesta = procesador.responder("OUTAGE A:B A:C B:A C X")[0]
+    assert "Líneas fuera de servicio: A-B\n" in respuesta
+    assert "Subestaciones fuera de servicio: C\n" in respuesta
+    assert "Inexistentes (ignoradas): A-C, B-A, X\n" in respuesta
+    assert sorted(electrico.vertices()) == ["A", "B", "D"]
+    assert "Islas resultantes: 2\n" in respuesta
+    assert len(ComponentesConexos.compute(electrico)) == 2
+
+
+def test_outage_sin_inexistentes_no_agrega_la_linea():
+    electrico = GrafoAdyacencia.from_edges([("A", "B"), ("B", "C")])
+    respuesta = _procesador(electrico).responder("OUTAGE B:C")[0]
+    assert "Líneas fuera de servicio: B-C\n" in respuesta
+    assert "Inexistentes" not in respuesta
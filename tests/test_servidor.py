@@ -0,0 +1,134 @@
+"""Servidor de consultas por socket Unix: clientes concurrentes, tiempo agotado y RELOAD."""
+
+import asyncio
+import os
+import time
+
+import pytest
+
+import src.servidor as servidor
+from src.main import load_graph, load_weighted_graph, process_queries
+
+pytestmark = pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="sin sockets Unix")
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..", "resources")
+EJEMPLO_48 = [os.path.join(RAIZ, "ejemplo-48", f) for f in ("grafo_electrico_48.txt", "grafo_vial_48.txt", "grafo_hidrico_48.txt")]
+EJEMPLO = [os.path.join(RAIZ, "ejemplo", f) for f in ("ejemplo_electrico.txt", "ejemplo_vial.txt", "ejemplo_hidrico.txt")]
+
+
+def _consultas(directorio: str, nombre: str):
+    with open(os.path.join(RAIZ, directorio, nombre), encoding="utf-8") as f:
+        return [l.strip() for l in f if l.strip() and not l.startswith("#")]
+
+
+def _esperado(archivos, consultas, tmp_path) -> str:
+    entrada, salida = tmp_path / "consultas.txt", tmp_path / "respuestas.txt"
+    entrada.write_text("\n".join(consultas) + "\n", encoding="utf-8")
+    electrico, vial, hidrico = archivos
+    process_queries(str(entrada), str(salida), load_graph(electrico), load_weighted_graph(vial), load_graph(hidrico))
+    return salida.read_text(encoding="utf-8")
+
+
+async def _cliente(path, consultas):
+    reader, writer = await asyncio.open_unix_connection(path)
+    respuestas = []
+    for q in consultas:
+        writer.write((q + "\n").encode("utf-8"))
+        await writer.drain()
+        lineas = []
+        while True:
+            linea = (await reader.readline()).decode("utf-8")
+            if linea.rstrip("\n") == servidor.FIN:
+                break
+            lineas.append(linea)
+        respuestas.append("".join(lineas)[:-1])
+    writer.write(b"QUIT\n")
+    await writer.drain()
+    writer.close()
+    return respuestas
+
+
+def _con_servidor(srv, path, escenario):
+    """Corre escenario() con el servidor escuchando en 'path' y lo cierra al terminar."""
+    async def correr():
+        server = await asyncio.start_unix_server(srv.atender, path=str(path))
+        try:
+            return await escenario()
+        finally:
+            server.close()
+            await server.wait_closed()
+    return asyncio.run(correr())
+
+
+def test_clientes_concurrentes(tmp_path):
+    consultas = _consultas("ejemplo-48", "consultas.txt")
+    srv = servidor.ServidorConsultas(EJEMPLO_48)
+    path = tmp_path / "srv.sock"
+    resultados = _con_servidor(srv, path, lambda: asyncio.gather(*[_cliente(str(path), consultas) for _ in range(4)]))
+    esperado = _esperado(EJEMPLO_48, consultas, tmp_path)
+    for respuestas in resultados:
+        assert "\n".join(respuestas) == esperado
+    assert srv.atendidas == 4 * len(consultas)
+
+
+def test_tiempo_agotado_no_ejecuta_las_encoladas(tmp_path, monkeypatch):
+    original = servidor._responder
+    ejecutadas = []
+
+    def lento(procesador, line, vence=None):
+        respuesta = original(procesador, line, vence)
+        ejecutadas.append(line)
+        time.sleep(0.3)
+        return respuesta
+
+    monkeypatch.setattr(servidor, "_responder", lento)
+    srv = servidor.ServidorConsultas(EJEMPLO_48, timeout=0.1)
+    path = tmp_path / "srv.sock"
+    consultas = [f"MISMA_RED {a} {b}" for a, b in (("A", "B"), ("A", "C"), ("B", "C"))]
+
+    async def escenario():
+        vencidas = await asyncio.gather(*[_cliente(str(path), [q]) for q in consultas])
+        await asyncio.sleep(0.4)        # la primera termina en segundo plano
+        srv.timeout = 30.0
+        return vencidas, await _cliente(str(path), ["PING", consultas[0]])
+
+    vencidas, despues = _con_servidor(srv, path, escenario)
+    assert [r[0] for r in vencidas] == [f"# ERROR: tiempo agotado (0.1 s): {q}" for q in consultas]
+    # sólo llegó a calcularse la que ya tenía el hilo; las encoladas se descartaron
+    assert len(ejecutadas) == 2 and ejecutadas[1] == consultas[0]
+    assert despues[0] == "# PONG" and not despues[1].startswith("# ERROR")
+
+
+@pytest.mark.parametrize("motor", [None, "alt", "ch"])
+def test_reload(tmp_path, motor):
+    consultas = _consultas("ejemplo", "ejemplo_consultas.txt")
+    tablas = str(tmp_path / "vial.alt") if motor == "alt" else None
+    srv = servidor.ServidorConsultas(EJEMPLO_48, motor=motor, landmarks=tablas)
+    path = tmp_path / "srv.sock"
+    antes = srv.procesador
+    respuestas = _con_servidor(
+        srv, path, lambda: _cliente(str(path), ["RELOAD a b", "RELOAD " + " ".join(EJEMPLO)] + consultas)
+    )
+    assert respuestas[0] == "# ERROR: uso RELOAD [electrico vial hidrico]"
+    assert respuestas[1] == "# RECARGADO: " + ", ".join(EJEMPLO)
+    assert srv.procesador is not antes and srv.archivos == tuple(EJEMPLO)
+    if motor is not None:
+        # el motor se volvió a preparar sobre el grafo vial nuevo
+        assert srv.procesador.motor.g is srv.procesador.road_csr
+    assert "\n".join(respuestas[2:]) == _esperado(EJEMPLO, consultas, tmp_path)
+
+
+def test_sin_pools_dentro_del_servidor(monkeypatch):
+    """Las consultas corren en un hilo: MATRIZ_DISTANCIAS y BARRIDO_CORTES no deben hacer fork."""
+    import multiprocessing
+
+    def prohibido(*args, **kwargs):
+        raise AssertionError("fork desde el hilo de consultas")
+
+    monkeypatch.setattr(os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(multiprocessing, "get_context", prohibido)
+    srv = servidor.ServidorConsultas(EJEMPLO_48)
+    barrios = srv.procesador.road_csr.vs
+    escenarios = " ".join("{" + b + "}" for b in barrios[:10])
+    respuesta = servidor._responder(srv.procesador, f"BARRIDO_CORTES {escenarios} {barrios[0]}:{barrios[-1]}")
+    assert not respuesta.startswith("#")
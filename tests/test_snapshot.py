@@ -0,0 +1,34 @@
+"""Snapshots: el escritor de línea de comandos y los grafos de sólo lectura."""
+
+import os
+
+from src.grafo import GrafoCSR, es_snapshot
+from src.grafo.snapshot import main as escribir_snapshot
+from src.main import ProcesadorConsultas, load_graph, load_weighted_graph
+
+DIR = os.path.join(os.path.dirname(__file__), "..", "resources", "ejemplo-48")
+ELECTRICO = os.path.join(DIR, "grafo_electrico_48.txt")
+VIAL = os.path.join(DIR, "grafo_vial_48.txt")
+
+
+def test_cli_escribe_el_mismo_grafo(tmp_path):
+    for origen, ponderado, cargar in ((ELECTRICO, False, load_graph), (VIAL, True, load_weighted_graph)):
+        salida = str(tmp_path / "g.grafo")
+        escribir_snapshot([origen, salida] + (["--ponderado"] if ponderado else []))
+        assert es_snapshot(salida)
+        g, texto = cargar(salida), cargar(origen)
+        assert isinstance(g, GrafoCSR)
+        assert sorted(g.edges()) == sorted(texto.edges())
+
+
+def test_outage_sobre_snapshot_es_de_solo_lectura(tmp_path):
+    salida = str(tmp_path / "e.grafo")
+    escribir_snapshot([ELECTRICO, salida])
+    electrico = load_graph(salida)
+    procesador = ProcesadorConsultas(electrico, load_weighted_graph(VIAL), load_graph(ELECTRICO))
+    a, b = electrico.vs[0], electrico.get_adjacency_list(electrico.vs[0])[0]
+    antes = procesador.responder("COMPONENTES_CONEXOS ELECTRICA")
+    respuesta = procesador.responder(f"OUTAGE {a}:{b}")
+    assert respuesta[0].startswith("# OUTAGE no soportado: el grafo eléctrico es de sólo lectura")
+    assert electrico.exists_edge(a, b)
+    assert procesador.responder("COMPONENTES_CONEXOS ELECTRICA") == antes
@@ -0,0 +1,52 @@
+"""AsignacionPlantas (altas y bajas de plantas) contra recalcular desde cero con BFSMultiorigen."""
+
+import random
+
+import pytest
+
+from src.algoritmos import AsignacionPlantas, BFSMultiorigen
+from src.grafo import GrafoCSR
+from src.main import _asignar_plantas
+
+
+def _desde_cero(g, plantas):
+    """(dist, dueño) de un BFSMultiorigen nuevo con las plantas ordenadas por nombre."""
+    rank, _ = g.rangos()
+    fuentes = sorted(plantas, key=lambda p: rank[p])
+    dist, pos = BFSMultiorigen.compute(g, fuentes)
+    return list(dist), [fuentes[r] if r != -1 else -1 for r in pos]
+
+
+@pytest.mark.parametrize("semilla", range(30))
+def test_plantas_igual_a_bfs_multiorigen(grafos, semilla):
+    rng = random.Random(semilla)
+    g = GrafoCSR.from_grafo(grafos(semilla, rng.randint(1, 40), rng.choice((0.03, 0.08, 0.2)), pesos=None))
+    n = g.vertex_count
+    asignacion = AsignacionPlantas(g, rng.sample(range(n), rng.randint(0, min(n, 3))))
+    for _ in range(40):
+        p = rng.randrange(n)
+        if p in asignacion.plantas:
+            asignacion.quitar(p)
+        else:
+            asignacion.agregar(p)
+        assert (list(asignacion.dist), list(asignacion.dueno)) == _desde_cero(g, asignacion.plantas)
+    asignacion.fijar(rng.sample(range(n), rng.randint(0, n)))
+    assert (list(asignacion.dist), list(asignacion.dueno)) == _desde_cero(g, asignacion.plantas)
+
+
+@pytest.mark.parametrize("semilla", range(10))
+def test_asignar_plantas_por_nombre(grafos, semilla):
+    """Secuencia de PLANTAS_ASIGNADAS que difieren en una planta, con nombres desconocidos."""
+    rng = random.Random(semilla)
+    g = GrafoCSR.from_grafo(grafos(semilla, rng.randint(2, 40), 0.08, pesos=None))
+    motor = AsignacionPlantas(g)
+    plantas = []
+    for _ in range(20):
+        if plantas and rng.random() < 0.4:
+            plantas.remove(rng.choice(plantas))
+        else:
+            plantas.append(rng.choice(g.vs + ["NOEXISTE"]))
+        asign = _asignar_plantas(motor, plantas)
+        _, dueno = _desde_cero(g, {g.name_to_idx[p] for p in plantas if p in g.name_to_idx})
+        assert asign == {v: (g.vs[dueno[i]] if dueno[i] != -1 else None) for i, v in enumerate(g.vs)}
+
@@ -0,0 +1,49 @@
+"""process_queries con --workers: misma salida que en un solo proceso, con OUTAGE como barrera."""
+
+import os
+
+import pytest
+
+from src.main import load_graph, load_weighted_graph, process_queries
+
+DIR = os.path.join(os.path.dirname(__file__), "..", "resources", "ejemplo-48")
+
+
+def _grafos():
+    return (
+        load_graph(os.path.join(DIR, "grafo_electrico_48.txt")),
+        load_weighted_graph(os.path.join(DIR, "grafo_vial_48.txt")),
+        load_graph(os.path.join(DIR, "grafo_hidrico_48.txt")),
+    )
+
+
+def _consultas():
+    electrico, vial, _ = _grafos()
+    with open(os.path.join(DIR, "consultas.txt"), encoding="utf-8") as f:
+        base = [l.strip() for l in f if l.strip() and not l.startswith("#")]
+    a, b, c = sorted(electrico.vertices())[:3]
+    u, v = next((u, v) for u in sorted(electrico.vertices()) for v in electrico.get_adjacency_list(u))
+    r = sorted(vial.vertices())
+    despues = [
+        "COMPONENTES_CONEXOS ELECTRICA", f"MISMA_RED {a} {b}", f"MISMA_RED {u} {v}", f"MISMA_RED {b} {c}",
+        f"CAMINO_MINIMO_MULTI {r[0]} {{{r[1]}, {r[2]}, {r[-1]}}}",
+        f"BARRIDO_CORTES {{{r[1]}}} {{}} {r[0]}:{r[-1]} {r[2]}:{r[3]}",
+    ]
+    # las consultas posteriores a cada OUTAGE tienen que ver el grafo ya modificado
+    return base + despues + [f"OUTAGE {u}:{v} {a}"] + despues + base + [f"OUTAGE {b}"] + despues + ["MATRIZ_DISTANCIAS"]
+
+
+@pytest.mark.parametrize("ventana", [3, 256])
+def test_dos_workers_igual_a_uno(tmp_path, ventana):
+    consultas = tmp_path / "consultas.txt"
+    consultas.write_text("\n".join(_consultas()) + "\n", encoding="utf-8")
+    salidas = {}
+    for workers in (1, 2):
+        salida = tmp_path / f"respuestas_{workers}.txt"
+        process_queries(str(consultas), str(salida), *_grafos(), ventana=ventana, workers=workers)
+        salidas[workers] = salida.read_text(encoding="utf-8")
+    assert salidas[2] == salidas[1]
+
+    # los OUTAGE cambiaron las respuestas eléctricas que los siguen: tres estados del grafo
+    componentes = [r for r in salidas[1].split("\n\n") if "COMPONENTES" in r.split("\n", 3)[1]]
+    assert len(componentes) == 5 and len(set(componentes)) == 3